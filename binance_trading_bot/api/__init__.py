@@ -4,13 +4,13 @@ API module for Binance integration.
 
 from .client import BinanceAPIClient
 from .websocket import BinanceWebSocketClient
-from .exceptions import APIError, ConnectionError, InsufficientFundsError, InvalidSymbolError
+from ..core.exceptions import APIError, BinanceConnectionError, InsufficientFundsError, InvalidSymbolError
 
 __all__ = [
     'BinanceAPIClient',
     'BinanceWebSocketClient',
     'APIError',
-    'ConnectionError',
+    'BinanceConnectionError',
     'InsufficientFundsError',
     'InvalidSymbolError',
 ]
@@ -5,23 +5,75 @@ Professional Binance API client with comprehensive error handling and rate limit
 import asyncio
 import aiohttp
 import time
+import random
 import hmac
 import hashlib
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urlencode
-import json
 from dataclasses import dataclass
 
-from ..core.exceptions import APIError, ConnectionError, InsufficientFundsError, InvalidSymbolError
+import numpy as np
+import orjson
+from yarl import URL
+
+from ..core.exceptions import APIError, BinanceConnectionError, InsufficientFundsError, InvalidSymbolError
 from ..core.logging import get_logger
 
 
+def _depth_weight(params: Dict[str, Any]) -> int:
+    limit = int(params.get('limit', 500))
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 10
+    return 20
+
+
+def _klines_weight(params: Dict[str, Any]) -> int:
+    limit = int(params.get('limit', 500))
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+# Request weight per endpoint, either a constant or a function of the params
+ENDPOINT_WEIGHT: Dict[str, Any] = {
+    '/fapi/v1/time': 1,
+    '/fapi/v1/exchangeInfo': 1,
+    '/fapi/v1/depth': _depth_weight,
+    '/fapi/v1/ticker/24hr': lambda p: 1 if 'symbol' in p else 40,
+    '/fapi/v1/klines': _klines_weight,
+    '/fapi/v2/account': 5,
+    '/fapi/v1/leverage': 1,
+    '/fapi/v1/order': 1,
+    '/fapi/v1/batchOrders': 1,
+    '/fapi/v1/openOrders': lambda p: 1 if 'symbol' in p else 40,
+}
+
+
+def _split_levels(levels: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split ``[price, quantity]`` levels into contiguous price and quantity arrays."""
+    prices, quantities = np.ascontiguousarray(np.asarray(levels, dtype=np.float64).reshape(-1, 2).T)
+    return prices, quantities
+
+
 @dataclass
 class OrderBook:
-    """Order book data structure."""
+    """Order book data structure.
+    
+    Levels are stored as parallel float64 arrays, best level first.
+    """
     symbol: str
-    bids: List[List[float]]
-    asks: List[List[float]]
+    bids_px: np.ndarray
+    bids_qty: np.ndarray
+    asks_px: np.ndarray
+    asks_qty: np.ndarray
     timestamp: int
 
 
@@ -46,33 +98,56 @@ class AccountInfo:
 
 
 class RateLimiter:
-    """Rate limiter for API requests."""
+    """Token-bucket rate limiter for API requests."""
     
     def __init__(self, max_requests: int = 1200, time_window: int = 60):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        
+        # Bucket refills continuously at max_requests per time_window
+        self.rate = max_requests / time_window
+        self.capacity = float(max_requests)
+        self.tokens = float(max_requests)
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
     
     async def acquire(self):
         """Acquire permission to make a request."""
-        now = time.time()
-        
-        # Remove old requests outside the time window
-        self.requests = [req_time for req_time in self.requests if now - req_time < self.time_window]
-        
-        # Check if we can make a request
-        if len(self.requests) >= self.max_requests:
-            sleep_time = self.time_window - (now - self.requests[0])
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-                self.requests = []
-        
-        self.requests.append(now)
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            
+            # Wait until a full token is available
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                now = time.monotonic()
+                self.tokens += (now - self.last) * self.rate
+                self.last = now
+            
+            self.tokens -= 1
 
 
 class BinanceAPIClient:
     """Professional Binance API client with comprehensive error handling."""
     
+    # Exchange info (filters, tick sizes) changes rarely
+    EXCHANGE_INFO_TTL = 300.0
+    
+    # Retry policy for 429s, and for 5xx responses and dropped connections on GETs
+    MAX_RETRIES = 5
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 30.0
+    RETRY_JITTER = 0.5
+    
+    # Binance futures request-weight budget per minute, and the share of it
+    # we allow ourselves before pacing requests to the next minute
+    WEIGHT_LIMIT_1M = 2400
+    WEIGHT_THRESHOLD = 0.9
+    
+    # Binance allows up to 200 streams on one combined-stream connection
+    MAX_STREAMS_PER_CONNECTION = 200
+    
     def __init__(
         self,
         api_key: str,
@@ -85,6 +160,14 @@ class BinanceAPIClient:
         self.testnet = testnet
         self.rate_limit = rate_limit
         
+        # Secret bytes and digest constructor resolved once, plus a keyed HMAC
+        # state copied per request instead of re-deriving the key. The template
+        # has already absorbed the key^ipad / key^opad blocks, so each copy
+        # only hashes the query string and the inner digest.
+        self._secret_bytes = api_secret.encode('utf-8')
+        self._digestmod = hashlib.sha256
+        self._hmac_template = hmac.new(self._secret_bytes, digestmod=self._digestmod)
+        
         # Base URLs
         if testnet:
             self.base_url = "https://testnet.binancefuture.com"
@@ -93,12 +176,33 @@ class BinanceAPIClient:
             self.base_url = "https://fapi.binance.com"
             self.ws_url = "wss://fstream.binance.com"
         
+        # Request headers never change; compressed bodies are inflated by
+        # aiohttp in C (zlib). Full URLs are cached per endpoint.
+        self._headers = {'X-MBX-APIKEY': api_key, 'Accept-Encoding': 'gzip, deflate'}
+        self._form_headers = {**self._headers, 'Content-Type': 'application/x-www-form-urlencoded'}
+        self._url_cache: Dict[str, str] = {}
+        
+        # Unsigned GETs currently in flight, keyed by endpoint and params
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+        
         # Rate limiter
         self.rate_limiter = RateLimiter() if rate_limit else None
         
         # Session
         self.session: Optional[aiohttp.ClientSession] = None
+        self._ws_session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
         self.logger = get_logger("api_client")
+        
+        # Exchange info cache and symbol -> symbol info index
+        self._exchange_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._symbol_index: Dict[str, Dict[str, Any]] = {}
+        
+        # Used weight / order count for the current minute, as last reported
+        # by the X-MBX-USED-WEIGHT-1M / X-MBX-ORDER-COUNT-1M headers
+        self.used_weight = 0
+        self.order_count = 0
+        self._weight_minute = int(time.time() // 60)
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -111,23 +215,97 @@ class BinanceAPIClient:
     
     async def start(self):
         """Start the API client."""
-        if self.session is None:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+        async with self._session_lock:
+            if self.session is None:
+                # Pooled connector kept for the client's lifetime so TCP/TLS
+                # connections are reused across requests
+                connector = aiohttp.TCPConnector(
+                    limit=256,
+                    limit_per_host=64,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                    keepalive_timeout=75
+                )
+                timeout = aiohttp.ClientTimeout(total=30, sock_connect=5, sock_read=15)
+                self.session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=timeout,
+                    raise_for_status=False,
+                    json_serialize=lambda obj: orjson.dumps(obj).decode('utf-8')
+                )
+    
+    async def _get_ws_session(self) -> aiohttp.ClientSession:
+        """Session dedicated to websockets, separate from the REST connector."""
+        async with self._session_lock:
+            if self._ws_session is None:
+                # No per-host cap: each connection is one long-lived socket
+                # carrying up to MAX_STREAMS_PER_CONNECTION streams
+                connector = aiohttp.TCPConnector(
+                    limit=0,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                )
+                timeout = aiohttp.ClientTimeout(total=None, sock_connect=10)
+                self._ws_session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._ws_session
     
     async def close(self):
         """Close the API client."""
         if self.session:
             await self.session.close()
             self.session = None
+        if self._ws_session:
+            await self._ws_session.close()
+            self._ws_session = None
     
     def _generate_signature(self, query_string: str) -> str:
         """Generate HMAC SHA256 signature."""
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        h = self._hmac_template.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
+    
+    def _endpoint_weight(self, endpoint: str, params: Dict[str, Any]) -> int:
+        """Look up the request weight of an endpoint."""
+        weight = ENDPOINT_WEIGHT.get(endpoint, 1)
+        return weight(params) if callable(weight) else weight
+    
+    async def _wait_for_weight(self, weight: int):
+        """Sleep until the budget has room for this request, then count it.
+        
+        Concurrent callers may all wait out the same minute, so each one
+        re-checks the budget after waking: the counters are only reset when
+        the minute has actually rolled over, and callers that still do not
+        fit behind the ones that woke first sleep again instead of bursting.
+        """
+        while True:
+            now = time.time()
+            minute = int(now // 60)
+            if minute != self._weight_minute:
+                self._weight_minute = minute
+                self.used_weight = 0
+                self.order_count = 0
+            
+            if self.used_weight + weight <= self.WEIGHT_LIMIT_1M * self.WEIGHT_THRESHOLD:
+                break
+            
+            delay = 60 - now % 60
+            self.logger.warning(
+                f"Used weight {self.used_weight}/{self.WEIGHT_LIMIT_1M}, "
+                f"pausing {delay:.1f}s until the next minute"
+            )
+            await asyncio.sleep(delay)
+        
+        # Count the request locally until the response headers correct it
+        self.used_weight += weight
+    
+    def _update_used_weight(self, headers):
+        """Record the used weight and order count reported by the exchange."""
+        used_weight = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used_weight is not None:
+            self.used_weight = int(used_weight)
+        order_count = headers.get('X-MBX-ORDER-COUNT-1M')
+        if order_count is not None:
+            self.order_count = int(order_count)
     
     async def _make_request(
         self,
@@ -136,68 +314,145 @@ class BinanceAPIClient:
         params: Optional[Dict[str, Any]] = None,
         signed: bool = False
     ) -> Dict[str, Any]:
-        """Make HTTP request to Binance API."""
-        if self.session is None:
-            raise ConnectionError("API client not started")
+        """Make HTTP request to Binance API.
+        
+        Identical unsigned GETs issued while one is already in flight share
+        its response instead of making another round trip.
+        """
+        if signed or method != 'GET':
+            return await self._send_request(method, endpoint, params, signed)
+        
+        key = (endpoint, tuple(sorted(params.items()))) if params else (endpoint,)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, endpoint, params, signed))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so one caller's cancellation does not cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = False
+    ) -> Dict[str, Any]:
+        """Send an HTTP request to Binance API.
         
-        # Rate limiting
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
+        429 responses are retried up to MAX_RETRIES times with jittered
+        exponential backoff. 5xx responses and dropped connections are retried
+        the same way for GETs only: for orders and cancels the exchange may
+        already have acted, so those raise instead of risking a duplicate.
+        Requests are paced against the exchange-reported weight so 429s are
+        avoided up front.
+        """
+        if self.session is None:
+            await self.start()
         
         # Prepare parameters
         if params is None:
             params = {}
         
-        if signed:
-            params['timestamp'] = int(time.time() * 1000)
-            query_string = urlencode(params)
-            params['signature'] = self._generate_signature(query_string)
-        
-        # Prepare headers
-        headers = {'X-MBX-APIKEY': self.api_key}
-        
         # Make request
-        url = f"{self.base_url}{endpoint}"
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.base_url + endpoint
+        weight = self._endpoint_weight(endpoint, params)
+        idempotent = method == 'GET'
+        last_error: Optional[Exception] = None
         
-        try:
-            async with self.session.request(
-                method=method,
-                url=url,
-                params=params if method == 'GET' else None,
-                data=params if method != 'GET' else None,
-                headers=headers
-            ) as response:
-                
-                # Handle rate limiting
-                if response.status == 429:
-                    retry_after = int(response.headers.get('Retry-After', 1))
-                    self.logger.warning(f"Rate limited, waiting {retry_after} seconds")
-                    await asyncio.sleep(retry_after)
-                    return await self._make_request(method, endpoint, params, signed)
+        for attempt in range(self.MAX_RETRIES):
+            # Rate limiting
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            await self._wait_for_weight(weight)
+            
+            # Signed payloads are rebuilt per attempt so the timestamp stays fresh
+            request_params = dict(params)
+            if signed:
+                request_params['timestamp'] = time.time_ns() // 1_000_000
+            
+            # One canonical percent-encoded string is both signed and sent
+            # verbatim, so the exchange hashes exactly the bytes we signed
+            query_string = urlencode(request_params)
+            if signed:
+                query_string += '&signature=' + self._generate_signature(query_string)
+            
+            retry_after = 0.0
+            try:
+                if method == 'GET':
+                    request = self.session.request(
+                        method,
+                        URL(f"{url}?{query_string}" if query_string else url, encoded=True),
+                        headers=self._headers
+                    )
+                else:
+                    request = self.session.request(
+                        method,
+                        url,
+                        data=query_string,
+                        headers=self._form_headers
+                    )
                 
-                # Parse response
-                response_data = await response.json()
-                
-                # Check for API errors
-                if response.status != 200:
-                    error_code = response_data.get('code', -1)
-                    error_msg = response_data.get('msg', 'Unknown error')
+                async with request as response:
+                    self._update_used_weight(response.headers)
+                    
+                    # A 5xx on an order or cancel leaves its execution status
+                    # unknown; resending could act twice, so only reads retry
+                    if response.status >= 500 and not idempotent:
+                        raise APIError(
+                            f"HTTP {response.status} from {method} {endpoint}, "
+                            f"execution status unknown"
+                        )
                     
-                    if error_code == -1021:
-                        raise APIError("Timestamp out of sync")
-                    elif error_code == -2010:
-                        raise InsufficientFundsError("Insufficient balance")
-                    elif error_code == -1121:
-                        raise InvalidSymbolError(f"Invalid symbol: {error_msg}")
+                    # Handle rate limiting and server-side failures
+                    if response.status == 429 or response.status >= 500:
+                        retry_after = float(response.headers.get('Retry-After', 0))
+                        last_error = APIError(f"HTTP {response.status} from {endpoint}")
+                        self.logger.warning(
+                            f"HTTP {response.status} from {endpoint}, retrying "
+                            f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+                        )
                     else:
-                        raise APIError(f"API Error {error_code}: {error_msg}")
-                
-                return response_data
-                
-        except aiohttp.ClientError as e:
-            raise ConnectionError(f"Network error: {str(e)}")
-        except json.JSONDecodeError as e:
-            raise APIError(f"Invalid JSON response: {str(e)}")
+                        # Parse raw bytes directly, skipping the str decode of response.json()
+                        response_data = orjson.loads(await response.read())
+                        
+                        # Check for API errors
+                        if response.status != 200:
+                            error_code = response_data.get('code', -1)
+                            error_msg = response_data.get('msg', 'Unknown error')
+                            
+                            if error_code == -1021:
+                                raise APIError("Timestamp out of sync")
+                            elif error_code == -2010:
+                                raise InsufficientFundsError("Insufficient balance")
+                            elif error_code == -1121:
+                                raise InvalidSymbolError(f"Invalid symbol: {error_msg}")
+                            else:
+                                raise APIError(f"API Error {error_code}: {error_msg}")
+                        
+                        return response_data
+                    
+            except aiohttp.ServerDisconnectedError as e:
+                if not idempotent:
+                    raise BinanceConnectionError(
+                        f"Server disconnected on {method} {endpoint}, execution status unknown: {str(e)}"
+                    )
+                last_error = BinanceConnectionError(f"Network error: {str(e)}")
+                self.logger.warning(f"Server disconnected on {endpoint}, retrying")
+            except aiohttp.ClientError as e:
+                raise BinanceConnectionError(f"Network error: {str(e)}")
+            except orjson.JSONDecodeError as e:
+                raise APIError(f"Invalid JSON response: {str(e)}")
+            
+            if attempt + 1 < self.MAX_RETRIES:
+                delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+                delay += random.random() * self.RETRY_JITTER
+                await asyncio.sleep(max(delay, retry_after))
+        
+        raise last_error
     
     async def get_server_time(self) -> int:
         """Get server time."""
@@ -205,26 +460,38 @@ class BinanceAPIClient:
         return response['serverTime']
     
     async def get_exchange_info(self) -> Dict[str, Any]:
-        """Get exchange information."""
-        return await self._make_request('GET', '/fapi/v1/exchangeInfo')
+        """Get exchange information (cached for EXCHANGE_INFO_TTL seconds)."""
+        if self._exchange_info_cache is not None:
+            fetched_at, exchange_info = self._exchange_info_cache
+            if time.monotonic() - fetched_at < self.EXCHANGE_INFO_TTL:
+                return exchange_info
+        
+        exchange_info = await self._make_request('GET', '/fapi/v1/exchangeInfo')
+        self._exchange_info_cache = (time.monotonic(), exchange_info)
+        self._symbol_index = {s['symbol']: s for s in exchange_info['symbols']}
+        return exchange_info
     
     async def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
         """Get symbol information."""
-        exchange_info = await self.get_exchange_info()
-        for symbol_info in exchange_info['symbols']:
-            if symbol_info['symbol'] == symbol:
-                return symbol_info
-        raise InvalidSymbolError(f"Symbol {symbol} not found")
+        await self.get_exchange_info()
+        try:
+            return self._symbol_index[symbol]
+        except KeyError:
+            raise InvalidSymbolError(f"Symbol {symbol} not found")
     
     async def get_order_book(self, symbol: str, limit: int = 100) -> OrderBook:
         """Get order book for symbol."""
         params = {'symbol': symbol, 'limit': limit}
         response = await self._make_request('GET', '/fapi/v1/depth', params)
+        bids_px, bids_qty = _split_levels(response['bids'])
+        asks_px, asks_qty = _split_levels(response['asks'])
         
         return OrderBook(
             symbol=symbol,
-            bids=[[float(bid[0]), float(bid[1])] for bid in response['bids']],
-            asks=[[float(ask[0]), float(ask[1])] for ask in response['asks']],
+            bids_px=bids_px,
+            bids_qty=bids_qty,
+            asks_px=asks_px,
+            asks_qty=asks_qty,
             timestamp=response['lastUpdateId']
         )
     
@@ -248,8 +515,8 @@ class BinanceAPIClient:
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
         limit: int = 500
-    ) -> List[List[Union[int, float]]]:
-        """Get kline/candlestick data."""
+    ) -> np.ndarray:
+        """Get kline/candlestick data as a float64 array, one row per kline."""
         params = {
             'symbol': symbol,
             'interval': interval,
@@ -262,7 +529,99 @@ class BinanceAPIClient:
             params['endTime'] = end_time
         
         response = await self._make_request('GET', '/fapi/v1/klines', params)
-        return response
+        
+        # Open times in ms fit exactly in float64
+        return np.asarray(response, dtype=np.float64)
+    
+    async def get_klines_batch(
+        self,
+        symbols: List[str],
+        interval: str,
+        limit: int = 500,
+        concurrency: int = 20
+    ) -> Dict[str, Union[np.ndarray, Exception]]:
+        """Get klines for many symbols with a bounded number of requests in flight.
+        
+        The semaphore is the higher-level limit on top of the connector's
+        per-host limit (64), so a large symbol list never opens more sockets
+        than the pool allows. Failed symbols map to their exception.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(symbol: str) -> Tuple[str, Union[np.ndarray, Exception]]:
+            async with semaphore:
+                try:
+                    return symbol, await self.get_klines(symbol, interval, limit=limit)
+                except Exception as e:
+                    return symbol, e
+        
+        return dict(await asyncio.gather(*(fetch(symbol) for symbol in symbols)))
+    
+    async def kline_streams(
+        self,
+        symbols: List[str],
+        interval: str
+    ) -> AsyncIterator[Tuple[str, np.ndarray]]:
+        """Yield ``(symbol, kline)`` for closed klines of many symbols over one websocket.
+        
+        Symbols are multiplexed over a combined stream, so at most
+        MAX_STREAMS_PER_CONNECTION symbols may share one call. Websockets run
+        on their own session so long-lived sockets never take slots from the
+        REST connector pool.
+        
+        Each kline is a float64 row laid out like the first six columns of
+        ``get_klines`` (open time, open, high, low, close, volume). In-progress
+        updates are skipped. Dropped connections and malformed messages are
+        logged and the stream is reopened with the same jittered exponential
+        backoff as REST retries.
+        """
+        if len(symbols) > self.MAX_STREAMS_PER_CONNECTION:
+            raise ValueError(
+                f"At most {self.MAX_STREAMS_PER_CONNECTION} streams per connection, got {len(symbols)}"
+            )
+        
+        session = await self._get_ws_session()
+        
+        # Stream name -> symbol as passed in, so callers get their own string objects back
+        streams = {f"{symbol.lower()}@kline_{interval}": symbol for symbol in symbols}
+        url = f"{self.ws_url}/stream?streams=" + '/'.join(streams)
+        attempt = 0
+        
+        while True:
+            try:
+                async with session.ws_connect(url, heartbeat=30) as ws:
+                    attempt = 0
+                    async for message in ws:
+                        if message.type != aiohttp.WSMsgType.TEXT:
+                            if message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                break
+                            continue
+                        
+                        payload = orjson.loads(message.data)
+                        symbol = streams.get(payload.get('stream'))
+                        kline = payload.get('data', {}).get('k')
+                        if symbol is None or kline is None or not kline['x']:
+                            continue
+                        
+                        yield symbol, np.array(
+                            (kline['t'], kline['o'], kline['h'], kline['l'], kline['c'], kline['v']),
+                            dtype=np.float64
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Kline stream for {len(streams)} symbols failed: {e!r}")
+            
+            delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+            delay += random.random() * self.RETRY_JITTER
+            attempt += 1
+            self.logger.info(f"Reconnecting kline stream for {len(streams)} symbols in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    async def kline_stream(self, symbol: str, interval: str) -> AsyncIterator[np.ndarray]:
+        """Yield closed klines for a single symbol (see ``kline_streams``)."""
+        async for _, kline in self.kline_streams([symbol], interval):
+            yield kline
     
     async def get_account_info(self) -> AccountInfo:
         """Get account information."""
@@ -332,6 +691,37 @@ class BinanceAPIClient:
         }
         return await self._make_request('DELETE', '/fapi/v1/order', params, signed=True)
     
+    async def cancel_orders_batch(
+        self,
+        symbol: str,
+        order_ids: List[int],
+        concurrency: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Cancel many orders on one symbol.
+        
+        Uses the batchOrders endpoint (up to 10 order ids per request), so
+        cancelling N orders costs ceil(N / 10) signatures and round trips.
+        Returns one result per order id, in order; failed cancels are
+        ``{'code': ..., 'msg': ...}`` entries as reported by the exchange.
+        
+        ``orderIdList`` is a JSON array, so its brackets and commas are
+        percent-encoded; the signature covers that encoded form, exactly as
+        it is sent.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def cancel(chunk: List[int]) -> List[Dict[str, Any]]:
+            params = {
+                'symbol': symbol,
+                'orderIdList': orjson.dumps([int(order_id) for order_id in chunk]).decode('utf-8')
+            }
+            async with semaphore:
+                return await self._make_request('DELETE', '/fapi/v1/batchOrders', params, signed=True)
+        
+        chunks = [order_ids[i:i + 10] for i in range(0, len(order_ids), 10)]
+        results = await asyncio.gather(*(cancel(chunk) for chunk in chunks))
+        return [result for chunk_results in results for result in chunk_results]
+    
     async def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get open orders."""
         params = {}
@@ -8,79 +8,209 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import json
 
-from pydantic import BaseSettings, Field, validator
-from dotenv import load_dotenv
-
 from .exceptions import ConfigurationError
 
 
-class Settings(BaseSettings):
+_TRUE_VALUES = frozenset({'1', 'true', 't', 'yes', 'y', 'on'})
+_FALSE_VALUES = frozenset({'0', 'false', 'f', 'no', 'n', 'off'})
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+def _parse_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _parse_optional_str(value: str) -> Optional[str]:
+    return value or None
+
+
+def _read_env_file(path: str = ".env") -> Dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file, if present."""
+    values: Dict[str, str] = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                if line.startswith('export '):
+                    line = line[7:]
+                key, value = line.split('=', 1)
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                    value = value[1:-1]
+                values[key.strip().upper()] = value
+    except FileNotFoundError:
+        pass
+    return values
+
+
+# Field name -> (environment variable, parser)
+_ENV_FIELDS = {
+    # API Configuration
+    'api_key': ('BINANCE_API_KEY', str),
+    'api_secret': ('BINANCE_API_SECRET', str),
+    
+    # Trading Configuration
+    'trading_strategy': ('TRADING_STRATEGY', str),
+    'leverage': ('LEVERAGE', int),
+    'order_size': ('ORDER_SIZE', float),
+    'interval': ('TRADING_INTERVAL', str),
+    
+    # Risk Management
+    'sl_mult': ('SL_MULT', float),
+    'tp_mult': ('TP_MULT', float),
+    'tp_sl_choice': ('TP_SL_CHOICE', str),
+    'trading_threshold': ('TRADING_THRESHOLD', float),
+    'max_positions': ('MAX_POSITIONS', int),
+    
+    # Trading Options
+    'trade_all_symbols': ('TRADE_ALL_SYMBOLS', _parse_bool),
+    'symbols_to_trade': ('SYMBOLS_TO_TRADE', _parse_list),
+    'coin_exclusion_list': ('COIN_EXCLUSION_LIST', _parse_list),
+    
+    # Advanced Options
+    'use_trailing_stop': ('USE_TRAILING_STOP', _parse_bool),
+    'trailing_stop_callback': ('TRAILING_STOP_CALLBACK', float),
+    'use_market_orders': ('USE_MARKET_ORDERS', _parse_bool),
+    'wait_for_candle_close': ('WAIT_FOR_CANDLE_CLOSE', _parse_bool),
+    'use_multiprocessing': ('USE_MULTIPROCESSING', _parse_bool),
+    
+    # Buffer Configuration
+    'auto_calculate_buffer': ('AUTO_CALCULATE_BUFFER', _parse_bool),
+    'buffer': ('BUFFER', str),
+    
+    # Logging Configuration
+    'log_level': ('LOG_LEVEL', int),
+    'log_to_file': ('LOG_TO_FILE', _parse_bool),
+    'log_file_path': ('LOG_FILE_PATH', _parse_optional_str),
+    
+    # Custom Functions
+    'custom_tp_sl_functions': ('CUSTOM_TP_SL_FUNCTIONS', _parse_list),
+    'make_decision_options': ('MAKE_DECISION_OPTIONS', json.loads),
+}
+
+# Field name -> (minimum, maximum), either bound optional
+_FIELD_BOUNDS = {
+    'leverage': (1, 125),
+    'order_size': (0.1, 100.0),
+    'sl_mult': (0.1, None),
+    'tp_mult': (0.1, None),
+    'trading_threshold': (0.1, 10.0),
+    'max_positions': (1, 100),
+    'trailing_stop_callback': (0.001, 5.0),
+}
+
+
+@dataclass
+class Settings:
     """Application settings loaded from environment variables."""
     
     # API Configuration
-    api_key: str = Field(..., env="BINANCE_API_KEY")
-    api_secret: str = Field(..., env="BINANCE_API_SECRET")
+    api_key: str = ""
+    api_secret: str = ""
     
     # Trading Configuration
-    trading_strategy: str = Field(default="tripleEMAStochasticRSIATR", env="TRADING_STRATEGY")
-    leverage: int = Field(default=10, ge=1, le=125, env="LEVERAGE")
-    order_size: float = Field(default=3.0, ge=0.1, le=100.0, env="ORDER_SIZE")
-    interval: str = Field(default="1m", env="TRADING_INTERVAL")
+    trading_strategy: str = "tripleEMAStochasticRSIATR"
+    leverage: int = 10
+    order_size: float = 3.0
+    interval: str = "1m"
     
     # Risk Management
-    sl_mult: float = Field(default=1.5, ge=0.1, env="SL_MULT")
-    tp_mult: float = Field(default=1.0, ge=0.1, env="TP_MULT")
-    tp_sl_choice: str = Field(default="%", env="TP_SL_CHOICE")
-    trading_threshold: float = Field(default=0.3, ge=0.1, le=10.0, env="TRADING_THRESHOLD")
-    max_positions: int = Field(default=10, ge=1, le=100, env="MAX_POSITIONS")
+    sl_mult: float = 1.5
+    tp_mult: float = 1.0
+    tp_sl_choice: str = "%"
+    trading_threshold: float = 0.3
+    max_positions: int = 10
     
     # Trading Options
-    trade_all_symbols: bool = Field(default=True, env="TRADE_ALL_SYMBOLS")
-    symbols_to_trade: List[str] = Field(default=["BTCUSDT"], env="SYMBOLS_TO_TRADE")
-    coin_exclusion_list: List[str] = Field(default=["USDCUSDT", "BTCDOMUSDT"], env="COIN_EXCLUSION_LIST")
+    trade_all_symbols: bool = True
+    symbols_to_trade: List[str] = field(default_factory=lambda: ["BTCUSDT"])
+    coin_exclusion_list: List[str] = field(default_factory=lambda: ["USDCUSDT", "BTCDOMUSDT"])
     
     # Advanced Options
-    use_trailing_stop: bool = Field(default=False, env="USE_TRAILING_STOP")
-    trailing_stop_callback: float = Field(default=0.1, ge=0.001, le=5.0, env="TRAILING_STOP_CALLBACK")
-    use_market_orders: bool = Field(default=False, env="USE_MARKET_ORDERS")
-    wait_for_candle_close: bool = Field(default=True, env="WAIT_FOR_CANDLE_CLOSE")
-    use_multiprocessing: bool = Field(default=True, env="USE_MULTIPROCESSING")
+    use_trailing_stop: bool = False
+    trailing_stop_callback: float = 0.1
+    use_market_orders: bool = False
+    wait_for_candle_close: bool = True
+    use_multiprocessing: bool = True
     
     # Buffer Configuration
-    auto_calculate_buffer: bool = Field(default=True, env="AUTO_CALCULATE_BUFFER")
-    buffer: str = Field(default="3 hours ago", env="BUFFER")
+    auto_calculate_buffer: bool = True
+    buffer: str = "3 hours ago"
     
     # Logging Configuration
-    log_level: int = Field(default=20, env="LOG_LEVEL")  # INFO level
-    log_to_file: bool = Field(default=False, env="LOG_TO_FILE")
-    log_file_path: Optional[str] = Field(default=None, env="LOG_FILE_PATH")
+    log_level: int = 20  # INFO level
+    log_to_file: bool = False
+    log_file_path: Optional[str] = None
     
     # Custom Functions
-    custom_tp_sl_functions: List[str] = Field(default=["USDT"], env="CUSTOM_TP_SL_FUNCTIONS")
-    make_decision_options: Dict[str, Any] = Field(default_factory=dict, env="MAKE_DECISION_OPTIONS")
+    custom_tp_sl_functions: List[str] = field(default_factory=lambda: ["USDT"])
+    make_decision_options: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_env(cls, env_file: Optional[str] = ".env") -> "Settings":
+        """Build settings from environment variables.
+        
+        Variable names are case-insensitive; values in the process
+        environment take precedence over the ``.env`` file.
+        
+        Raises:
+            ValueError: If a value cannot be parsed or is out of range.
+        """
+        env = _read_env_file(env_file) if env_file else {}
+        env.update((key.upper(), value) for key, value in os.environ.items())
+        
+        values = {}
+        for name, (env_name, parser) in _ENV_FIELDS.items():
+            raw = env.get(env_name)
+            if raw is not None:
+                try:
+                    values[name] = parser(raw)
+                except ValueError as e:
+                    raise ValueError(f"Invalid value for {env_name}: {e}")
+        
+        settings = cls(**values)
+        settings.check_bounds()
+        return settings
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    def update(self, values: Dict[str, Any]) -> None:
+        """Overlay values onto the settings, parsing strings like the environment loader.
         
-    @validator("symbols_to_trade", pre=True)
-    def parse_symbols_to_trade(cls, v):
-        if isinstance(v, str):
-            return [s.strip() for s in v.split(",")]
-        return v
+        Unknown keys are ignored.
         
-    @validator("coin_exclusion_list", pre=True)
-    def parse_coin_exclusion_list(cls, v):
-        if isinstance(v, str):
-            return [s.strip() for s in v.split(",")]
-        return v
+        Raises:
+            ValueError: If a value cannot be parsed or is out of range.
+        """
+        for name, value in values.items():
+            entry = _ENV_FIELDS.get(name)
+            if entry is None:
+                continue
+            if isinstance(value, str):
+                value = entry[1](value)
+            setattr(self, name, value)
+        self.check_bounds()
+    
+    def check_bounds(self) -> None:
+        """Check numeric fields against their allowed ranges.
         
-    @validator("custom_tp_sl_functions", pre=True)
-    def parse_custom_tp_sl_functions(cls, v):
-        if isinstance(v, str):
-            return [s.strip() for s in v.split(",")]
-        return v
+        Raises:
+            ValueError: If a field is out of range.
+        """
+        for name, (minimum, maximum) in _FIELD_BOUNDS.items():
+            value = getattr(self, name)
+            if minimum is not None and value < minimum:
+                raise ValueError(f"{name} must be >= {minimum}, got {value}")
+            if maximum is not None and value > maximum:
+                raise ValueError(f"{name} must be <= {maximum}, got {value}")
 
 
 @dataclass
@@ -149,14 +279,10 @@ class Config:
             with open(self.config_path, 'r') as f:
                 config_data = json.load(f)
             
-            # Load environment variables first
-            load_dotenv()
-            
-            # Override with file values
-            for key, value in config_data.items():
-                os.environ[key.upper()] = str(value)
-                
-            self._settings = Settings()
+            # Load environment variables first, then override with file values
+            settings = Settings.from_env()
+            settings.update(config_data)
+            self._settings = settings
             
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration from file: {e}")
@@ -164,8 +290,7 @@ class Config:
     def _load_from_environment(self) -> None:
         """Load configuration from environment variables."""
         try:
-            load_dotenv()
-            self._settings = Settings()
+            self._settings = Settings.from_env()
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration from environment: {e}")
     
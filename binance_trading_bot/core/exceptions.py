@@ -38,8 +38,11 @@ class ValidationError(TradingBotError):
     pass
 
 
-class ConnectionError(TradingBotError):
-    """Raised when there's a connection error."""
+class BinanceConnectionError(TradingBotError):
+    """Raised when there's a connection error.
+    
+    Named so it does not shadow the builtin ``ConnectionError``.
+    """
     pass
 
 
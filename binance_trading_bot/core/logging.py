@@ -2,35 +2,102 @@
 Professional logging configuration for the trading bot.
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 import colorlog
+import orjson
+
+# Aware UTC datetimes render as "...Z"; numpy scalars/arrays serialize natively
+_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+
+# Attributes every LogRecord carries; anything else came in via ``extra=``
+_STANDARD_FIELDS = frozenset(
+    logging.LogRecord('', logging.INFO, '', 0, '', (), None).__dict__
+) | {'message', 'asctime'}
+
+# Per-thread scratch dict reused for every formatted record
+_local = threading.local()
+
+# Background thread writing queued records to the log file
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+@functools.lru_cache(maxsize=1024)
+def _static_prefix(level: str, logger: str, module: str, function: str, line: int) -> bytes:
+    """JSON object prefix (without the closing brace) for a call site's fixed fields."""
+    return orjson.dumps({
+        'level': level,
+        'logger': logger,
+        'module': module,
+        'function': function,
+        'line': line,
+    })[:-1]
 
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging."""
     
     def format(self, record):
-        log_entry = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno,
-        }
+        return self.format_bytes(record)[:-1].decode('utf-8')
+    
+    def format_bytes(self, record) -> bytes:
+        """Format a record as one newline-terminated UTF-8 JSON line."""
+        # Fields fixed per call site are encoded once and reused
+        prefix = _static_prefix(record.levelname, record.name, record.module, record.funcName, record.lineno)
+        
+        # orjson does not keep a reference, so one dict per thread is reused
+        log_entry = getattr(_local, 'log_entry', None)
+        if log_entry is None:
+            log_entry = _local.log_entry = {}
+        log_entry.clear()
+        log_entry['timestamp'] = datetime.fromtimestamp(record.created, timezone.utc)
+        log_entry['message'] = record.getMessage()
         
         # Add extra fields if present
-        if hasattr(record, 'extra'):
-            log_entry.update(record.extra)
+        record_dict = record.__dict__
+        for key in record_dict.keys() - _STANDARD_FIELDS:
+            log_entry[key] = record_dict[key]
+        
+        tail = orjson.dumps(log_entry, default=str, option=_JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return prefix + b',' + tail[1:]
+
+
+class BytesRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler writing StructuredFormatter bytes straight to a binary file.
+    
+    Skips the str round trip (and the second format() call the stock
+    handler makes to decide on rollover).
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, 'ab')
+    
+    def emit(self, record):
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, StructuredFormatter):
+                data = formatter.format_bytes(record)
+            else:
+                data = (self.format(record) + self.terminator).encode('utf-8')
             
-        return json.dumps(log_entry)
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+            
+            self.stream.write(data)
+            self.flush()
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(
@@ -59,24 +126,32 @@ def setup_logging(
     
     # Clear existing handlers
     logger.handlers.clear()
+    stop_logging()
     
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     
-    # Color formatter for console
-    color_formatter = colorlog.ColoredFormatter(
-        '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    )
-    console_handler.setFormatter(color_formatter)
+    # Color formatter for console; plain when output is redirected (e.g.
+    # systemd/docker) unless FORCE_COLOR is set
+    if sys.stdout.isatty() or os.environ.get('FORCE_COLOR'):
+        console_formatter = colorlog.ColoredFormatter(
+            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S',
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        )
+    else:
+        console_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+    console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
     
     # File handler if requested
@@ -85,7 +160,7 @@ def setup_logging(
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BytesRotatingFileHandler(
             log_path,
             maxBytes=max_file_size,
             backupCount=backup_count
@@ -95,15 +170,41 @@ def setup_logging(
         # Structured formatter for file
         file_formatter = StructuredFormatter()
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        
+        # Disk writes happen on the listener thread, not the event loop
+        global _queue_listener
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(level)
+        logger.addHandler(queue_handler)
     
     return logger
 
 
+@atexit.register
+def stop_logging() -> None:
+    """Flush queued file records and stop the background log writer."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance.
     
+    Loggers are memoized by name, skipping the name formatting and the
+    logging module lock on repeat lookups.
+    
     Args:
         name: Logger name
         
@@ -116,6 +217,8 @@ def get_logger(name: str) -> logging.Logger:
 class TradeLogger:
     """Specialized logger for trade events."""
     
+    __slots__ = ('logger',)
+    
     def __init__(self, logger: logging.Logger):
         self.logger = logger
     
@@ -128,8 +231,11 @@ class TradeLogger:
         **kwargs
     ):
         """Log a trade signal."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.logger.info(
-            f"Trade signal generated",
+            "Trade signal generated",
             extra={
                 'event_type': 'trade_signal',
                 'symbol': symbol,
@@ -150,8 +256,11 @@ class TradeLogger:
         **kwargs
     ):
         """Log trade execution."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.logger.info(
-            f"Trade executed",
+            "Trade executed",
             extra={
                 'event_type': 'trade_execution',
                 'symbol': symbol,
@@ -173,8 +282,11 @@ class TradeLogger:
         **kwargs
     ):
         """Log trade closure."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.logger.info(
-            f"Trade closed",
+            "Trade closed",
             extra={
                 'event_type': 'trade_close',
                 'symbol': symbol,
@@ -194,7 +306,9 @@ class TradeLogger:
     ):
         """Log an error with context."""
         self.logger.error(
-            f"Error in {context}: {str(error)}",
+            "Error in %s: %s",
+            context,
+            error,
             extra={
                 'event_type': 'error',
                 'error_type': type(error).__name__,
@@ -202,5 +316,5 @@ class TradeLogger:
                 'error_message': str(error),
                 **kwargs
             },
-            exc_info=True
+            exc_info=error
         )
\ No newline at end of file
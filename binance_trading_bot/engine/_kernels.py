@@ -0,0 +1,123 @@
+"""
+Numeric kernels for the risk engine.
+
+Compiled with numba when it is installed (``pip install .[speed]``);
+otherwise they run as plain Python/NumPy with identical results.
+"""
+
+import time
+from typing import Dict
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def pnl_kernel(size, entry, price):
+    """Unrealized P&L of a position; ``size`` is negative for shorts."""
+    return (price - entry) * size
+
+
+@njit(cache=True)
+def drawdown_kernel(peak, balance, upnl_sum):
+    """Drawdown of equity from its peak, as a fraction (0 when at or above it)."""
+    if peak == 0.0:
+        return 0.0
+    
+    current = balance + upnl_sum
+    if current >= peak:
+        return 0.0
+    
+    return (peak - current) / peak
+
+
+@njit(cache=True)
+def risk_score_kernel(exposure, balance, daily_pnl, drawdown):
+    """Overall risk score (0-100) from exposure, daily P&L and drawdown."""
+    score = 0.0
+    
+    # Exposure score (0-30 points)
+    exposure_ratio = exposure / balance if balance > 0 else 0.0
+    score += min(30.0, exposure_ratio * 100)
+    
+    # Daily P&L score (0-30 points)
+    if daily_pnl < 0:
+        pnl_ratio = -daily_pnl / balance if balance > 0 else 0.0
+        score += min(30.0, pnl_ratio * 100)
+    
+    # Drawdown score (0-40 points)
+    score += min(40.0, drawdown * 100)
+    
+    return min(100.0, score)
+
+
+@njit(cache=True)
+def tick_update(rows, new_prices, size, entry, price, upnl, risk_pct, balance):
+    """
+    Apply new prices to the given position rows in place.
+    
+    Returns the changes in total exposure and total unrealized P&L so the
+    caller can patch its running sums instead of re-reducing every row.
+    """
+    s = size[rows]
+    d_exposure = (s * (new_prices - price[rows])).sum()
+    pnl = (new_prices - entry[rows]) * s
+    d_upnl = (pnl - upnl[rows]).sum()
+    
+    price[rows] = new_prices
+    upnl[rows] = pnl
+    if balance > 0:
+        risk_pct[rows] = np.abs(pnl) / balance
+    else:
+        risk_pct[rows] = 0.0
+    
+    return d_exposure, d_upnl
+
+
+@njit(cache=True)
+def close_codes(upnl, risk_pct, stop_loss_pnl, take_profit_pnl, max_risk):
+    """
+    Close rule hit by each position: 0 none, 1 stop loss, 2 take profit,
+    3 risk too high, checked in the order ``should_close_position`` uses.
+    """
+    n = upnl.shape[0]
+    codes = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        if upnl[i] < stop_loss_pnl:
+            codes[i] = 1
+        elif upnl[i] > take_profit_pnl:
+            codes[i] = 2
+        elif risk_pct[i] > max_risk:
+            codes[i] = 3
+    return codes
+
+
+def warmup() -> Dict[str, float]:
+    """
+    Call every kernel once with the argument types the risk manager uses,
+    so compilation happens at startup. Returns the seconds spent per kernel.
+    """
+    x = np.zeros(4)
+    rows = np.arange(2, dtype=np.int64)
+    calls = {
+        'pnl_kernel': lambda: pnl_kernel(1.0, 1.0, 1.0),
+        'drawdown_kernel': lambda: drawdown_kernel(1.0, 1.0, 0.0),
+        'risk_score_kernel': lambda: risk_score_kernel(0.0, 1.0, 0.0, 0.0),
+        'tick_update': lambda: tick_update(rows, x[:2].copy(), x, x, x.copy(), x.copy(), x.copy(), 1.0),
+        'close_codes': lambda: close_codes(x, x, -1.0, 1.0, 0.05),
+    }
+    
+    timings = {}
+    for name, call in calls.items():
+        start = time.perf_counter()
+        call()
+        timings[name] = time.perf_counter() - start
+    return timings
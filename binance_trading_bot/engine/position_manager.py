@@ -3,19 +3,48 @@ Professional position management system.
 """
 
 from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
 from datetime import datetime
 import asyncio
+import logging
+import sys
+import time
+
+import numpy as np
 
 from ..core.exceptions import TradingError, OrderError
 from ..core.logging import get_logger
-from ..api.client import BinanceAPIClient
-from .risk_manager import RiskManager, PositionRisk
+from ..api.client import BinanceAPIClient, AccountInfo
+from .risk_manager import RiskManager, PositionRisk, format_violation
 from ..strategies.base import StrategyResult, SignalType
 
 
+@dataclass
+class Position:
+    """Tracked position state."""
+    __slots__ = (
+        'size', 'entry_price', 'current_price', 'unrealized_pnl', 'side', 'timestamp', 'order_id'
+    )
+    
+    size: float
+    entry_price: float
+    current_price: float
+    unrealized_pnl: float
+    side: str
+    timestamp: datetime
+    order_id: Optional[int]
+
+
 class PositionManager:
     """Professional position management system."""
     
+    # Closure checks are driven by position updates; every Nth cycle also
+    # rescans all positions to catch changes made outside this manager
+    FULL_SCAN_INTERVAL = 10
+    
+    # Back-to-back account info requests within this window share one response
+    ACCOUNT_INFO_TTL = 0.25
+    
     def __init__(
         self,
         api_client: BinanceAPIClient,
@@ -27,20 +56,95 @@ class PositionManager:
         self.dry_run = dry_run
         
         self.logger = get_logger("position_manager")
-        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.positions: Dict[str, Position] = {}
+        
+        # Size and unrealized P&L mirrored into parallel arrays, one slot per
+        # tracked symbol (first len(self._symbols) entries), so totals are vectorized
+        self._symbols: List[str] = []
+        self._symbol_idx: Dict[str, int] = {}
+        self._sizes = np.zeros(64, dtype=np.float64)
+        self._unrealized = np.zeros(64, dtype=np.float64)
+        
+        # Symbols flagged for closure since the last check, with the reason
+        self._closure_candidates: Dict[str, str] = {}
+        self._cycles_since_scan = 0
+        
+        # Last account info response and when it was fetched
+        self._account_info: Optional[AccountInfo] = None
+        self._account_info_at = 0.0
+    
+    def _store_position(self, symbol: str, position: Position) -> None:
+        """Track a position and mirror its numbers into the arrays."""
+        self.positions[symbol] = position
+        
+        idx = self._symbol_idx.get(symbol)
+        if idx is None:
+            idx = len(self._symbols)
+            if idx == len(self._sizes):
+                self._sizes = np.concatenate([self._sizes, np.zeros_like(self._sizes)])
+                self._unrealized = np.concatenate([self._unrealized, np.zeros_like(self._unrealized)])
+            self._symbols.append(symbol)
+            self._symbol_idx[symbol] = idx
+        
+        self._sizes[idx] = position.size
+        self._unrealized[idx] = position.unrealized_pnl
+    
+    def _remove_position(self, symbol: str) -> None:
+        """Stop tracking a position, moving the last slot into its place."""
+        self.positions.pop(symbol, None)
+        
+        idx = self._symbol_idx.pop(symbol, None)
+        if idx is None:
+            return
+        
+        last = len(self._symbols) - 1
+        last_symbol = self._symbols.pop()
+        if idx != last:
+            self._sizes[idx] = self._sizes[last]
+            self._unrealized[idx] = self._unrealized[last]
+            self._symbols[idx] = last_symbol
+            self._symbol_idx[last_symbol] = idx
+    
+    async def _get_account_info(self) -> AccountInfo:
+        """Get account info, reusing a response fetched within ACCOUNT_INFO_TTL."""
+        if self._account_info is not None and time.monotonic() - self._account_info_at < self.ACCOUNT_INFO_TTL:
+            return self._account_info
+        
+        self._account_info = await self.api_client.get_account_info()
+        self._account_info_at = time.monotonic()
+        return self._account_info
     
     async def update_all_positions(self) -> None:
         """Update all tracked positions."""
         try:
             # Get current positions from API
-            account_info = await self.api_client.get_account_info()
+            account_info = await self._get_account_info()
+            
+            # Only track non-zero positions. The account reports every symbol,
+            # mostly flat, so the amounts are parsed and filtered in one pass
+            positions = account_info.positions
+            amounts = np.array([p['positionAmt'] for p in positions], dtype=np.float64)
+            active = [positions[i] for i in np.flatnonzero(amounts)]
+            
+            # One timestamp for the whole tick. Symbols arrive as fresh strings
+            # on every response; interning them lets the per-symbol dict lookups
+            # downstream match on identity
+            now = datetime.utcnow()
+            results = await asyncio.gather(
+                *(
+                    self._update_position(sys.intern(position_data['symbol']), position_data, now)
+                    for position_data in active
+                ),
+                return_exceptions=True
+            )
             
-            for position_data in account_info.positions:
-                symbol = position_data['symbol']
-                position_size = float(position_data['positionAmt'])
-                
-                if abs(position_size) > 0:  # Only track non-zero positions
-                    await self._update_position(symbol, position_data)
+            failed = {
+                position_data['symbol']: result
+                for position_data, result in zip(active, results)
+                if isinstance(result, Exception)
+            }
+            if failed:
+                self.logger.error(f"Error updating positions for {len(failed)} symbols: {failed}")
             
             # Check for positions that should be closed
             await self._check_position_closures()
@@ -48,41 +152,44 @@ class PositionManager:
         except Exception as e:
             self.logger.error(f"Error updating positions: {e}")
     
-    async def _update_position(self, symbol: str, position_data: Dict[str, Any]) -> None:
+    async def _update_position(self, symbol: str, position_data: Dict[str, Any], now: datetime) -> None:
         """Update a specific position."""
-        try:
-            position_size = float(position_data['positionAmt'])
-            entry_price = float(position_data['entryPrice'])
-            mark_price = float(position_data['markPrice'])
-            unrealized_pnl = float(position_data['unRealizedProfit'])
-            
-            # Create or update position risk
-            position_risk = PositionRisk(
-                symbol=symbol,
-                position_size=position_size,
-                entry_price=entry_price,
-                current_price=mark_price,
-                unrealized_pnl=unrealized_pnl,
-                risk_percentage=abs(unrealized_pnl) / self.risk_manager.account_balance,
-                stop_loss_distance=0.0,  # Will be calculated based on strategy
-                take_profit_distance=0.0
-            )
-            
-            # Update in risk manager
-            self.risk_manager.add_position(position_risk)
-            
-            # Update in position manager
-            self.positions[symbol] = {
-                'size': position_size,
-                'entry_price': entry_price,
-                'current_price': mark_price,
-                'unrealized_pnl': unrealized_pnl,
-                'side': 'LONG' if position_size > 0 else 'SHORT',
-                'timestamp': datetime.utcnow()
-            }
-            
+        position_size = float(position_data['positionAmt'])
+        entry_price = float(position_data['entryPrice'])
+        mark_price = float(position_data['markPrice'])
+        unrealized_pnl = float(position_data['unRealizedProfit'])
+        
+        # Create or update position risk
+        position_risk = PositionRisk(
+            symbol=symbol,
+            position_size=position_size,
+            entry_price=entry_price,
+            current_price=mark_price,
+            unrealized_pnl=unrealized_pnl,
+            risk_percentage=abs(unrealized_pnl) / self.risk_manager.account_balance,
+            stop_loss_distance=0.0,  # Will be calculated based on strategy
+            take_profit_distance=0.0
+        )
+        
+        # Update in risk manager
+        self.risk_manager.add_position(position_risk)
+        self._flag_if_closable(symbol)
+        
+        # Update in position manager
+        self._store_position(symbol, Position(
+            size=position_size,
+            entry_price=entry_price,
+            current_price=mark_price,
+            unrealized_pnl=unrealized_pnl,
+            side='LONG' if position_size > 0 else 'SHORT',
+            timestamp=now,
+            order_id=None
+        ))
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"Updated position for {symbol}",
+                "Updated position for %s",
+                symbol,
                 extra={
                     'symbol': symbol,
                     'size': position_size,
@@ -91,18 +198,32 @@ class PositionManager:
                     'unrealized_pnl': unrealized_pnl
                 }
             )
-            
-        except Exception as e:
-            self.logger.error(f"Error updating position for {symbol}: {e}")
+    
+    def _flag_if_closable(self, symbol: str) -> None:
+        """Queue a position for closure if risk management says so."""
+        should_close, reason = self.risk_manager.should_close_position(symbol)
+        if should_close:
+            self._closure_candidates[symbol] = reason
     
     async def _check_position_closures(self) -> None:
-        """Check if any positions should be closed."""
+        """Close positions flagged since the last check."""
         try:
-            for symbol in list(self.positions.keys()):
-                should_close, reason = self.risk_manager.should_close_position(symbol)
-                
-                if should_close:
-                    await self._close_position(symbol, reason)
+            self._cycles_since_scan += 1
+            if self._cycles_since_scan >= self.FULL_SCAN_INTERVAL:
+                self._cycles_since_scan = 0
+                self._closure_candidates.update(self.risk_manager.positions_to_close())
+            
+            if not self._closure_candidates:
+                return
+            
+            candidates, self._closure_candidates = self._closure_candidates, {}
+            
+            # _close_position logs its own failures
+            await asyncio.gather(*(
+                self._close_position(symbol, reason)
+                for symbol, reason in candidates.items()
+                if symbol in self.positions
+            ))
             
         except Exception as e:
             self.logger.error(f"Error checking position closures: {e}")
@@ -120,7 +241,7 @@ class PositionManager:
                 self.logger.warning(f"Position not found for {symbol}")
                 return
             
-            position_size = position['size']
+            position_size = position.size
             side = 'SELL' if position_size > 0 else 'BUY'
             quantity = abs(position_size)
             
@@ -133,21 +254,22 @@ class PositionManager:
             )
             
             # Remove from tracking
-            if symbol in self.positions:
-                del self.positions[symbol]
+            self._remove_position(symbol)
             
             self.risk_manager.remove_position(symbol)
             
-            self.logger.info(
-                f"Closed position for {symbol}",
-                extra={
-                    'symbol': symbol,
-                    'side': side,
-                    'quantity': quantity,
-                    'reason': reason,
-                    'order_id': order_result.get('orderId')
-                }
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Closed position for %s",
+                    symbol,
+                    extra={
+                        'symbol': symbol,
+                        'side': side,
+                        'quantity': quantity,
+                        'reason': reason,
+                        'order_id': order_result.get('orderId')
+                    }
+                )
             
         except Exception as e:
             self.logger.error(f"Error closing position for {symbol}: {e}")
@@ -184,7 +306,8 @@ class PositionManager:
             
             if not is_valid:
                 self.logger.warning(
-                    f"Risk limits violated for {symbol}: {violations}"
+                    f"Risk limits violated for {symbol}: "
+                    f"{[format_violation(violation) for violation in violations]}"
                 )
                 return None
             
@@ -200,15 +323,15 @@ class PositionManager:
             )
             
             # Track position
-            self.positions[symbol] = {
-                'size': position_size if side == 'BUY' else -position_size,
-                'entry_price': current_price,
-                'current_price': current_price,
-                'unrealized_pnl': 0.0,
-                'side': side,
-                'timestamp': datetime.utcnow(),
-                'order_id': order_result.get('orderId')
-            }
+            self._store_position(symbol, Position(
+                size=position_size if side == 'BUY' else -position_size,
+                entry_price=current_price,
+                current_price=current_price,
+                unrealized_pnl=0.0,
+                side=side,
+                timestamp=datetime.utcnow(),
+                order_id=order_result.get('orderId')
+            ))
             
             # Add to risk manager
             position_risk = PositionRisk(
@@ -222,18 +345,21 @@ class PositionManager:
                 take_profit_distance=0.0
             )
             self.risk_manager.add_position(position_risk)
+            self._flag_if_closable(symbol)
             
-            self.logger.info(
-                f"Opened position for {symbol}",
-                extra={
-                    'symbol': symbol,
-                    'side': side,
-                    'size': position_size,
-                    'entry_price': current_price,
-                    'order_id': order_result.get('orderId'),
-                    'confidence': signal_result.confidence
-                }
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Opened position for %s",
+                    symbol,
+                    extra={
+                        'symbol': symbol,
+                        'side': side,
+                        'size': position_size,
+                        'entry_price': current_price,
+                        'order_id': order_result.get('orderId'),
+                        'confidence': signal_result.confidence
+                    }
+                )
             
             return order_result
             
@@ -258,7 +384,7 @@ class PositionManager:
     
     def get_position_summary(self) -> Dict[str, Any]:
         """Get summary of all positions."""
-        total_pnl = sum(pos['unrealized_pnl'] for pos in self.positions.values())
+        total_pnl = float(self._unrealized[:len(self._symbols)].sum())
         
         return {
             'total_positions': len(self.positions),
@@ -266,12 +392,12 @@ class PositionManager:
             'positions': [
                 {
                     'symbol': symbol,
-                    'side': pos['side'],
-                    'size': pos['size'],
-                    'entry_price': pos['entry_price'],
-                    'current_price': pos['current_price'],
-                    'unrealized_pnl': pos['unrealized_pnl'],
-                    'timestamp': pos['timestamp'].isoformat()
+                    'side': pos.side,
+                    'size': pos.size,
+                    'entry_price': pos.entry_price,
+                    'current_price': pos.current_price,
+                    'unrealized_pnl': pos.unrealized_pnl,
+                    'timestamp': pos.timestamp.isoformat()
                 }
                 for symbol, pos in self.positions.items()
             ]
@@ -281,10 +407,10 @@ class PositionManager:
         """Get performance metrics."""
         try:
             # Get account info for current balance
-            account_info = await self.api_client.get_account_info()
+            account_info = await self._get_account_info()
             
             # Calculate metrics
-            total_pnl = sum(pos['unrealized_pnl'] for pos in self.positions.values())
+            total_pnl = float(self._unrealized[:len(self._symbols)].sum())
             win_rate = self._calculate_win_rate()
             
             return {
@@ -301,12 +427,8 @@ class PositionManager:
     
     def _calculate_win_rate(self) -> float:
         """Calculate win rate based on position P&L."""
-        if not self.positions:
+        n = len(self._symbols)
+        if not n:
             return 0.0
         
-        profitable_positions = sum(
-            1 for pos in self.positions.values()
-            if pos['unrealized_pnl'] > 0
-        )
-        
-        return profitable_positions / len(self.positions)
+        return int(np.count_nonzero(self._unrealized[:n] > 0)) / n
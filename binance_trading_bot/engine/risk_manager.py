@@ -4,12 +4,18 @@ Professional risk management system.
 
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from bisect import bisect_right
 import asyncio
+import sys
+import time
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from ..core.exceptions import RiskManagementError, InsufficientFundsError
 from ..core.logging import get_logger
+from ._kernels import pnl_kernel, drawdown_kernel, risk_score_kernel, tick_update, close_codes
 
 
 class RiskLevel(Enum):
@@ -20,9 +26,38 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+class ViolationCode(IntEnum):
+    """Risk limit violated by a prospective position."""
+    POSITION_SIZE = 1
+    TOTAL_EXPOSURE = 2
+    MAX_POSITIONS = 3
+    DAILY_LOSS = 4
+    DRAWDOWN = 5
+
+
+# Message per violation code, formatted with the limit that was breached
+_VIOLATION_MESSAGES = {
+    ViolationCode.POSITION_SIZE: "Position size exceeds maximum allowed ({}%)",
+    ViolationCode.TOTAL_EXPOSURE: "Total exposure would exceed maximum allowed ({}%)",
+    ViolationCode.MAX_POSITIONS: "Maximum number of positions reached ({})",
+    ViolationCode.DAILY_LOSS: "Daily loss limit exceeded ({}%)",
+    ViolationCode.DRAWDOWN: "Maximum drawdown exceeded ({}%)",
+}
+
+
+def format_violation(violation: Tuple[ViolationCode, float]) -> str:
+    """Human-readable message for a ``(code, limit)`` violation from ``check_risk_limits``."""
+    code, limit = violation
+    return _VIOLATION_MESSAGES[code].format(limit)
+
+
+@dataclass(frozen=True)
 class RiskMetrics:
     """Risk metrics data structure."""
+    __slots__ = (
+        'total_exposure', 'max_drawdown', 'daily_pnl', 'position_count', 'risk_score', 'risk_level'
+    )
+    
     total_exposure: float
     max_drawdown: float
     daily_pnl: float
@@ -34,8 +69,13 @@ class RiskMetrics:
 @dataclass
 class PositionRisk:
     """Individual position risk assessment."""
+    __slots__ = (
+        'symbol', 'position_size', 'entry_price', 'current_price', 'unrealized_pnl',
+        'risk_percentage', 'stop_loss_distance', 'take_profit_distance'
+    )
+    
     symbol: str
-    position_size: float
+    position_size: float  # signed: negative for shorts
     entry_price: float
     current_price: float
     unrealized_pnl: float
@@ -47,6 +87,22 @@ class PositionRisk:
 class RiskManager:
     """Professional risk management system."""
     
+    # Hourly P&L entries kept (30 days * 24 hours)
+    PNL_HISTORY_SIZE = 720
+    
+    # Risk score cut-offs: below the first is LOW, at or above the last is CRITICAL
+    RISK_SCORE_THRESHOLDS = (30.0, 60.0, 80.0)
+    RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+    
+    # Per-position close rules: unrealized P&L as a fraction of the account
+    # balance, and the per-position risk percentage cap
+    STOP_LOSS_FRACTION = 0.02
+    TAKE_PROFIT_FRACTION = 0.04
+    MAX_POSITION_RISK = 0.05
+    
+    # Reason per close_codes result; code 0 means keep the position
+    CLOSE_REASONS = (None, "Stop loss triggered", "Take profit reached", "Position risk too high")
+    
     def __init__(
         self,
         max_position_size: float = 0.1,  # 10% of account per position
@@ -64,20 +120,82 @@ class RiskManager:
         self.risk_free_rate = risk_free_rate
         
         self.logger = get_logger("risk_manager")
-        self.daily_pnl_history: List[float] = []
+        
+        # Hourly P&L ring buffer: next write slot and number of filled slots
+        self._pnl_buf = np.zeros(self.PNL_HISTORY_SIZE, dtype=np.float64)
+        self._pnl_head = 0
+        self._pnl_len = 0
+        
         self.positions: Dict[str, PositionRisk] = {}
         self.account_balance: float = 0.0
         self.initial_balance: float = 0.0
+        # Highest equity (balance + unrealized P&L) seen so far; drawdown is measured from it
+        self.peak_balance: float = 0.0
+        
+        # P&L thresholds of should_close_position, refreshed with the balance
+        self._stop_loss_pnl = 0.0
+        self._take_profit_pnl = 0.0
+        
+        # Position numbers mirrored into parallel arrays, one slot per tracked
+        # symbol (first self._n entries), so portfolio totals are vectorized
+        self._n = 0
+        self._symbols: List[str] = []
+        self._idx: Dict[str, int] = {}
+        self._size = np.zeros(16, dtype=np.float64)
+        self._price = np.zeros(16, dtype=np.float64)
+        self._entry = np.zeros(16, dtype=np.float64)
+        self._upnl = np.zeros(16, dtype=np.float64)
+        self._risk = np.zeros(16, dtype=np.float64)
+        
+        # Running sums of size * price and unrealized P&L over tracked positions
+        self._exposure_total = 0.0
+        self._upnl_total = 0.0
+        
+        # Bumped by every mutator; cached risk level is valid for one version
+        self._version = 0
+        self._risk_level_cache: Optional[Tuple[int, RiskLevel]] = None
+        
+        # (epoch second, ISO string) reused by reports generated within the same second
+        self._report_ts: Tuple[int, str] = (-1, '')
         
     def set_account_balance(self, balance: float) -> None:
         """Set account balance."""
+        self._version += 1
         if self.initial_balance == 0.0:
             self.initial_balance = balance
         self.account_balance = balance
+        self._stop_loss_pnl = -balance * self.STOP_LOSS_FRACTION
+        self._take_profit_pnl = balance * self.TAKE_PROFIT_FRACTION
+        self._track_peak()
     
     def add_position(self, position: PositionRisk) -> None:
         """Add a position to risk tracking."""
-        self.positions[position.symbol] = position
+        self._version += 1
+        # Interned keys let later lookups with the same interned symbol match on identity
+        symbol = sys.intern(position.symbol)
+        self.positions[symbol] = position
+        
+        idx = self._idx.get(symbol)
+        if idx is None:
+            idx = self._n
+            if idx == len(self._size):
+                self._grow()
+            self._symbols.append(symbol)
+            self._idx[symbol] = idx
+            self._n += 1
+        else:
+            self._exposure_total -= self._size[idx] * self._price[idx]
+            self._upnl_total -= self._upnl[idx]
+        
+        self._exposure_total += position.position_size * position.current_price
+        self._upnl_total += position.unrealized_pnl
+        
+        self._size[idx] = position.position_size
+        self._price[idx] = position.current_price
+        self._entry[idx] = position.entry_price
+        self._upnl[idx] = position.unrealized_pnl
+        self._risk[idx] = position.risk_percentage
+        self._track_peak()
         self.logger.info(
             f"Position added to risk tracking",
             extra={
@@ -89,17 +207,87 @@ class RiskManager:
     
     def remove_position(self, symbol: str) -> None:
         """Remove position from risk tracking."""
+        self._version += 1
         if symbol in self.positions:
             del self.positions[symbol]
+            
+            # Move the last slot into the freed one
+            idx = self._idx.pop(symbol)
+            self._exposure_total -= self._size[idx] * self._price[idx]
+            self._upnl_total -= self._upnl[idx]
+            last = self._n - 1
+            last_symbol = self._symbols.pop()
+            if idx != last:
+                for arr in (self._size, self._price, self._entry, self._upnl, self._risk):
+                    arr[idx] = arr[last]
+                self._symbols[idx] = last_symbol
+                self._idx[last_symbol] = idx
+            self._n = last
+            
+            # Nothing left to drift against
+            if last == 0:
+                self._exposure_total = 0.0
+                self._upnl_total = 0.0
+            
             self.logger.info(f"Position removed from risk tracking: {symbol}")
     
+    def _grow(self) -> None:
+        """Double the capacity of the position arrays."""
+        self._size = np.concatenate([self._size, np.zeros_like(self._size)])
+        self._price = np.concatenate([self._price, np.zeros_like(self._price)])
+        self._entry = np.concatenate([self._entry, np.zeros_like(self._entry)])
+        self._upnl = np.concatenate([self._upnl, np.zeros_like(self._upnl)])
+        self._risk = np.concatenate([self._risk, np.zeros_like(self._risk)])
+    
+    def _track_peak(self) -> None:
+        """Raise the equity high-water mark if current equity exceeds it."""
+        equity = self.account_balance + self._upnl_total
+        if equity > self.peak_balance:
+            self.peak_balance = equity
+    
     def update_position(self, symbol: str, current_price: float) -> None:
         """Update position with current price."""
+        self._version += 1
         if symbol in self.positions:
             position = self.positions[symbol]
             position.current_price = current_price
             position.unrealized_pnl = self._calculate_pnl(position)
-            position.risk_percentage = abs(position.unrealized_pnl) / self.account_balance
+            position.risk_percentage = (
+                abs(position.unrealized_pnl) / self.account_balance if self.account_balance > 0 else 0.0
+            )
+            
+            idx = self._idx[symbol]
+            self._exposure_total += self._size[idx] * (current_price - self._price[idx])
+            self._upnl_total += position.unrealized_pnl - self._upnl[idx]
+            self._price[idx] = current_price
+            self._upnl[idx] = position.unrealized_pnl
+            self._risk[idx] = position.risk_percentage
+            self._track_peak()
+    
+    def update_prices(self, prices: Dict[str, float]) -> None:
+        """Update many positions with current prices in one compiled pass."""
+        self._version += 1
+        symbols = [symbol for symbol in prices if symbol in self._idx]
+        if not symbols:
+            return
+        
+        rows = np.fromiter((self._idx[symbol] for symbol in symbols), dtype=np.int64, count=len(symbols))
+        new_prices = np.fromiter((prices[symbol] for symbol in symbols), dtype=np.float64, count=len(symbols))
+        d_exposure, d_upnl = tick_update(
+            rows, new_prices, self._size, self._entry,
+            self._price, self._upnl, self._risk, self.account_balance
+        )
+        self._exposure_total += d_exposure
+        self._upnl_total += d_upnl
+        self._track_peak()
+        
+        for symbol, price, pnl, risk in zip(
+            symbols, new_prices.tolist(), self._upnl[rows].tolist(), self._risk[rows].tolist()
+        ):
+            position = self.positions[symbol]
+            position.current_price = price
+            position.unrealized_pnl = pnl
+            position.risk_percentage = risk
     
     def calculate_position_size(
         self,
@@ -137,37 +325,74 @@ class RiskManager:
         
         return final_position_size
     
-    def check_risk_limits(self, new_position_size: float, symbol: str) -> Tuple[bool, List[str]]:
-        """Check if new position violates risk limits."""
+    def check_risk_limits(
+        self,
+        new_position_size: float,
+        symbol: str
+    ) -> Tuple[bool, List[Tuple[ViolationCode, float]]]:
+        """
+        Check if new position violates risk limits.
+        
+        Violations are ``(code, limit)`` pairs, percentages for fractional
+        limits; ``format_violation`` renders one as a message.
+        """
         violations = []
         
         # Check maximum position size
         position_value = new_position_size * self._get_current_price(symbol)
         if position_value > self.account_balance * self.max_position_size:
-            violations.append(f"Position size exceeds maximum allowed ({self.max_position_size * 100}%)")
+            violations.append((ViolationCode.POSITION_SIZE, self.max_position_size * 100))
         
         # Check maximum total exposure
         current_exposure = self._calculate_total_exposure()
         new_exposure = current_exposure + position_value
         if new_exposure > self.account_balance * self.max_total_exposure:
-            violations.append(f"Total exposure would exceed maximum allowed ({self.max_total_exposure * 100}%)")
+            violations.append((ViolationCode.TOTAL_EXPOSURE, self.max_total_exposure * 100))
         
         # Check maximum number of positions
         if len(self.positions) >= self.max_positions:
-            violations.append(f"Maximum number of positions reached ({self.max_positions})")
+            violations.append((ViolationCode.MAX_POSITIONS, self.max_positions))
         
         # Check daily loss limit
         daily_pnl = self._calculate_daily_pnl()
         if daily_pnl < -self.account_balance * self.max_daily_loss:
-            violations.append(f"Daily loss limit exceeded ({self.max_daily_loss * 100}%)")
+            violations.append((ViolationCode.DAILY_LOSS, self.max_daily_loss * 100))
         
         # Check maximum drawdown
         current_drawdown = self._calculate_drawdown()
         if current_drawdown > self.max_drawdown:
-            violations.append(f"Maximum drawdown exceeded ({self.max_drawdown * 100}%)")
+            violations.append((ViolationCode.DRAWDOWN, self.max_drawdown * 100))
         
         return len(violations) == 0, violations
     
+    def check_risk_limits_batch(self, sizes: np.ndarray, symbols: List[str]) -> np.ndarray:
+        """
+        Screen many candidate positions against the risk limits at once.
+        
+        Each candidate is judged on its own against the current portfolio,
+        as ``check_risk_limits`` would judge it; returns a boolean array that
+        is True where a candidate violates no limit.
+        """
+        sizes = np.asarray(sizes, dtype=np.float64)
+        prices = np.fromiter(
+            (self._get_current_price(symbol) for symbol in symbols), dtype=np.float64, count=len(symbols)
+        )
+        position_values = sizes * prices
+        
+        ok = position_values <= self.account_balance * self.max_position_size
+        ok &= self._calculate_total_exposure() + position_values <= self.account_balance * self.max_total_exposure
+        
+        # Portfolio-wide limits apply to every candidate alike
+        portfolio_ok = (
+            len(self.positions) < self.max_positions
+            and self._calculate_daily_pnl() >= -self.account_balance * self.max_daily_loss
+            and self._calculate_drawdown() <= self.max_drawdown
+        )
+        if not portfolio_ok:
+            ok[:] = False
+        
+        return ok
+    
     def calculate_risk_metrics(self) -> RiskMetrics:
         """Calculate comprehensive risk metrics."""
         total_exposure = self._calculate_total_exposure()
@@ -178,14 +403,7 @@ class RiskManager:
         risk_score = self._calculate_risk_score(total_exposure, daily_pnl, drawdown)
         
         # Determine risk level
-        if risk_score < 30:
-            risk_level = RiskLevel.LOW
-        elif risk_score < 60:
-            risk_level = RiskLevel.MEDIUM
-        elif risk_score < 80:
-            risk_level = RiskLevel.HIGH
-        else:
-            risk_level = RiskLevel.CRITICAL
+        risk_level = self.RISK_LEVELS[bisect_right(self.RISK_SCORE_THRESHOLDS, risk_score)]
         
         return RiskMetrics(
             total_exposure=total_exposure,
@@ -196,53 +414,67 @@ class RiskManager:
             risk_level=risk_level
         )
     
+    def get_risk_level_fast(self) -> RiskLevel:
+        """Current risk level, recomputed only after risk state has changed."""
+        cache = self._risk_level_cache
+        if cache is not None and cache[0] == self._version:
+            return cache[1]
+        
+        risk_level = self.calculate_risk_metrics().risk_level
+        self._risk_level_cache = (self._version, risk_level)
+        return risk_level
+    
     def should_close_position(self, symbol: str) -> Tuple[bool, str]:
         """Determine if a position should be closed due to risk management."""
-        if symbol not in self.positions:
+        position = self.positions.get(symbol)
+        if position is None:
             return False, "Position not found"
         
-        position = self.positions[symbol]
-        
         # Check if position has exceeded stop loss
-        if position.unrealized_pnl < -self.account_balance * 0.02:  # 2% stop loss
+        pnl = position.unrealized_pnl
+        if pnl < self._stop_loss_pnl:
             return True, "Stop loss triggered"
         
         # Check if position has reached take profit
-        if position.unrealized_pnl > self.account_balance * 0.04:  # 4% take profit
+        if pnl > self._take_profit_pnl:
             return True, "Take profit reached"
         
         # Check if position is too risky
-        if position.risk_percentage > 0.05:  # 5% risk per position
+        if position.risk_percentage > self.MAX_POSITION_RISK:
             return True, "Position risk too high"
         
         return False, "Position within risk limits"
     
+    def positions_to_close(self) -> Dict[str, str]:
+        """
+        Every tracked position ``should_close_position`` would close, with
+        its reason, found in one compiled pass over the position arrays.
+        """
+        n = self._n
+        codes = close_codes(
+            self._upnl[:n], self._risk[:n],
+            self._stop_loss_pnl, self._take_profit_pnl, self.MAX_POSITION_RISK
+        )
+        return {self._symbols[i]: self.CLOSE_REASONS[codes[i]] for i in np.flatnonzero(codes).tolist()}
+    
     def _calculate_total_exposure(self) -> float:
         """Calculate total exposure across all positions."""
-        total = 0.0
-        for position in self.positions.values():
-            total += position.position_size * position.current_price
-        return total
+        return float(self._exposure_total)
     
     def _calculate_daily_pnl(self) -> float:
         """Calculate daily P&L."""
-        if not self.daily_pnl_history:
+        # Last 24 hours, which may wrap around the end of the ring buffer
+        k = min(self._pnl_len, 24)
+        if k == 0:
             return 0.0
-        return sum(self.daily_pnl_history[-24:])  # Last 24 hours
+        start = self._pnl_head - k
+        if start >= 0:
+            return float(self._pnl_buf[start:self._pnl_head].sum())
+        return float(self._pnl_buf[start:].sum() + self._pnl_buf[:self._pnl_head].sum())
     
     def _calculate_drawdown(self) -> float:
-        """Calculate maximum drawdown."""
-        if self.initial_balance == 0:
-            return 0.0
-        
-        current_balance = self.account_balance + sum(
-            pos.unrealized_pnl for pos in self.positions.values()
-        )
-        
-        if current_balance >= self.initial_balance:
-            return 0.0
-        
-        return (self.initial_balance - current_balance) / self.initial_balance
+        """Calculate drawdown of current equity from its peak."""
+        return drawdown_kernel(self.peak_balance, self.account_balance, float(self._upnl_total))
     
     def _calculate_risk_score(
         self,
@@ -251,28 +483,11 @@ class RiskManager:
         drawdown: float
     ) -> float:
         """Calculate overall risk score (0-100)."""
-        score = 0.0
-        
-        # Exposure score (0-30 points)
-        exposure_ratio = total_exposure / self.account_balance if self.account_balance > 0 else 0
-        score += min(30, exposure_ratio * 100)
-        
-        # Daily P&L score (0-30 points)
-        if daily_pnl < 0:
-            pnl_ratio = abs(daily_pnl) / self.account_balance if self.account_balance > 0 else 0
-            score += min(30, pnl_ratio * 100)
-        
-        # Drawdown score (0-40 points)
-        score += min(40, drawdown * 100)
-        
-        return min(100, score)
+        return risk_score_kernel(total_exposure, self.account_balance, daily_pnl, drawdown)
     
     def _calculate_pnl(self, position: PositionRisk) -> float:
-        """Calculate P&L for a position."""
-        if position.position_size > 0:  # Long position
-            return (position.current_price - position.entry_price) * position.position_size
-        else:  # Short position
-            return (position.entry_price - position.current_price) * abs(position.position_size)
+        """Calculate P&L for a position (size is negative for shorts)."""
+        return pnl_kernel(position.position_size, position.entry_price, position.current_price)
     
     def _get_current_price(self, symbol: str) -> float:
         """Get current price for symbol (placeholder)."""
@@ -281,20 +496,40 @@ class RiskManager:
     
     def update_daily_pnl(self, pnl: float) -> None:
         """Update daily P&L history."""
-        self.daily_pnl_history.append(pnl)
-        
-        # Keep only last 30 days of history
-        if len(self.daily_pnl_history) > 720:  # 30 days * 24 hours
-            self.daily_pnl_history = self.daily_pnl_history[-720:]
+        self._version += 1
+        self._pnl_buf[self._pnl_head] = pnl
+        self._pnl_head = (self._pnl_head + 1) % self.PNL_HISTORY_SIZE
+        self._pnl_len = min(self._pnl_len + 1, self.PNL_HISTORY_SIZE)
     
-    def get_risk_report(self) -> Dict[str, Any]:
-        """Generate comprehensive risk report."""
+    @property
+    def daily_pnl_history(self) -> List[float]:
+        """P&L history, oldest first (last 30 days)."""
+        if self._pnl_len < self.PNL_HISTORY_SIZE:
+            return self._pnl_buf[:self._pnl_len].tolist()
+        return np.roll(self._pnl_buf, -self._pnl_head).tolist()
+    
+    def _report_timestamp(self) -> str:
+        """UTC ISO timestamp at one-second resolution, formatted once per second."""
+        second = int(time.time())
+        if second != self._report_ts[0]:
+            self._report_ts = (second, datetime.utcfromtimestamp(second).isoformat())
+        return self._report_ts[1]
+    
+    def get_risk_report(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate comprehensive risk report.
+        
+        Callers that already hold a timestamp for the current tick can pass it
+        in; otherwise the report is stamped with the current UTC second.
+        """
         metrics = self.calculate_risk_metrics()
+        n = self._n
         
         return {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': timestamp if timestamp is not None else self._report_timestamp(),
             'account_balance': self.account_balance,
             'initial_balance': self.initial_balance,
+            'peak_balance': self.peak_balance,
             'total_exposure': metrics.total_exposure,
             'exposure_percentage': (metrics.total_exposure / self.account_balance * 100) if self.account_balance > 0 else 0,
             'daily_pnl': metrics.daily_pnl,
@@ -302,15 +537,23 @@ class RiskManager:
             'position_count': metrics.position_count,
             'risk_score': metrics.risk_score,
             'risk_level': metrics.risk_level.value,
+            # Read from the position arrays, column by column
             'positions': [
                 {
-                    'symbol': pos.symbol,
-                    'size': pos.position_size,
-                    'entry_price': pos.entry_price,
-                    'current_price': pos.current_price,
-                    'unrealized_pnl': pos.unrealized_pnl,
-                    'risk_percentage': pos.risk_percentage
+                    'symbol': symbol,
+                    'size': size,
+                    'entry_price': entry_price,
+                    'current_price': current_price,
+                    'unrealized_pnl': unrealized_pnl,
+                    'risk_percentage': risk_percentage
                 }
-                for pos in self.positions.values()
+                for symbol, size, entry_price, current_price, unrealized_pnl, risk_percentage in zip(
+                    self._symbols,
+                    self._size[:n].tolist(),
+                    self._entry[:n].tolist(),
+                    self._price[:n].tolist(),
+                    self._upnl[:n].tolist(),
+                    self._risk[:n].tolist()
+                )
             ]
         }
@@ -2,20 +2,36 @@
 Professional signal processing system.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
+import logging
+
+import numpy as np
 
 from ..core.exceptions import TradingError
 from ..core.logging import get_logger, TradeLogger
 from ..core.config import TradingConfig
 from ..strategies.base import StrategyResult, SignalType
-from .risk_manager import RiskManager
+from .risk_manager import RiskManager, RiskLevel
 from .position_manager import PositionManager
 
 
+SIG_BUY, SIG_SELL, SIG_HOLD = 0, 1, 2
+
+_SIGNAL_CODES = {
+    SignalType.BUY: SIG_BUY,
+    SignalType.SELL: SIG_SELL,
+    SignalType.HOLD: SIG_HOLD,
+}
+_SIGNAL_NAMES = tuple(signal.value for signal in _SIGNAL_CODES)
+
+
 class SignalProcessor:
     """Professional signal processing system."""
     
+    SIGNAL_HISTORY_SIZE = 100
+    INITIAL_SYMBOL_CAPACITY = 16
+    
     def __init__(
         self,
         config: TradingConfig,
@@ -29,7 +45,18 @@ class SignalProcessor:
         
         # Signal processing state
         self.last_signals: Dict[str, StrategyResult] = {}
-        self.signal_history: Dict[str, list] = {}
+        
+        # Signal history: one ring-buffer row per symbol in shared matrices,
+        # so quality metrics reduce over every symbol in one pass
+        rows, cols = self.INITIAL_SYMBOL_CAPACITY, self.SIGNAL_HISTORY_SIZE
+        self._symbol_to_row: Dict[str, int] = {}
+        self._row_to_symbol: list = []
+        self._ts_mat = np.zeros((rows, cols), dtype=np.int64)
+        self._conf_mat = np.zeros((rows, cols), dtype=np.float64)
+        self._sig_mat = np.zeros((rows, cols), dtype=np.uint8)
+        self._price_mat = np.zeros((rows, cols), dtype=np.float64)
+        self._head = np.zeros(rows, dtype=np.int32)
+        self._len = np.zeros(rows, dtype=np.int32)
         
         # Performance tracking
         self.signals_processed = 0
@@ -45,30 +72,28 @@ class SignalProcessor:
         try:
             self.signals_processed += 1
             
+            signal = signal_result.signal
+            confidence = signal_result.confidence
+            price = market_data.close[-1]
+            
             # Log signal
             self.trade_logger.log_trade_signal(
                 symbol=symbol,
-                direction=signal_result.signal.value,
-                price=market_data.close[-1],
+                direction=signal.value,
+                price=price,
                 strategy=self.config.strategy,
-                confidence=signal_result.confidence,
-                metadata=signal_result.metadata
+                confidence=confidence,
+                metadata=signal_result.metadata_dict()
             )
             
-            # Store signal history
-            if symbol not in self.signal_history:
-                self.signal_history[symbol] = []
-            
-            self.signal_history[symbol].append({
-                'timestamp': market_data.timestamp[-1],
-                'signal': signal_result.signal.value,
-                'confidence': signal_result.confidence,
-                'price': market_data.close[-1]
-            })
-            
-            # Keep only last 100 signals per symbol
-            if len(self.signal_history[symbol]) > 100:
-                self.signal_history[symbol] = self.signal_history[symbol][-100:]
+            # Store signal history (ring buffer keeps the last SIGNAL_HISTORY_SIZE)
+            self._record_signal(
+                symbol,
+                market_data.timestamp[-1],
+                confidence,
+                _SIGNAL_CODES[signal],
+                price
+            )
             
             # Check if we should act on this signal
             if await self._should_act_on_signal(symbol, signal_result):
@@ -86,37 +111,62 @@ class SignalProcessor:
             self.logger.error(f"Error processing signal for {symbol}: {e}")
             return None
     
+    async def process_signals(
+        self,
+        batch: Dict[str, Tuple[StrategyResult, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Process signals for several symbols concurrently.
+        
+        ``batch`` maps each symbol to its ``(signal_result, market_data)`` pair;
+        results come back in the batch's order. Only awaits inside
+        ``_execute_signal`` (e.g. order placement through the async API client)
+        overlap; CPU-bound work still runs one symbol at a time.
+        """
+        return await asyncio.gather(*(
+            self.process_signal(symbol, signal_result, market_data)
+            for symbol, (signal_result, market_data) in batch.items()
+        ))
+    
     async def _should_act_on_signal(
         self,
         symbol: str,
         signal_result: StrategyResult
     ) -> bool:
-        """Determine if we should act on a signal."""
+        """
+        Determine if we should act on a signal.
+        
+        Guards run cheapest first so the common reject paths never touch the
+        risk manager's metrics.
+        """
         try:
             # Check minimum confidence threshold
-            if signal_result.confidence < self.config.trading_threshold:
+            confidence = signal_result.confidence
+            threshold = self.config.trading_threshold
+            if confidence < threshold:
                 self.logger.debug(
-                    f"Signal confidence {signal_result.confidence} below threshold {self.config.trading_threshold} for {symbol}"
+                    "Signal confidence %s below threshold %s for %s",
+                    confidence, threshold, symbol
                 )
                 return False
             
-            # Check if signal is different from last signal
-            if symbol in self.last_signals:
-                last_signal = self.last_signals[symbol]
-                if (last_signal.signal == signal_result.signal and
-                    abs(last_signal.confidence - signal_result.confidence) < 0.1):
-                    self.logger.debug(f"Signal unchanged for {symbol}")
-                    return False
+            # Check if we already have a position for this symbol
+            risk_manager = self.risk_manager
+            if symbol in risk_manager.positions:
+                self.logger.debug("Already have position for %s", symbol)
+                return False
             
-            # Check risk limits
-            risk_report = self.risk_manager.get_risk_report()
-            if risk_report['risk_level'] in ['high', 'critical']:
-                self.logger.warning(f"Risk level too high to act on signal for {symbol}")
+            # Check if signal is different from last signal
+            last_signal = self.last_signals.get(symbol)
+            if (last_signal is not None and
+                last_signal.signal is signal_result.signal and
+                abs(last_signal.confidence - confidence) < 0.1):
+                self.logger.debug("Signal unchanged for %s", symbol)
                 return False
             
-            # Check if we already have a position for this symbol
-            if symbol in self.risk_manager.positions:
-                self.logger.debug(f"Already have position for {symbol}")
+            # Check risk limits
+            if risk_manager.get_risk_level_fast() in (RiskLevel.HIGH, RiskLevel.CRITICAL):
+                self.logger.warning("Risk level too high to act on signal for %s", symbol)
                 return False
             
             return True
@@ -136,15 +186,17 @@ class SignalProcessor:
             # This would typically involve calling the position manager
             # For now, we'll just log the execution
             
-            self.logger.info(
-                f"Executing signal for {symbol}",
-                extra={
-                    'symbol': symbol,
-                    'signal': signal_result.signal.value,
-                    'confidence': signal_result.confidence,
-                    'price': market_data.close[-1]
-                }
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Executing signal for %s",
+                    symbol,
+                    extra={
+                        'symbol': symbol,
+                        'signal': signal_result.signal.value,
+                        'confidence': signal_result.confidence,
+                        'price': market_data.close[-1]
+                    }
+                )
             
             # In a real implementation, this would:
             # 1. Calculate position size based on risk management
@@ -163,9 +215,69 @@ class SignalProcessor:
             self.logger.error(f"Error executing signal for {symbol}: {e}")
             return None
     
+    def _record_signal(
+        self,
+        symbol: str,
+        timestamp: int,
+        confidence: float,
+        signal_code: int,
+        price: float
+    ) -> None:
+        """Write a signal into the symbol's ring, overwriting the oldest when full."""
+        row = self._symbol_to_row.get(symbol)
+        if row is None:
+            row = len(self._row_to_symbol)
+            if row == self._len.shape[0]:
+                self._grow_history()
+            self._row_to_symbol.append(symbol)
+            self._symbol_to_row[symbol] = row
+        
+        col = self._head[row]
+        self._ts_mat[row, col] = timestamp
+        self._conf_mat[row, col] = confidence
+        self._sig_mat[row, col] = signal_code
+        self._price_mat[row, col] = price
+        
+        self._head[row] = (col + 1) % self.SIGNAL_HISTORY_SIZE
+        if self._len[row] < self.SIGNAL_HISTORY_SIZE:
+            self._len[row] += 1
+    
+    def _grow_history(self) -> None:
+        """Double the number of symbol rows in the history matrices."""
+        self._ts_mat = np.concatenate([self._ts_mat, np.zeros_like(self._ts_mat)])
+        self._conf_mat = np.concatenate([self._conf_mat, np.zeros_like(self._conf_mat)])
+        self._sig_mat = np.concatenate([self._sig_mat, np.zeros_like(self._sig_mat)])
+        self._price_mat = np.concatenate([self._price_mat, np.zeros_like(self._price_mat)])
+        self._head = np.concatenate([self._head, np.zeros_like(self._head)])
+        self._len = np.concatenate([self._len, np.zeros_like(self._len)])
+    
+    def _remove_history(self, symbol: str) -> None:
+        """Drop a symbol's row, moving the last row into the freed one."""
+        row = self._symbol_to_row.pop(symbol)
+        last = len(self._row_to_symbol) - 1
+        last_symbol = self._row_to_symbol.pop()
+        if row != last:
+            for arr in (
+                self._ts_mat, self._conf_mat, self._sig_mat,
+                self._price_mat, self._head, self._len
+            ):
+                arr[row] = arr[last]
+            self._row_to_symbol[row] = last_symbol
+            self._symbol_to_row[last_symbol] = row
+        self._head[last] = 0
+        self._len[last] = 0
+    
+    def _history_order(self, row: int) -> np.ndarray:
+        """Column indices of a symbol's stored signals, oldest first."""
+        length = int(self._len[row])
+        start = (int(self._head[row]) - length) % self.SIGNAL_HISTORY_SIZE
+        return (start + np.arange(length)) % self.SIGNAL_HISTORY_SIZE
+    
     def get_signal_statistics(self) -> Dict[str, Any]:
         """Get signal processing statistics."""
-        total_signals = sum(len(signals) for signals in self.signal_history.values())
+        count = len(self._row_to_symbol)
+        lengths = self._len[:count].tolist()
+        total_signals = sum(lengths)
         
         return {
             'signals_processed': self.signals_processed,
@@ -175,19 +287,31 @@ class SignalProcessor:
                 if self.signals_processed > 0 else 0
             ),
             'total_signals': total_signals,
-            'symbols_tracked': len(self.signal_history),
-            'signals_per_symbol': {
-                symbol: len(signals)
-                for symbol, signals in self.signal_history.items()
-            }
+            'symbols_tracked': count,
+            'signals_per_symbol': dict(zip(self._row_to_symbol, lengths))
         }
     
     def get_signal_history(self, symbol: str, limit: int = 50) -> list:
         """Get signal history for a symbol."""
-        if symbol not in self.signal_history:
+        row = self._symbol_to_row.get(symbol)
+        if row is None or limit <= 0:
             return []
         
-        return self.signal_history[symbol][-limit:]
+        cols = self._history_order(row)[-limit:]
+        return [
+            {
+                'timestamp': ts,
+                'signal': _SIGNAL_NAMES[sig],
+                'confidence': conf,
+                'price': price
+            }
+            for ts, sig, conf, price in zip(
+                self._ts_mat[row, cols].tolist(),
+                self._sig_mat[row, cols].tolist(),
+                self._conf_mat[row, cols].tolist(),
+                self._price_mat[row, cols].tolist()
+            )
+        ]
     
     def get_last_signal(self, symbol: str) -> Optional[StrategyResult]:
         """Get the last signal for a symbol."""
@@ -196,12 +320,15 @@ class SignalProcessor:
     def clear_signal_history(self, symbol: Optional[str] = None) -> None:
         """Clear signal history."""
         if symbol:
-            if symbol in self.signal_history:
-                del self.signal_history[symbol]
+            if symbol in self._symbol_to_row:
+                self._remove_history(symbol)
             if symbol in self.last_signals:
                 del self.last_signals[symbol]
         else:
-            self.signal_history.clear()
+            self._symbol_to_row.clear()
+            self._row_to_symbol.clear()
+            self._head[:] = 0
+            self._len[:] = 0
             self.last_signals.clear()
         
         self.logger.info(f"Cleared signal history for {symbol or 'all symbols'}")
@@ -211,33 +338,55 @@ class SignalProcessor:
         try:
             quality_metrics = {}
             
-            for symbol, signals in self.signal_history.items():
-                if not signals:
+            count = len(self._row_to_symbol)
+            if not count:
+                return quality_metrics
+            
+            size = self.SIGNAL_HISTORY_SIZE
+            lengths = self._len[:count]
+            # Rows fill from column 0, so the first `length` slots are the valid ones
+            valid = np.arange(size) < lengths[:, None]
+            sig = self._sig_mat[:count]
+            
+            # Calculate average confidence
+            safe_lengths = np.maximum(lengths, 1)
+            avg_confidence = np.where(valid, self._conf_mat[:count], 0.0).sum(axis=1) / safe_lengths
+            
+            # Calculate signal frequency from the oldest and newest timestamps
+            rows = np.arange(count)
+            heads = self._head[:count]
+            first = self._ts_mat[rows, (heads - lengths) % size]
+            last = self._ts_mat[rows, (heads - 1) % size]
+            time_span = (last - first) / 3600
+            frequency = np.divide(
+                lengths, time_span,
+                out=np.zeros(count), where=(lengths > 1) & (time_span != 0)
+            )  # signals per hour
+            
+            # Calculate signal consistency
+            buy_signals = ((sig == SIG_BUY) & valid).sum(axis=1)
+            sell_signals = ((sig == SIG_SELL) & valid).sum(axis=1)
+            consistency = np.maximum(buy_signals, sell_signals) / safe_lengths
+            
+            for symbol, length, avg, freq, cons, buys, sells in zip(
+                self._row_to_symbol,
+                lengths.tolist(),
+                avg_confidence.tolist(),
+                frequency.tolist(),
+                consistency.tolist(),
+                buy_signals.tolist(),
+                sell_signals.tolist()
+            ):
+                if not length:
                     continue
                 
-                # Calculate average confidence
-                avg_confidence = sum(s['confidence'] for s in signals) / len(signals)
-                
-                # Calculate signal frequency
-                if len(signals) > 1:
-                    time_span = signals[-1]['timestamp'] - signals[0]['timestamp']
-                    frequency = len(signals) / (time_span / 3600)  # signals per hour
-                else:
-                    frequency = 0
-                
-                # Calculate signal consistency
-                signal_types = [s['signal'] for s in signals]
-                buy_signals = signal_types.count('buy')
-                sell_signals = signal_types.count('sell')
-                consistency = max(buy_signals, sell_signals) / len(signals)
-                
                 quality_metrics[symbol] = {
-                    'avg_confidence': avg_confidence,
-                    'frequency': frequency,
-                    'consistency': consistency,
-                    'total_signals': len(signals),
-                    'buy_signals': buy_signals,
-                    'sell_signals': sell_signals
+                    'avg_confidence': avg,
+                    'frequency': freq,
+                    'consistency': cons,
+                    'total_signals': length,
+                    'buy_signals': buys,
+                    'sell_signals': sells
                 }
             
             return quality_metrics
@@ -3,23 +3,41 @@ Professional trading engine for the Binance Trading Bot.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Any
+from datetime import datetime
+
+import numpy as np
 
 from ..core.exceptions import TradingBotError, TradingError
 from ..core.logging import get_logger, TradeLogger
 from ..core.config import TradingConfig
 from ..api.client import BinanceAPIClient
 from ..strategies.registry import strategy_registry
+from ..strategies.base import SignalType, StrategyResult
+from ..strategies import _kernels as indicator_kernels
+from . import _kernels as risk_kernels
 from .risk_manager import RiskManager
 from .position_manager import PositionManager
 from .signal_processor import SignalProcessor
 
 
+_HOLD = SignalType.HOLD
+
+
 class TradingEngine:
     """Professional trading engine with comprehensive risk management."""
     
+    # REST requests kept in flight at once during startup
+    REQUESTS_PER_BATCH = 20
+    
+    # Seconds to collect closed klines into one signal batch
+    SIGNAL_BATCH_WINDOW = 0.25
+    
+    # Seconds before a dead stream or signal task is restarted
+    TASK_RESTART_DELAY = 5.0
+    
     def __init__(
         self,
         api_client: BinanceAPIClient,
@@ -50,17 +68,34 @@ class TradingEngine:
             risk_manager=self.risk_manager
         )
         
-        # Initialize strategy
+        # Initialize strategy. This instance only runs generate_signals_batch,
+        # which leaves the instance's state alone; each symbol gets its own
+        # instance for indicators and full signals, since update_indicators
+        # and calculate_indicators keep per-series state between calls
         self.strategy = strategy_registry.get_strategy(
             config.strategy,
             self._get_strategy_parameters()
         )
+        self._symbol_strategies: Dict[str, Any] = {}
         
         # State management
         self.is_running = False
         self.symbols_to_trade: List[str] = []
         self.market_data: Dict[str, Any] = {}
         
+        # Indicator kernels release the GIL, so per-symbol indicator updates
+        # run on these threads in parallel and off the event loop
+        self._indicator_pool = ThreadPoolExecutor(thread_name_prefix="indicators")
+        
+        # Combined kline stream tasks plus the batch signal task, the symbols with
+        # a newly closed kline, and the ring-buffer capacity of each symbol's
+        # MarketData
+        self._signal_tasks: List[asyncio.Task] = []
+        self._pending_symbols = set()
+        self._pending_event = asyncio.Event()
+        
+        self._buffer_size = max(200, self.strategy.get_required_buffer_size())
+        
         # Logging
         self.logger = get_logger("trading_engine")
         self.trade_logger = TradeLogger(self.logger)
@@ -85,9 +120,15 @@ class TradingEngine:
             # Get symbols to trade
             await self._initialize_symbols()
             
+            # Set leverage once the symbol list is known
+            await self._initialize_leverage()
+            
             # Start market data collection
             await self._start_market_data_collection()
             
+            # Compile numeric kernels before the first signal tick needs them
+            await self._warmup_kernels()
+            
             # Start signal processing
             await self._start_signal_processing()
             
@@ -117,6 +158,10 @@ class TradingEngine:
             
             self.is_running = False
             
+            for task in self._signal_tasks:
+                task.cancel()
+            self._signal_tasks.clear()
+            
             # Close all positions if configured
             if self.config.use_market_orders:
                 await self._close_all_positions()
@@ -124,13 +169,15 @@ class TradingEngine:
             # Generate final report
             await self._generate_performance_report()
             
+            self._indicator_pool.shutdown(wait=False)
+            
             self.logger.info("Trading engine stopped successfully")
             
         except Exception as e:
             self.logger.error(f"Error stopping trading engine: {e}")
     
     async def _initialize_account(self) -> None:
-        """Initialize account and set leverage."""
+        """Initialize account."""
         try:
             # Get account information
             account_info = await self.api_client.get_account_info()
@@ -145,14 +192,6 @@ class TradingEngine:
                 }
             )
             
-            # Set leverage for all symbols
-            for symbol in self.symbols_to_trade:
-                try:
-                    await self.api_client.set_leverage(symbol, self.config.leverage)
-                    self.logger.info(f"Set leverage {self.config.leverage}x for {symbol}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to set leverage for {symbol}: {e}")
-            
         except Exception as e:
             raise TradingError(f"Failed to initialize account: {e}")
     
@@ -162,29 +201,53 @@ class TradingEngine:
             if self.config.trade_all_symbols:
                 # Get all available symbols
                 exchange_info = await self.api_client.get_exchange_info()
-                self.symbols_to_trade = [
+                excluded = set(self.config.coin_exclusion_list)
+                symbols = [
                     symbol['symbol'] for symbol in exchange_info['symbols']
                     if symbol['status'] == 'TRADING'
-                    and symbol['symbol'] not in self.config.coin_exclusion_list
+                    and symbol['symbol'] not in excluded
                 ]
             else:
-                self.symbols_to_trade = self.config.symbols_to_trade
+                symbols = self.config.symbols_to_trade
+            
+            # Interned once here so every per-symbol dict keyed from this list
+            # shares the same string objects
+            self.symbols_to_trade = [sys.intern(symbol) for symbol in symbols]
             
             self.logger.info(f"Initialized {len(self.symbols_to_trade)} symbols to trade")
             
         except Exception as e:
             raise TradingError(f"Failed to initialize symbols: {e}")
     
+    async def _initialize_leverage(self) -> None:
+        """Set leverage for all symbols to trade, a batch of requests at a time."""
+        for start in range(0, len(self.symbols_to_trade), self.REQUESTS_PER_BATCH):
+            chunk = self.symbols_to_trade[start:start + self.REQUESTS_PER_BATCH]
+            results = await asyncio.gather(
+                *(self.api_client.set_leverage(symbol, self.config.leverage) for symbol in chunk),
+                return_exceptions=True
+            )
+            for symbol, result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    self.logger.warning(f"Failed to set leverage for {symbol}: {result}")
+                else:
+                    self.logger.info(f"Set leverage {self.config.leverage}x for {symbol}")
+    
     async def _start_market_data_collection(self) -> None:
         """Start collecting market data for all symbols."""
         try:
-            for symbol in self.symbols_to_trade:
-                # Get historical data
-                klines = await self.api_client.get_klines(
-                    symbol=symbol,
-                    interval=self.config.interval,
-                    limit=200
-                )
+            # Historical data for all symbols, requested concurrently
+            klines_by_symbol = await self.api_client.get_klines_batch(
+                self.symbols_to_trade,
+                interval=self.config.interval,
+                limit=self._buffer_size,
+                concurrency=self.REQUESTS_PER_BATCH
+            )
+            
+            for symbol, klines in klines_by_symbol.items():
+                if isinstance(klines, Exception):
+                    self.logger.warning(f"Failed to load market data for {symbol}: {klines}")
+                    continue
                 
                 # Convert to market data format
                 market_data = self._convert_klines_to_market_data(symbol, klines)
@@ -192,42 +255,146 @@ class TradingEngine:
                 
                 self.logger.info(f"Loaded market data for {symbol}")
             
+            # Symbols without history are dropped here, once, so everything
+            # downstream can rely on market_data covering symbols_to_trade
+            self.symbols_to_trade = [symbol for symbol in self.symbols_to_trade if symbol in self.market_data]
+            
         except Exception as e:
             raise TradingError(f"Failed to start market data collection: {e}")
     
     async def _start_signal_processing(self) -> None:
-        """Start signal processing loop."""
-        async def signal_loop():
-            while self.is_running:
-                try:
-                    for symbol in self.symbols_to_trade:
-                        if symbol in self.market_data:
-                            # Update indicators
-                            self.strategy.update_indicators(self.market_data[symbol])
-                            
-                            # Generate signal
-                            signal_result = self.strategy.generate_signal(
-                                self.market_data[symbol],
-                                len(self.market_data[symbol].close) - 1
-                            )
-                            
-                            # Process signal
-                            if signal_result.signal.value != 'hold':
-                                await self.signal_processor.process_signal(
-                                    symbol=symbol,
-                                    signal_result=signal_result,
-                                    market_data=self.market_data[symbol]
-                                )
-                    
-                    # Wait for next iteration
-                    await asyncio.sleep(60)  # Process signals every minute
-                    
-                except Exception as e:
-                    self.logger.error(f"Error in signal processing: {e}")
-                    await asyncio.sleep(10)  # Wait before retrying
+        """Start the combined kline stream tasks and the batch signal task they feed."""
+        symbols = list(self.market_data)
+        per_connection = self.api_client.MAX_STREAMS_PER_CONNECTION
+        for start in range(0, len(symbols), per_connection):
+            group = symbols[start:start + per_connection]
+            self._supervise(
+                f"klines[{start}:{start + len(group)}]",
+                lambda group=group: self._kline_group_loop(group)
+            )
+        self._supervise("signal_batch", self._signal_batch_loop)
+    
+    def _supervise(self, name: str, factory: Callable[[], Awaitable[None]]) -> None:
+        """Run a long-lived task, logging and restarting it if it dies while the engine runs."""
+        task = asyncio.create_task(factory(), name=name)
+        self._signal_tasks.append(task)
+        
+        def on_done(task: asyncio.Task) -> None:
+            if task in self._signal_tasks:
+                self._signal_tasks.remove(task)
+            if task.cancelled():
+                return
+            
+            error = task.exception()
+            if error is not None:
+                self.logger.error(f"Task {name} died: {error!r}")
+            elif self.is_running:
+                self.logger.warning(f"Task {name} exited unexpectedly")
+            
+            if self.is_running:
+                self.logger.info(f"Restarting task {name} in {self.TASK_RESTART_DELAY:.0f}s")
+                asyncio.get_running_loop().call_later(
+                    self.TASK_RESTART_DELAY,
+                    lambda: self._supervise(name, factory) if self.is_running else None
+                )
+        
+        task.add_done_callback(on_done)
+    
+    async def _kline_group_loop(self, symbols: List[str]) -> None:
+        """Append each closed kline for a group of symbols and queue it for signal generation."""
+        async for symbol, kline in self.api_client.kline_streams(symbols, self.config.interval):
+            try:
+                self.market_data[symbol].append(kline)
+                self._pending_symbols.add(symbol)
+                self._pending_event.set()
+            except Exception as e:
+                self.logger.error(f"Error appending kline for {symbol}: {e}")
+    
+    async def _signal_batch_loop(self) -> None:
+        """Generate signals for every symbol whose kline closed, as one batch."""
+        while self.is_running:
+            await self._pending_event.wait()
+            
+            # Symbols closing on the same boundary arrive over several sockets;
+            # give the stragglers a moment so they land in the same batch
+            await asyncio.sleep(self.SIGNAL_BATCH_WINDOW)
+            self._pending_event.clear()
+            symbols = list(self._pending_symbols)
+            self._pending_symbols.clear()
+            
+            try:
+                await self._process_signal_batch(symbols)
+            except Exception as e:
+                self.logger.error(f"Error in signal processing: {e}")
+    
+    async def _process_signal_batch(self, symbols: List[str]) -> None:
+        """Run the strategy's batch signal kernel and process the actionable symbols."""
+        loop = asyncio.get_running_loop()
         
-        # Start signal processing task
-        asyncio.create_task(signal_loop())
+        # Matrices need equal-length rows; buffers differ only while filling
+        groups: Dict[int, List[str]] = {}
+        for symbol in symbols:
+            groups.setdefault(len(self.market_data[symbol].close), []).append(symbol)
+        
+        batch = {}
+        for n_bars, group in groups.items():
+            data = [self.market_data[symbol] for symbol in group]
+            signals = await loop.run_in_executor(
+                self._indicator_pool,
+                self.strategy.generate_signals_batch,
+                np.vstack([market_data.close for market_data in data]),
+                np.vstack([market_data.high for market_data in data]),
+                np.vstack([market_data.low for market_data in data]),
+                n_bars - 1
+            )
+            
+            # Full results (stops, confidence) only for the actionable rows,
+            # on the indicator pool so indicator maths stays off the loop
+            rows = np.nonzero(signals)[0]
+            results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    self._indicator_pool,
+                    self._full_signal,
+                    self._get_strategy(group[row]),
+                    data[row],
+                    n_bars - 1
+                )
+                for row in rows
+            ))
+            
+            for row, signal_result in zip(rows, results):
+                if signal_result.signal is not _HOLD:
+                    batch[group[row]] = (signal_result, data[row])
+        
+        # Process all actionable signals concurrently
+        if batch:
+            await self.signal_processor.process_signals(batch)
+    
+    @staticmethod
+    def _full_signal(strategy: Any, market_data: Any, current_index: int) -> StrategyResult:
+        """Indicators and the full signal for one symbol, run on the indicator pool."""
+        return strategy.generate_signal(market_data, current_index, strategy.update_indicators(market_data))
+    
+    def _get_strategy(self, symbol: str) -> Any:
+        """The symbol's own strategy instance, built on first use."""
+        strategy = self._symbol_strategies.get(symbol)
+        if strategy is None:
+            strategy = self._symbol_strategies[symbol] = strategy_registry.get_strategy(
+                self.config.strategy,
+                self._get_strategy_parameters()
+            )
+        return strategy
+    
+    async def _warmup_kernels(self) -> None:
+        """Compile (or load from cache) the numeric kernels on the indicator pool."""
+        loop = asyncio.get_running_loop()
+        for module in (indicator_kernels, risk_kernels):
+            timings = await loop.run_in_executor(self._indicator_pool, module.warmup)
+            for name, seconds in timings.items():
+                self.logger.info(
+                    f"Kernel {name} ready in {seconds:.3f}s",
+                    extra={'kernel': name, 'seconds': seconds}
+                )
     
     async def _start_position_monitoring(self) -> None:
         """Start position monitoring loop."""
@@ -291,16 +458,18 @@ class TradingEngine:
         except Exception as e:
             self.logger.error(f"Error generating performance report: {e}")
     
-    def _convert_klines_to_market_data(self, symbol: str, klines: List[List]) -> Any:
+    def _convert_klines_to_market_data(self, symbol: str, klines: np.ndarray) -> Any:
         """Convert klines data to MarketData format."""
         from ..strategies.base import MarketData
         
-        opens = [float(k[1]) for k in klines]
-        highs = [float(k[2]) for k in klines]
-        lows = [float(k[3]) for k in klines]
-        closes = [float(k[4]) for k in klines]
-        volumes = [float(k[5]) for k in klines]
-        timestamps = [int(k[0]) for k in klines]
+        # Klines arrive as a float64 array, one row per kline. Transposing the
+        # OHLCV columns into one contiguous block gives each field as a
+        # contiguous row view without a per-cell Python conversion
+        klines = np.asarray(klines, dtype=np.float64)
+        if klines.size == 0:
+            klines = np.empty((0, 6), dtype=np.float64)
+        opens, highs, lows, closes, volumes = np.ascontiguousarray(klines[:, 1:6].T)
+        timestamps = klines[:, 0].astype(np.int64)
         
         return MarketData(
             symbol=symbol,
@@ -309,7 +478,8 @@ class TradingEngine:
             low=lows,
             close=closes,
             volume=volumes,
-            timestamp=timestamps
+            timestamp=timestamps,
+            capacity=self._buffer_size
         )
     
     def _get_strategy_parameters(self) -> Dict[str, Any]:
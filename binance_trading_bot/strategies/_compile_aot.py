@@ -0,0 +1,44 @@
+"""
+Ahead-of-time build of the indicator kernels.
+
+Compiles the loops in ``_kernels`` into a native ``ti_kernels`` extension
+next to this file, so ``TechnicalIndicatorsMixin`` can use them without
+numba or LLVM at runtime. Needs numba and a C compiler at build time:
+    
+    python -m binance_trading_bot.strategies._compile_aot
+"""
+
+import os
+
+from numba.pycc import CC
+
+from . import _kernels
+
+SIGNATURES = {
+    'sma_loop': 'f8[:](f8[:], i8)',
+    'ema_loop': 'f8[:](f8[:], i8)',
+    'ema_loop_state': 'Tuple((f8[:], f8, f8))(f8[:], i8)',
+    'rsi_loop': 'f8[:](f8[:], i8)',
+    'macd_loop': 'UniTuple(f8[:], 3)(f8[:], i8, i8, i8)',
+    'atr_loop': 'f8[:](f8[:], f8[:], f8[:], i8)',
+    'stoch_loop': 'UniTuple(f8[:], 2)(f8[:], f8[:], f8[:], i8, i8)',
+    'bbands_loop': 'UniTuple(f8[:], 3)(f8[:], i8, f8)',
+    'stoch_rsi_macd_scores': 'UniTuple(i1[:], 2)(f8[:], f8[:], f8[:], f8[:], f8[:], f8, f8)',
+}
+
+
+def build(output_dir: str = os.path.dirname(os.path.abspath(__file__))) -> None:
+    """Compile the ``ti_kernels`` extension module into ``output_dir``."""
+    cc = CC('ti_kernels')
+    cc.output_dir = output_dir
+    cc.verbose = True
+    
+    for name, signature in SIGNATURES.items():
+        kernel = getattr(_kernels, name)
+        cc.export(name, signature)(getattr(kernel, 'py_func', kernel))
+    
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
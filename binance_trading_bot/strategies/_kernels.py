@@ -0,0 +1,402 @@
+"""
+Numeric kernels for the technical indicators.
+
+Compiled with numba when it is installed (``pip install .[speed]``);
+otherwise they run as plain Python/NumPy with identical results, with the
+stochastic served by bottleneck or NumPy sliding windows instead. Each
+kernel reproduces the pandas rolling-window formula it replaces: the
+first ``window - 1`` outputs are NaN and any NaN in a window yields NaN.
+Compiled kernels release the GIL, so several symbols can be processed on
+separate threads at once.
+"""
+
+import time
+from typing import Dict
+
+import numpy as np
+
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:  # pragma: no cover - bottleneck is optional
+    BOTTLENECK_AVAILABLE = False
+
+
+@njit(cache=True, nogil=True)
+def sma_loop(x, window):
+    """Simple moving average; NaN until the window is full of numbers."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        total = 0.0
+        valid = True
+        for j in range(i - window + 1, i + 1):
+            if np.isnan(x[j]):
+                valid = False
+                break
+            total += x[j]
+        if valid:
+            out[i] = total / window
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rsi_loop(close, window):
+    """Relative Strength Index from simple rolling means of gains and losses."""
+    n = close.shape[0]
+    gain = np.zeros(n)
+    loss = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain[i] = delta
+        elif delta < 0:
+            loss[i] = -delta
+    
+    avg_gain = sma_loop(gain, window)
+    avg_loss = sma_loop(loss, window)
+    
+    out = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        if avg_loss[i] > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain[i] / avg_loss[i])
+        elif avg_gain[i] > 0:
+            out[i] = 100.0
+    return out
+
+
+@njit(cache=True, nogil=True)
+def atr_loop(high, low, close, window):
+    """
+    Average True Range as a simple rolling mean of the true range.
+    
+    The true range is the NaN-skipping max of the three ranges, like the
+    pandas ``concat(...).max(axis=1)`` it replaces; the builtin ``max``
+    would instead return whichever operand came first around a NaN.
+    """
+    n = close.shape[0]
+    true_range = np.empty(n)
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            high_close = abs(high[i] - close[i - 1])
+            low_close = abs(low[i] - close[i - 1])
+            if np.isnan(tr) or high_close > tr:
+                tr = high_close
+            if np.isnan(tr) or low_close > tr:
+                tr = low_close
+        true_range[i] = tr
+    return sma_loop(true_range, window)
+
+
+@njit(cache=True, nogil=True)
+def stoch_loop(high, low, close, k_window, d_window):
+    """Stochastic %K over ``k_window`` and its ``d_window`` rolling mean %D."""
+    n = close.shape[0]
+    k_percent = np.full(n, np.nan)
+    for i in range(k_window - 1, n):
+        lowest = low[i]
+        highest = high[i]
+        for j in range(i - k_window + 1, i):
+            if low[j] < lowest or np.isnan(low[j]):
+                lowest = low[j]
+            if high[j] > highest or np.isnan(high[j]):
+                highest = high[j]
+        
+        span = highest - lowest
+        if span != 0:
+            k_percent[i] = 100.0 * (close[i] - lowest) / span
+    
+    return k_percent, sma_loop(k_percent, d_window)
+
+
+def stoch_windows(high, low, close, k_window, d_window):
+    """
+    NumPy form of ``stoch_loop`` for when numba is not installed.
+    
+    Sliding-window views let ``min``/``max``/``sum`` reduce every window in
+    C rather than in the interpreted double loop; results agree with
+    ``stoch_loop`` up to rounding in the %D mean.
+    """
+    n = close.shape[0]
+    k_percent = np.full(n, np.nan)
+    if n >= k_window:
+        lowest = sliding_window_view(low, k_window).min(axis=1)
+        highest = sliding_window_view(high, k_window).max(axis=1)
+        span = highest - lowest
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k_values = 100.0 * (close[k_window - 1:] - lowest) / span
+        k_values[span == 0] = np.nan
+        k_percent[k_window - 1:] = k_values
+    
+    d_percent = np.full(n, np.nan)
+    if n >= d_window:
+        d_percent[d_window - 1:] = sliding_window_view(k_percent, d_window).sum(axis=1) / d_window
+    return k_percent, d_percent
+
+
+def stoch_moving(high, low, close, k_window, d_window):
+    """
+    ``stoch_loop`` on bottleneck's moving-window reductions, for when
+    bottleneck is installed but numba is not.
+    
+    Each reduction is a single O(n) pass, and like the loop a NaN anywhere
+    in a window yields NaN.
+    """
+    n = close.shape[0]
+    if n < k_window:
+        return np.full(n, np.nan), np.full(n, np.nan)
+    
+    lowest = bn.move_min(low, k_window)
+    highest = bn.move_max(high, k_window)
+    span = highest - lowest
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k_percent = 100.0 * (close - lowest) / span
+    k_percent[span == 0] = np.nan
+    
+    if n < d_window:
+        return k_percent, np.full(n, np.nan)
+    return k_percent, bn.move_mean(k_percent, d_window)
+
+
+@njit(cache=True, nogil=True)
+def ema_loop(x, span):
+    """
+    Exponential moving average, matching pandas ``ewm(span=span).mean()``.
+    
+    pandas defaults to ``adjust=True``, i.e. a weighted mean normalised by
+    the sum of the weights so far; both the weighted sum and the weight sum
+    follow the same two-register recurrence. NaN inputs leave the mean
+    unchanged while the older weights keep decaying.
+    """
+    return ema_loop_state(x, span)[0]
+
+
+@njit(cache=True, nogil=True)
+def ema_loop_state(x, span):
+    """
+    ``ema_loop`` that also returns the final weighted sum and weight sum,
+    so the mean can be continued one value at a time (``TripleEMAStream``).
+    """
+    decay = 1.0 - 2.0 / (span + 1.0)
+    n = x.shape[0]
+    out = np.empty(n)
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        num *= decay
+        den *= decay
+        if not np.isnan(x[i]):
+            num += x[i]
+            den += 1.0
+        out[i] = num / den if den > 0 else np.nan
+    return out, num, den
+
+
+@njit(cache=True, nogil=True)
+def macd_loop(x, fast, slow, signal):
+    """
+    MACD line, signal line and histogram in one pass over the prices.
+    
+    Runs the fast, slow and signal ``ema_loop`` recurrences in lockstep, so
+    the results match the three separate EMAs exactly while the prices and
+    the MACD line are each read once.
+    """
+    decay_fast = 1.0 - 2.0 / (fast + 1.0)
+    decay_slow = 1.0 - 2.0 / (slow + 1.0)
+    decay_signal = 1.0 - 2.0 / (signal + 1.0)
+    n = x.shape[0]
+    macd = np.empty(n)
+    signal_line = np.empty(n)
+    histogram = np.empty(n)
+    num_fast = den_fast = 0.0
+    num_slow = den_slow = 0.0
+    num_signal = den_signal = 0.0
+    for i in range(n):
+        num_fast *= decay_fast
+        den_fast *= decay_fast
+        num_slow *= decay_slow
+        den_slow *= decay_slow
+        if not np.isnan(x[i]):
+            num_fast += x[i]
+            den_fast += 1.0
+            num_slow += x[i]
+            den_slow += 1.0
+        
+        ema_fast = num_fast / den_fast if den_fast > 0 else np.nan
+        ema_slow = num_slow / den_slow if den_slow > 0 else np.nan
+        m = ema_fast - ema_slow
+        
+        num_signal *= decay_signal
+        den_signal *= decay_signal
+        if not np.isnan(m):
+            num_signal += m
+            den_signal += 1.0
+        s = num_signal / den_signal if den_signal > 0 else np.nan
+        
+        macd[i] = m
+        signal_line[i] = s
+        histogram[i] = m - s
+    return macd, signal_line, histogram
+
+
+@njit(cache=True, nogil=True)
+def bbands_loop(x, window, std_mult):
+    """
+    Bollinger Bands: rolling mean and sample std (ddof=1) from one window scan.
+    
+    Each window is read once for its mean and once more for the squared
+    deviations, which stays exact where a running sum of squares would
+    cancel catastrophically at large price levels.
+    """
+    n = x.shape[0]
+    upper = np.full(n, np.nan)
+    mid = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        total = 0.0
+        valid = True
+        for j in range(i - window + 1, i + 1):
+            if np.isnan(x[j]):
+                valid = False
+                break
+            total += x[j]
+        if not valid:
+            continue
+        
+        mean = total / window
+        mid[i] = mean
+        if window < 2:
+            continue
+        
+        sq = 0.0
+        for j in range(i - window + 1, i + 1):
+            sq += (x[j] - mean) * (x[j] - mean)
+        band = np.sqrt(sq / (window - 1)) * std_mult
+        upper[i] = mean + band
+        lower[i] = mean - band
+    return upper, mid, lower
+
+
+@njit(cache=True, nogil=True)
+def stoch_rsi_macd_scores(rsi, stoch_k, stoch_d, macd, macd_signal, oversold, overbought):
+    """
+    Buy and sell condition counts per bar for the StochRSI/MACD strategy.
+    
+    Each side scores its stochastic zone, the RSI side of 50, and a MACD
+    and a stochastic crossover against the previous bar, so a bar scores
+    0-4 per side. NaN comparisons are false, as in the scalar checks.
+    """
+    n = rsi.shape[0]
+    buy = np.zeros(n, dtype=np.int8)
+    sell = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        b = 0
+        s = 0
+        if stoch_k[i] < oversold and stoch_d[i] < oversold:
+            b += 1
+        if rsi[i] > 50:
+            b += 1
+        if stoch_k[i] > overbought and stoch_d[i] > overbought:
+            s += 1
+        if rsi[i] < 50:
+            s += 1
+        if i > 0:
+            if macd[i] > macd_signal[i] and macd[i - 1] < macd_signal[i - 1]:
+                b += 1
+            if stoch_k[i] > stoch_d[i] and stoch_k[i - 1] < stoch_d[i - 1]:
+                b += 1
+            if macd[i] < macd_signal[i] and macd[i - 1] > macd_signal[i - 1]:
+                s += 1
+            if stoch_k[i] < stoch_d[i] and stoch_k[i - 1] > stoch_d[i - 1]:
+                s += 1
+        buy[i] = b
+        sell[i] = s
+    return buy, sell
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def triple_ema_batch(close, fast, medium, slow):
+    """
+    Fast, medium and slow EMAs for every row of a ``(n_symbols, n_bars)``
+    matrix, returned as one ``(3, n_symbols, n_bars)`` array. Rows are
+    processed in parallel.
+    """
+    n_symbols, n_bars = close.shape
+    out = np.empty((3, n_symbols, n_bars))
+    for s in prange(n_symbols):
+        out[0, s] = ema_loop(close[s], fast)
+        out[1, s] = ema_loop(close[s], medium)
+        out[2, s] = ema_loop(close[s], slow)
+    return out
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def triple_ema_signals(close, fast, medium, slow, index):
+    """
+    Triple EMA crossover signal per row of a ``(n_symbols, n_bars)`` matrix.
+    
+    +1 where the fast EMA crosses above both others at ``index``, -1 where
+    it crosses below both, 0 otherwise. Rows are processed in parallel.
+    """
+    n_symbols = close.shape[0]
+    out = np.zeros(n_symbols, dtype=np.int8)
+    for s in prange(n_symbols):
+        ema_fast = ema_loop(close[s], fast)
+        ema_medium = ema_loop(close[s], medium)
+        ema_slow = ema_loop(close[s], slow)
+        
+        f, m, sl = ema_fast[index], ema_medium[index], ema_slow[index]
+        fp, mp, sp = ema_fast[index - 1], ema_medium[index - 1], ema_slow[index - 1]
+        
+        if fp > mp and fp > sp and f < m and f < sl:
+            out[s] = -1
+        elif fp < mp and fp < sp and f > m and f > sl:
+            out[s] = 1
+    return out
+
+
+def warmup() -> Dict[str, float]:
+    """
+    Call every kernel once on dummy data so compilation (or loading the
+    on-disk cache) happens now rather than on the first live tick.
+    
+    Returns the seconds spent per kernel.
+    """
+    x = np.linspace(1.0, 2.0, 64)
+    matrix = np.ascontiguousarray(np.vstack((x, x[::-1])))
+    calls = {
+        'sma_loop': lambda: sma_loop(x, 20),
+        'ema_loop': lambda: ema_loop(x, 12),
+        'ema_loop_state': lambda: ema_loop_state(x, 12),
+        'macd_loop': lambda: macd_loop(x, 12, 26, 9),
+        'rsi_loop': lambda: rsi_loop(x, 14),
+        'atr_loop': lambda: atr_loop(x, x, x, 14),
+        'stoch_loop': lambda: stoch_loop(x, x, x, 14, 3),
+        'bbands_loop': lambda: bbands_loop(x, 20, 2.0),
+        'stoch_rsi_macd_scores': lambda: stoch_rsi_macd_scores(x, x, x, x, x, 20.0, 80.0),
+        'triple_ema_batch': lambda: triple_ema_batch(matrix, 5, 20, 50),
+        'triple_ema_signals': lambda: triple_ema_signals(matrix, 5, 20, 50, 63),
+    }
+    
+    timings = {}
+    for name, call in calls.items():
+        start = time.perf_counter()
+        call()
+        timings[name] = time.perf_counter() - start
+    return timings
@@ -3,12 +3,29 @@ Base strategy classes and interfaces.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple, Union
 from enum import Enum
+from types import SimpleNamespace
+import sys
 import pandas as pd
 import numpy as np
 
+try:
+    # Native build from ``python -m binance_trading_bot.strategies._compile_aot``
+    from .ti_kernels import sma_loop, ema_loop, rsi_loop, macd_loop, atr_loop, stoch_loop, bbands_loop
+except ImportError:
+    from ._kernels import sma_loop, ema_loop, rsi_loop, macd_loop, atr_loop, bbands_loop
+    from ._kernels import stoch_loop as _stoch_loop_jit
+    from ._kernels import NUMBA_AVAILABLE, BOTTLENECK_AVAILABLE, stoch_moving, stoch_windows
+    
+    # Interpreted, the window rescans of stoch_loop are far slower than
+    # bottleneck's moving reductions or NumPy's sliding-window ones
+    stoch_loop = _stoch_loop_jit if NUMBA_AVAILABLE else (
+        stoch_moving if BOTTLENECK_AVAILABLE else stoch_windows
+    )
+
 
 class SignalType(Enum):
     """Trading signal types."""
@@ -18,7 +35,15 @@ class SignalType(Enum):
 
 
 class StrategyResult:
-    """Result of a strategy calculation."""
+    """
+    Result of a strategy calculation.
+    
+    ``metadata`` is a dict or, for signals, a strategy's NamedTuple of the
+    values behind it; ``metadata_dict`` gives either as a dict.
+    """
+    
+    # Slotted: one is built per symbol per signal evaluation
+    __slots__ = ('signal', 'confidence', 'stop_loss', 'take_profit', 'metadata')
     
     def __init__(
         self,
@@ -26,7 +51,7 @@ class StrategyResult:
         confidence: float = 0.0,
         stop_loss: Optional[float] = None,
         take_profit: Optional[float] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Union[Dict[str, Any], NamedTuple]] = None
     ):
         self.signal = signal
         self.confidence = confidence
@@ -34,31 +59,190 @@ class StrategyResult:
         self.take_profit = take_profit
         self.metadata = metadata or {}
     
+    def metadata_dict(self) -> Dict[str, Any]:
+        """Metadata as a dict, whichever form it was given in."""
+        as_dict = getattr(self.metadata, '_asdict', None)
+        return as_dict() if as_dict is not None else self.metadata
+    
     def __repr__(self):
         return f"StrategyResult(signal={self.signal.value}, confidence={self.confidence})"
 
 
+# Batch signal encoding used by ``BaseStrategy.generate_signals_batch``
+SIGNAL_SIGNS = {
+    SignalType.BUY: 1,
+    SignalType.SELL: -1,
+    SignalType.HOLD: 0,
+}
+
+
+class IndicatorBundle(SimpleNamespace):
+    """Indicator arrays for one symbol, read as attributes (``bundle.rsi``)."""
+
+
+class CircularSeries:
+    """
+    Fixed-capacity ring buffer over a preallocated numpy array.
+    
+    ``push`` writes in place with no allocation; ``as_ordered`` returns the
+    values oldest first as a contiguous array, cached until the next write.
+    """
+    
+    __slots__ = ('_buf', '_head', '_filled', '_ordered')
+    
+    def __init__(self, capacity: int, dtype: Any = np.float64):
+        if capacity <= 0:
+            raise ValueError("CircularSeries capacity must be positive")
+        
+        self._buf = np.empty(capacity, dtype=dtype)
+        self._head = 0
+        self._filled = False
+        self._ordered: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_array(cls, values: np.ndarray, capacity: int, dtype: Any = np.float64) -> 'CircularSeries':
+        """Build a buffer holding the last ``capacity`` values of ``values``."""
+        series = cls(capacity, dtype)
+        values = np.asarray(values, dtype=dtype)[-capacity:]
+        series._buf[:len(values)] = values
+        series._head = len(values) % capacity
+        series._filled = len(values) == capacity
+        return series
+    
+    def __len__(self) -> int:
+        return len(self._buf) if self._filled else self._head
+    
+    @property
+    def capacity(self) -> int:
+        """Maximum number of values held."""
+        return len(self._buf)
+    
+    def push(self, value: float) -> None:
+        """Append a value, overwriting the oldest one once full."""
+        self._buf[self._head] = value
+        self._head += 1
+        if self._head == len(self._buf):
+            self._head = 0
+            self._filled = True
+        self._ordered = None
+    
+    def replace_last(self, value: float) -> None:
+        """Overwrite the most recent value."""
+        if not len(self):
+            raise IndexError("replace_last on an empty CircularSeries")
+        
+        self._buf[self._head - 1] = value
+        self._ordered = None
+    
+    def as_ordered(self) -> np.ndarray:
+        """Values oldest first, as a contiguous array."""
+        if self._ordered is None:
+            if self._filled:
+                self._ordered = np.concatenate((self._buf[self._head:], self._buf[:self._head]))
+            else:
+                self._ordered = self._buf[:self._head].copy()
+        return self._ordered
+
+
 @dataclass
 class MarketData:
-    """Market data container."""
+    """
+    Market data container.
+    
+    With a ``capacity`` the columns are backed by ``CircularSeries`` ring
+    buffers and ``append`` keeps a rolling window of that many klines.
+    """
     symbol: str
-    open: List[float]
-    high: List[float]
-    low: List[float]
-    close: List[float]
-    volume: List[float]
-    timestamp: List[int]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    timestamp: np.ndarray
+    capacity: Optional[int] = None
+    _series: Optional[Tuple[CircularSeries, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _frame: Optional[Tuple[Tuple[np.ndarray, ...], pd.DataFrame]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Symbols come from a bounded pair list, so interning them is safe
+        self.symbol = sys.intern(self.symbol)
+        
+        # Contiguous float64 columns give the indicators zero-copy views
+        self.open = np.ascontiguousarray(self.open, dtype=np.float64)
+        self.high = np.ascontiguousarray(self.high, dtype=np.float64)
+        self.low = np.ascontiguousarray(self.low, dtype=np.float64)
+        self.close = np.ascontiguousarray(self.close, dtype=np.float64)
+        self.volume = np.ascontiguousarray(self.volume, dtype=np.float64)
+        self.timestamp = np.ascontiguousarray(self.timestamp, dtype=np.int64)
+        
+        if self.capacity is not None:
+            self._init_series(self.capacity)
+    
+    def _init_series(self, capacity: int) -> None:
+        """Move the columns into ring buffers of the given capacity."""
+        self._series = (
+            CircularSeries.from_array(self.open, capacity),
+            CircularSeries.from_array(self.high, capacity),
+            CircularSeries.from_array(self.low, capacity),
+            CircularSeries.from_array(self.close, capacity),
+            CircularSeries.from_array(self.volume, capacity),
+            CircularSeries.from_array(self.timestamp, capacity, np.int64),
+        )
+        self.capacity = capacity
+        self._sync_columns()
+    
+    def _sync_columns(self) -> None:
+        (
+            self.open, self.high, self.low, self.close, self.volume, self.timestamp
+        ) = (series.as_ordered() for series in self._series)
+    
+    def append(self, kline: np.ndarray) -> None:
+        """
+        Append one ``(timestamp, open, high, low, close, volume)`` kline row.
+        
+        A kline with the same open time as the last row replaces it, so a
+        closed kline supersedes the in-progress one loaded over REST. Once
+        ``capacity`` rows are held the oldest row is dropped. Without a
+        capacity, the window keeps the length the data was loaded with.
+        """
+        if self._series is None:
+            if not len(self.timestamp):
+                raise ValueError("MarketData needs a capacity to append to an empty buffer")
+            self._init_series(len(self.timestamp))
+        
+        timestamp = np.int64(kline[0])
+        row = (kline[1], kline[2], kline[3], kline[4], kline[5], timestamp)
+        
+        if len(self.timestamp) and self.timestamp[-1] == timestamp:
+            for series, value in zip(self._series, row):
+                series.replace_last(value)
+        else:
+            for series, value in zip(self._series, row):
+                series.push(value)
+        
+        # Fresh ordered arrays per append, so readers holding the previous
+        # columns keep a consistent snapshot
+        self._sync_columns()
     
     def to_dataframe(self) -> pd.DataFrame:
-        """Convert to pandas DataFrame."""
-        return pd.DataFrame({
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'volume': self.volume,
-            'timestamp': self.timestamp
-        })
+        """
+        Convert to pandas DataFrame.
+        
+        The frame shares the column arrays rather than copying them, and is
+        reused until the columns change (``append`` rebinds them), so treat
+        it as read-only.
+        """
+        columns = (self.open, self.high, self.low, self.close, self.volume, self.timestamp)
+        frame = self._frame
+        if frame is not None and all(a is b for a, b in zip(frame[0], columns)):
+            return frame[1]
+        
+        df = pd.DataFrame(
+            dict(zip(('open', 'high', 'low', 'close', 'volume', 'timestamp'), columns)),
+            copy=False
+        )
+        self._frame = (columns, df)
+        return df
 
 
 class BaseStrategy(ABC):
@@ -68,7 +252,21 @@ class BaseStrategy(ABC):
         self.name = name
         self.parameters = parameters or {}
         self.indicators = {}
+        self._indicator_memo: Optional[Tuple[Tuple[np.ndarray, ...], IndicatorBundle]] = None
         self._validate_parameters()
+        self._bind_parameters()
+    
+    @property
+    def indicators(self) -> Dict[str, np.ndarray]:
+        """Indicator arrays by name, as last calculated or assigned."""
+        return self._indicators
+    
+    @indicators.setter
+    def indicators(self, indicators: Dict[str, np.ndarray]) -> None:
+        # Mirrored as attributes so signal code reads ``self._ind.rsi``, one
+        # attribute load instead of a dict lookup per value
+        self._indicators = indicators
+        self._ind = IndicatorBundle(**indicators)
     
     @abstractmethod
     def calculate_indicators(self, data: MarketData) -> Dict[str, np.ndarray]:
@@ -76,8 +274,18 @@ class BaseStrategy(ABC):
         pass
     
     @abstractmethod
-    def generate_signal(self, data: MarketData, current_index: int) -> StrategyResult:
-        """Generate trading signal based on current market data."""
+    def generate_signal(
+        self,
+        data: MarketData,
+        current_index: int,
+        indicators: Optional[IndicatorBundle] = None
+    ) -> StrategyResult:
+        """
+        Generate trading signal based on current market data.
+        
+        ``indicators`` is the bundle for ``data`` from ``update_indicators``;
+        without it the strategy's own ``indicators`` are used.
+        """
         pass
     
     @abstractmethod
@@ -85,20 +293,107 @@ class BaseStrategy(ABC):
         """Validate strategy parameters."""
         pass
     
+    def _bind_parameters(self) -> None:
+        """
+        Copy the parameters the indicator and signal paths read into typed
+        attributes, so each tick does an attribute load instead of a dict
+        lookup. Runs after every successful validation.
+        """
+        pass
+    
+    def generate_signals_batch(
+        self,
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        current_index: int
+    ) -> np.ndarray:
+        """
+        Generate signals for many symbols at once.
+        
+        Each argument matrix holds one symbol per row, ``(n_symbols, n_bars)``.
+        Returns an int8 array of +1 (buy), -1 (sell) or 0 (hold) per row.
+        The default calculates indicators and runs ``generate_signal`` row
+        by row on a MarketData rebuilt from the three series (open mirrors
+        close, volume is zero), without touching the ``update_indicators``
+        memo, so one instance can serve batches from worker threads;
+        strategies with a compiled batch kernel override it.
+        """
+        n_symbols, n_bars = close.shape
+        signals = np.zeros(n_symbols, dtype=np.int8)
+        timestamps = np.arange(n_bars)
+        volume = np.zeros(n_bars)
+        
+        for row in range(n_symbols):
+            data = MarketData('', close[row], high[row], low[row], close[row], volume, timestamps)
+            bundle = IndicatorBundle(**self.calculate_indicators(data))
+            signals[row] = SIGNAL_SIGNS[self.generate_signal(data, current_index, bundle).signal]
+        
+        return signals
+
+    def generate_signals_vectorized(self, data: MarketData) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate signals for every bar of ``data`` at once.
+        
+        Returns an int8 array of +1 (buy), -1 (sell) or 0 (hold) and a
+        float32 array of confidences, both one entry per bar, matching
+        ``generate_signal`` at each index. The default calls
+        ``generate_signal`` bar by bar; strategies override it with a
+        single pass over their indicator arrays.
+        """
+        n_bars = len(data.close)
+        signals = np.zeros(n_bars, dtype=np.int8)
+        confidence = np.zeros(n_bars, dtype=np.float32)
+        bundle = self.update_indicators(data)
+        
+        for index in range(n_bars):
+            result = self.generate_signal(data, index, bundle)
+            signals[index] = SIGNAL_SIGNS[result.signal]
+            confidence[index] = result.confidence
+        
+        return signals, confidence
+    
     def get_required_buffer_size(self) -> int:
         """Get the required buffer size for this strategy."""
         return 200  # Default buffer size
     
-    def update_indicators(self, data: MarketData) -> None:
-        """Update indicators with new data."""
-        self.indicators = self.calculate_indicators(data)
+    def update_indicators(self, data: MarketData) -> IndicatorBundle:
+        """
+        Calculate indicators for ``data`` as a bundle.
+        
+        The strategy's own ``indicators`` are left alone, so one instance can
+        serve many symbols; pass the bundle to ``generate_signal``. The last
+        bundle is memoized: called again with the same column arrays (a
+        backtest stepping ``current_index`` over fixed data) it is returned
+        without recalculating. MarketData rebinds its columns on every
+        append, so array identity is a safe key.
+        """
+        columns = (data.open, data.high, data.low, data.close, data.volume)
+        memo = self._indicator_memo
+        if memo is not None and all(a is b for a, b in zip(memo[0], columns)):
+            return memo[1]
+        
+        bundle = IndicatorBundle(**self.calculate_indicators(data))
+        self._indicator_memo = (columns, bundle)
+        return bundle
+    
+    def calculate_indicators_batch(self, data_list: List[MarketData]) -> List[IndicatorBundle]:
+        """
+        Indicator bundles for many symbols, in the order given.
+        
+        The default calculates each symbol in turn; strategies with a
+        parallel kernel override it to handle all symbols in one call.
+        Like ``update_indicators``, the strategy's own ``indicators`` are
+        left alone.
+        """
+        return [IndicatorBundle(**self.calculate_indicators(data)) for data in data_list]
     
     def get_indicator_value(self, indicator_name: str, index: int) -> float:
         """Get indicator value at specific index."""
-        if indicator_name not in self.indicators:
+        values = getattr(self._ind, indicator_name, None)
+        if values is None:
             raise ValueError(f"Indicator {indicator_name} not found")
         
-        values = self.indicators[indicator_name]
         if index >= len(values) or index < 0:
             raise IndexError(f"Index {index} out of range for indicator {indicator_name}")
         
@@ -112,6 +407,32 @@ class BaseStrategy(ABC):
         """Set strategy parameter value."""
         self.parameters[key] = value
         self._validate_parameters()
+        self._bind_parameters()
+        self._indicator_memo = None
+
+
+def _vectorized_signals(strategy: BaseStrategy, data: MarketData) -> Tuple[np.ndarray, np.ndarray]:
+    return strategy.generate_signals_vectorized(data)
+
+
+def generate_signals_parallel(
+    strategies: List[BaseStrategy],
+    datasets: List[MarketData],
+    max_workers: Optional[int] = None
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Run ``generate_signals_vectorized`` for each (strategy, dataset) pair in
+    worker processes, for backtest sweeps over many strategies or windows.
+    
+    Signal generation holds the GIL outside the compiled kernels, so pairs
+    are spread over processes rather than threads; strategies and data are
+    pickled to the workers. Results come back in input order.
+    """
+    if len(strategies) != len(datasets):
+        raise ValueError("strategies and datasets must have the same length")
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_vectorized_signals, strategies, datasets))
 
 
 class RiskManagementMixin:
@@ -137,10 +458,8 @@ class RiskManagementMixin:
         multiplier: float = 2.0
     ) -> float:
         """Calculate stop loss based on ATR."""
-        if direction == SignalType.BUY:
-            return entry_price - (atr * multiplier)
-        else:
-            return entry_price + (atr * multiplier)
+        sign = 1.0 if direction is SignalType.BUY else -1.0
+        return entry_price - sign * atr * multiplier
     
     def calculate_take_profit(
         self,
@@ -150,70 +469,61 @@ class RiskManagementMixin:
         risk_reward_ratio: float = 2.0
     ) -> float:
         """Calculate take profit based on risk-reward ratio."""
-        risk = abs(entry_price - stop_loss)
-        reward = risk * risk_reward_ratio
-        
-        if direction == SignalType.BUY:
-            return entry_price + reward
-        else:
-            return entry_price - reward
+        sign = 1.0 if direction is SignalType.BUY else -1.0
+        return entry_price + sign * abs(entry_price - stop_loss) * risk_reward_ratio
 
 
 class TechnicalIndicatorsMixin:
-    """Mixin for common technical indicators."""
+    """
+    Mixin for common technical indicators.
+    
+    Inputs may be any float sequence (ndarray, Series, list); outputs are
+    float64 ndarrays aligned with the input, NaN where the window is not
+    yet full.
+    """
     
     @staticmethod
-    def sma(data: pd.Series, window: int) -> pd.Series:
+    def sma(data: np.ndarray, window: int) -> np.ndarray:
         """Simple Moving Average."""
-        return data.rolling(window=window).mean()
+        return sma_loop(np.asarray(data, dtype=np.float64), window)
     
     @staticmethod
-    def ema(data: pd.Series, window: int) -> pd.Series:
+    def ema(data: np.ndarray, window: int) -> np.ndarray:
         """Exponential Moving Average."""
-        return data.ewm(span=window).mean()
+        return ema_loop(np.asarray(data, dtype=np.float64), window)
     
     @staticmethod
-    def rsi(data: pd.Series, window: int = 14) -> pd.Series:
+    def rsi(data: np.ndarray, window: int = 14) -> np.ndarray:
         """Relative Strength Index."""
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        return rsi_loop(np.asarray(data, dtype=np.float64), window)
     
     @staticmethod
-    def macd(data: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    def macd(data: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """MACD indicator."""
-        ema_fast = data.ewm(span=fast).mean()
-        ema_slow = data.ewm(span=slow).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
-        return macd_line, signal_line, histogram
+        return macd_loop(np.asarray(data, dtype=np.float64), fast, slow, signal)
     
     @staticmethod
-    def bollinger_bands(data: pd.Series, window: int = 20, std_dev: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    def bollinger_bands(data: np.ndarray, window: int = 20, std_dev: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Bollinger Bands."""
-        sma = data.rolling(window=window).mean()
-        std = data.rolling(window=window).std()
-        upper = sma + (std * std_dev)
-        lower = sma - (std * std_dev)
-        return upper, sma, lower
+        return bbands_loop(np.asarray(data, dtype=np.float64), window, std_dev)
     
     @staticmethod
-    def stochastic(high: pd.Series, low: pd.Series, close: pd.Series, k_window: int = 14, d_window: int = 3) -> Tuple[pd.Series, pd.Series]:
+    def stochastic(high: np.ndarray, low: np.ndarray, close: np.ndarray, k_window: int = 14, d_window: int = 3) -> Tuple[np.ndarray, np.ndarray]:
         """Stochastic Oscillator."""
-        lowest_low = low.rolling(window=k_window).min()
-        highest_high = high.rolling(window=k_window).max()
-        k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low))
-        d_percent = k_percent.rolling(window=d_window).mean()
-        return k_percent, d_percent
+        return stoch_loop(
+            np.asarray(high, dtype=np.float64),
+            np.asarray(low, dtype=np.float64),
+            np.asarray(close, dtype=np.float64),
+            k_window,
+            d_window
+        )
     
     @staticmethod
-    def atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) -> pd.Series:
+    def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = 14) -> np.ndarray:
         """Average True Range."""
-        high_low = high - low
-        high_close_prev = (high - close.shift(1)).abs()
-        low_close_prev = (low - close.shift(1)).abs()
-        true_range = pd.concat([high_low, high_close_prev, low_close_prev], axis=1).max(axis=1)
-        return true_range.rolling(window=window).mean()
+        return atr_loop(
+            np.asarray(high, dtype=np.float64),
+            np.asarray(low, dtype=np.float64),
+            np.asarray(close, dtype=np.float64),
+            window
+        )
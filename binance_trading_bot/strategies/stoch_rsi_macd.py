@@ -3,9 +3,86 @@ Stochastic RSI with MACD strategy.
 """
 
 import numpy as np
-import pandas as pd
-from typing import Dict, Any, Optional, Tuple
-from .base import BaseStrategy, StrategyResult, SignalType, MarketData, TechnicalIndicatorsMixin
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+from .base import BaseStrategy, StrategyResult, SignalType, MarketData, IndicatorBundle, TechnicalIndicatorsMixin
+
+try:
+    # Native build from ``python -m binance_trading_bot.strategies._compile_aot``
+    from .ti_kernels import stoch_rsi_macd_scores
+except ImportError:
+    from ._kernels import stoch_rsi_macd_scores
+
+
+BUY_CONDITIONS = ('stoch_oversold', 'rsi_above_mid', 'macd_bull_cross', 'stoch_bull_cross')
+SELL_CONDITIONS = ('stoch_overbought', 'rsi_below_mid', 'macd_bear_cross', 'stoch_bear_cross')
+
+# Bars needed before the indicators are trusted
+WARMUP_BARS = 50
+
+# Signal confidence by number of conditions met, min(0.9, 0.5 + 0.1 * score)
+# from three conditions up and no signal below that
+CONFIDENCE_BY_SCORE = (0.0, 0.0, 0.0, 0.8, 0.9)
+_CONFIDENCE_LUT = np.array(CONFIDENCE_BY_SCORE, dtype=np.float32)
+
+
+class StochRSIMACDBuyMeta(NamedTuple):
+    """Indicator values behind a buy signal."""
+    rsi: float
+    stoch_k: float
+    stoch_d: float
+    macd: float
+    macd_signal: float
+    buy_score: int
+    conditions_met: Tuple[bool, ...]
+
+
+class StochRSIMACDSellMeta(NamedTuple):
+    """Indicator values behind a sell signal."""
+    rsi: float
+    stoch_k: float
+    stoch_d: float
+    macd: float
+    macd_signal: float
+    sell_score: int
+    conditions_met: Tuple[bool, ...]
+
+
+def _crossed_above(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """True where ``a`` is above ``b`` and was below it on the previous bar."""
+    out = np.zeros(len(a), dtype=bool)
+    out[1:] = (a[1:] > b[1:]) & (a[:-1] < b[:-1])
+    return out
+
+
+def signal_conditions(
+    rsi: np.ndarray,
+    stoch_k: np.ndarray,
+    stoch_d: np.ndarray,
+    macd: np.ndarray,
+    macd_signal: np.ndarray,
+    stoch_oversold: float,
+    stoch_overbought: float
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate every buy/sell condition for all bars at once.
+    
+    NumPy reference for the compiled ``stoch_rsi_macd_scores`` kernel.
+    Returns one boolean array per condition plus int8 ``buy_score`` and
+    ``sell_score`` arrays counting the conditions met on each bar.
+    """
+    conditions = {
+        'stoch_oversold': (stoch_k < stoch_oversold) & (stoch_d < stoch_oversold),
+        'rsi_above_mid': rsi > 50,
+        'macd_bull_cross': _crossed_above(macd, macd_signal),
+        'stoch_bull_cross': _crossed_above(stoch_k, stoch_d),
+        'stoch_overbought': (stoch_k > stoch_overbought) & (stoch_d > stoch_overbought),
+        'rsi_below_mid': rsi < 50,
+        'macd_bear_cross': _crossed_above(macd_signal, macd),
+        'stoch_bear_cross': _crossed_above(stoch_d, stoch_k),
+    }
+    conditions['buy_score'] = np.sum([conditions[name] for name in BUY_CONDITIONS], axis=0, dtype=np.int8)
+    conditions['sell_score'] = np.sum([conditions[name] for name in SELL_CONDITIONS], axis=0, dtype=np.int8)
+    return conditions
 
 
 class StochRSIMACDStrategy(BaseStrategy, TechnicalIndicatorsMixin):
@@ -40,125 +117,132 @@ class StochRSIMACDStrategy(BaseStrategy, TechnicalIndicatorsMixin):
         if stoch_d > stoch_k:
             raise ValueError("Stochastic D period must be <= K period")
     
+    def _bind_parameters(self) -> None:
+        """Bind indicator periods, signal thresholds and the buffer size as attributes."""
+        self._rsi_period = int(self.get_parameter('rsi_period'))
+        self._stoch_k_period = int(self.get_parameter('stoch_k_period'))
+        self._stoch_d_period = int(self.get_parameter('stoch_d_period'))
+        self._macd_fast = int(self.get_parameter('macd_fast'))
+        self._macd_slow = int(self.get_parameter('macd_slow'))
+        self._macd_signal = int(self.get_parameter('macd_signal'))
+        self._stoch_oversold = float(self.get_parameter('stoch_oversold'))
+        self._stoch_overbought = float(self.get_parameter('stoch_overbought'))
+        self._buffer_size = max(self._rsi_period, self._stoch_k_period, self._macd_slow) + 50
+    
     def calculate_indicators(self, data: MarketData) -> Dict[str, np.ndarray]:
         """Calculate technical indicators."""
-        df = data.to_dataframe()
-        close = df['close']
-        high = df['high']
-        low = df['low']
+        close = data.close
+        high = data.high
+        low = data.low
         
         # RSI
-        rsi = self.rsi(close, self.get_parameter('rsi_period'))
+        rsi = self.rsi(close, self._rsi_period)
         
         # Stochastic
         stoch_k, stoch_d = self.stochastic(
             high, low, close,
-            self.get_parameter('stoch_k_period'),
-            self.get_parameter('stoch_d_period')
+            self._stoch_k_period,
+            self._stoch_d_period
         )
         
         # MACD
         macd_line, signal_line, histogram = self.macd(
             close,
-            self.get_parameter('macd_fast'),
-            self.get_parameter('macd_slow'),
-            self.get_parameter('macd_signal')
+            self._macd_fast,
+            self._macd_slow,
+            self._macd_signal
         )
         
-        return {
-            'rsi': rsi.values,
-            'stoch_k': stoch_k.values,
-            'stoch_d': stoch_d.values,
-            'macd': macd_line.values,
-            'macd_signal': signal_line.values,
-            'macd_histogram': histogram.values
+        indicators = {
+            'rsi': rsi,
+            'stoch_k': stoch_k,
+            'stoch_d': stoch_d,
+            'macd': macd_line,
+            'macd_signal': signal_line,
+            'macd_histogram': histogram
         }
+        
+        # Condition scores for every bar, so generate_signal only indexes
+        indicators['buy_score'], indicators['sell_score'] = self._scores(indicators)
+        return indicators
+    
+    def _scores(self, indicators: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Buy and sell condition counts for every bar, from the compiled kernel."""
+        return stoch_rsi_macd_scores(
+            *(np.asarray(indicators[name], dtype=np.float64)
+              for name in ('rsi', 'stoch_k', 'stoch_d', 'macd', 'macd_signal')),
+            self._stoch_oversold,
+            self._stoch_overbought
+        )
+    
+    def _conditions_met(self, ind: IndicatorBundle, index: int, names: Tuple[str, ...]) -> Tuple[bool, ...]:
+        """Individual condition flags at one bar, for signal metadata."""
+        window = slice(index - 1, index + 1)
+        conditions = signal_conditions(
+            ind.rsi[window], ind.stoch_k[window], ind.stoch_d[window],
+            ind.macd[window], ind.macd_signal[window],
+            self._stoch_oversold, self._stoch_overbought
+        )
+        return tuple(bool(conditions[name][-1]) for name in names)
     
-    def generate_signal(self, data: MarketData, current_index: int) -> StrategyResult:
+    def generate_signal(
+        self,
+        data: MarketData,
+        current_index: int,
+        indicators: Optional[IndicatorBundle] = None
+    ) -> StrategyResult:
         """Generate trading signal based on Stochastic RSI and MACD."""
-        if current_index < 50:  # Need enough data for indicators
+        if current_index < WARMUP_BARS:  # Need enough data for indicators
             return StrategyResult(SignalType.HOLD, confidence=0.0)
         
         try:
-            # Get current values
-            rsi = self.get_indicator_value('rsi', current_index)
-            stoch_k = self.get_indicator_value('stoch_k', current_index)
-            stoch_d = self.get_indicator_value('stoch_d', current_index)
-            macd = self.get_indicator_value('macd', current_index)
-            macd_signal = self.get_indicator_value('macd_signal', current_index)
-            
-            # Get previous values for crossover detection
-            stoch_k_prev = self.get_indicator_value('stoch_k', current_index - 1)
-            stoch_d_prev = self.get_indicator_value('stoch_d', current_index - 1)
-            macd_prev = self.get_indicator_value('macd', current_index - 1)
-            macd_signal_prev = self.get_indicator_value('macd_signal', current_index - 1)
-            
-            # Parameters
-            rsi_oversold = self.get_parameter('rsi_oversold')
-            rsi_overbought = self.get_parameter('rsi_overbought')
-            stoch_oversold = self.get_parameter('stoch_oversold')
-            stoch_overbought = self.get_parameter('stoch_overbought')
-            
-            # Buy signal conditions
-            buy_conditions = [
-                stoch_k < stoch_oversold and stoch_d < stoch_oversold,
-                rsi > 50,  # RSI above middle
-                macd > macd_signal and macd_prev < macd_signal_prev,  # MACD bullish crossover
-                stoch_k > stoch_d and stoch_k_prev < stoch_d_prev  # Stochastic bullish crossover
-            ]
+            ind = indicators if indicators is not None else self._ind
+            if not hasattr(ind, 'buy_score'):
+                # Indicators set from outside calculate_indicators
+                buy_scores, sell_scores = self._scores(vars(ind))
+                ind = IndicatorBundle(**{**vars(ind), 'buy_score': buy_scores, 'sell_score': sell_scores})
             
-            # Sell signal conditions
-            sell_conditions = [
-                stoch_k > stoch_overbought and stoch_d > stoch_overbought,
-                rsi < 50,  # RSI below middle
-                macd < macd_signal and macd_prev > macd_signal_prev,  # MACD bearish crossover
-                stoch_k < stoch_d and stoch_k_prev > stoch_d_prev  # Stochastic bearish crossover
-            ]
-            
-            # Calculate confidence based on number of conditions met
-            buy_score = sum(buy_conditions)
-            sell_score = sum(sell_conditions)
+            # Precomputed number of conditions met
+            buy_score = int(ind.buy_score[current_index])
+            sell_score = int(ind.sell_score[current_index])
             
             if buy_score >= 3:
-                confidence = min(0.9, 0.5 + (buy_score * 0.1))
-                return StrategyResult(
-                    SignalType.BUY,
-                    confidence=confidence,
-                    metadata={
-                        'rsi': rsi,
-                        'stoch_k': stoch_k,
-                        'stoch_d': stoch_d,
-                        'macd': macd,
-                        'macd_signal': macd_signal,
-                        'buy_score': buy_score,
-                        'conditions_met': buy_conditions
-                    }
-                )
+                signal, score, names, meta = SignalType.BUY, buy_score, BUY_CONDITIONS, StochRSIMACDBuyMeta
             elif sell_score >= 3:
-                confidence = min(0.9, 0.5 + (sell_score * 0.1))
-                return StrategyResult(
-                    SignalType.SELL,
-                    confidence=confidence,
-                    metadata={
-                        'rsi': rsi,
-                        'stoch_k': stoch_k,
-                        'stoch_d': stoch_d,
-                        'macd': macd,
-                        'macd_signal': macd_signal,
-                        'sell_score': sell_score,
-                        'conditions_met': sell_conditions
-                    }
-                )
+                signal, score, names, meta = SignalType.SELL, sell_score, SELL_CONDITIONS, StochRSIMACDSellMeta
+            else:
+                return StrategyResult(SignalType.HOLD, confidence=0.0)
             
-            return StrategyResult(SignalType.HOLD, confidence=0.0)
+            # Score passed positionally: it is buy_score or sell_score by signal
+            return StrategyResult(
+                signal,
+                confidence=CONFIDENCE_BY_SCORE[score],
+                metadata=meta(
+                    float(ind.rsi[current_index]),
+                    float(ind.stoch_k[current_index]),
+                    float(ind.stoch_d[current_index]),
+                    float(ind.macd[current_index]),
+                    float(ind.macd_signal[current_index]),
+                    score,
+                    self._conditions_met(ind, current_index, names)
+                )
+            )
             
-        except (IndexError, ValueError) as e:
+        except (AttributeError, IndexError, KeyError, ValueError) as e:
             return StrategyResult(SignalType.HOLD, confidence=0.0, metadata={'error': str(e)})
     
+    def generate_signals_vectorized(self, data: MarketData) -> Tuple[np.ndarray, np.ndarray]:
+        """Signals and confidences for every bar from the precomputed condition scores."""
+        bundle = self.update_indicators(data)
+        buy = bundle.buy_score >= 3
+        sell = ~buy & (bundle.sell_score >= 3)
+        signals = buy.astype(np.int8) - sell.astype(np.int8)
+        signals[:WARMUP_BARS] = 0
+        
+        score = np.where(buy, bundle.buy_score, bundle.sell_score)
+        confidence = np.where(signals != 0, _CONFIDENCE_LUT[score], np.float32(0.0))
+        return signals, confidence
+    
     def get_required_buffer_size(self) -> int:
         """Get required buffer size for this strategy."""
-        return max(
-            self.get_parameter('rsi_period'),
-            self.get_parameter('stoch_k_period'),
-            self.get_parameter('macd_slow')
-        ) + 50
+        return self._buffer_size
@@ -3,9 +3,171 @@ Triple EMA trading strategy.
 """
 
 import numpy as np
-import pandas as pd
-from typing import Dict, Any, Optional
-from .base import BaseStrategy, StrategyResult, SignalType, MarketData, TechnicalIndicatorsMixin
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+from .base import BaseStrategy, StrategyResult, SignalType, MarketData, IndicatorBundle, TechnicalIndicatorsMixin
+from ._kernels import ema_loop_state, triple_ema_batch, triple_ema_signals
+
+
+def crossover_masks(
+    ema_fast: np.ndarray,
+    ema_medium: np.ndarray,
+    ema_slow: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bullish and bearish triple EMA crossovers for every bar.
+    
+    A bar is bullish when the fast EMA was below both others on the previous
+    bar and is above both now, bearish for the reverse. Bar 0 is neither.
+    """
+    fast, medium, slow = ema_fast[1:], ema_medium[1:], ema_slow[1:]
+    fast_prev, medium_prev, slow_prev = ema_fast[:-1], ema_medium[:-1], ema_slow[:-1]
+    
+    bull = np.zeros(len(ema_fast), dtype=bool)
+    bear = np.zeros(len(ema_fast), dtype=bool)
+    bull[1:] = (fast_prev < medium_prev) & (fast_prev < slow_prev) & (fast > medium) & (fast > slow)
+    bear[1:] = (fast_prev > medium_prev) & (fast_prev > slow_prev) & (fast < medium) & (fast < slow)
+    return bull, bear
+
+
+class TripleEMASignalMeta(NamedTuple):
+    """EMA values behind a crossover signal."""
+    ema_fast: float
+    ema_medium: float
+    ema_slow: float
+    crossover_type: str
+
+
+class TripleEMAStream:
+    """
+    Streaming triple EMA state for one symbol's live feed.
+    
+    ``update`` advances the three EMAs by one close in constant time using
+    the same weighted-sum recurrence as ``ema_loop`` (pandas
+    ``adjust=True``), so after the same closes the values match
+    ``calculate_indicators`` exactly.
+    """
+    
+    __slots__ = ('_decays', '_num', '_den', 'bars', 'current', 'previous')
+    
+    def __init__(self, fast: int, medium: int, slow: int):
+        self._decays = tuple(1.0 - 2.0 / (span + 1.0) for span in (fast, medium, slow))
+        self._num = [0.0, 0.0, 0.0]
+        self._den = [0.0, 0.0, 0.0]
+        self.bars = 0
+        self.current = (np.nan, np.nan, np.nan)
+        self.previous = (np.nan, np.nan, np.nan)
+    
+    @classmethod
+    def from_series(cls, close: np.ndarray, fast: int, medium: int, slow: int) -> Tuple['TripleEMAStream', np.ndarray]:
+        """
+        A stream that has consumed ``close``, built in one compiled pass per
+        span rather than bar by bar. Also returns the ``(3, len(close))``
+        EMA history.
+        """
+        stream = cls(fast, medium, slow)
+        emas = np.empty((3, len(close)))
+        for row, span in enumerate((fast, medium, slow)):
+            emas[row], stream._num[row], stream._den[row] = ema_loop_state(close, span)
+        
+        stream.bars = len(close)
+        if stream.bars:
+            stream.current = tuple(emas[:, -1].tolist())
+        if stream.bars > 1:
+            stream.previous = tuple(emas[:, -2].tolist())
+        return stream, emas
+    
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """Advance by one closed bar and return the (fast, medium, slow) EMAs."""
+        num, den = self._num, self._den
+        valid = close == close  # NaN closes leave the means unchanged
+        for i, decay in enumerate(self._decays):
+            num[i] *= decay
+            den[i] *= decay
+            if valid:
+                num[i] += close
+                den[i] += 1.0
+        
+        self.previous = self.current
+        self.current = tuple(n / d if d > 0 else np.nan for n, d in zip(num, den))
+        self.bars += 1
+        return self.current
+
+
+class _GrowingIndicators:
+    """
+    Triple EMA indicators over a close series that grows a bar at a time,
+    as a backtest stepping through history sees it.
+    
+    ``extends`` and ``extend`` both run in constant time: the check compares
+    the length, the first and last seen timestamps and the last close, and
+    ``extend`` advances every indicator by one bar with the same recurrence
+    as a full recalculation, so values are identical. Results are prefix
+    views of buffers that only ever get written past their end, so earlier
+    results stay valid.
+    """
+    
+    __slots__ = ('_closes', '_emas', '_bull', '_bear', '_stream', '_first_time', '_last_time')
+    
+    def __init__(self, close: np.ndarray, timestamp: np.ndarray, fast: int, medium: int, slow: int):
+        n = len(close)
+        capacity = n + 64
+        self._stream, emas = TripleEMAStream.from_series(close, fast, medium, slow)
+        self._first_time = timestamp[0] if n else None
+        self._last_time = timestamp[n - 1] if n else None
+        
+        self._closes = np.empty(capacity)
+        self._closes[:n] = close
+        self._emas = np.empty((3, capacity))
+        self._emas[:, :n] = emas
+        self._bull = np.zeros(capacity, dtype=bool)
+        self._bear = np.zeros(capacity, dtype=bool)
+        self._bull[:n], self._bear[:n] = crossover_masks(emas[0], emas[1], emas[2])
+    
+    def extends(self, close: np.ndarray, timestamp: np.ndarray) -> bool:
+        """Whether ``close`` is the series seen so far plus one bar."""
+        n = self._stream.bars
+        return (
+            n > 0
+            and len(close) == n + 1
+            and timestamp[0] == self._first_time
+            and timestamp[n - 1] == self._last_time
+            and close[n - 1] == self._closes[n - 1]
+        )
+    
+    def extend(self, close: float, timestamp: Any) -> None:
+        """Advance every indicator by one bar."""
+        i = self._stream.bars
+        if i == len(self._closes):
+            self._grow()
+        
+        self._closes[i] = close
+        self._last_time = timestamp
+        fast, medium, slow = self._stream.update(close)
+        self._emas[:, i] = (fast, medium, slow)
+        
+        if i > 0:
+            fast_prev, medium_prev, slow_prev = self._stream.previous
+            self._bull[i] = fast_prev < medium_prev and fast_prev < slow_prev and fast > medium and fast > slow
+            self._bear[i] = fast_prev > medium_prev and fast_prev > slow_prev and fast < medium and fast < slow
+    
+    def _grow(self) -> None:
+        """Double the buffers, leaving views of the old ones untouched."""
+        n = len(self._closes)
+        self._closes = np.concatenate((self._closes, np.empty(n)))
+        self._emas = np.concatenate((self._emas, np.empty((3, n))), axis=1)
+        self._bull = np.concatenate((self._bull, np.zeros(n, dtype=bool)))
+        self._bear = np.concatenate((self._bear, np.zeros(n, dtype=bool)))
+    
+    def indicators(self) -> Dict[str, np.ndarray]:
+        """Indicator arrays for the bars seen so far."""
+        n = self._stream.bars
+        return {
+            'ema_fast': self._emas[0, :n],
+            'ema_medium': self._emas[1, :n],
+            'ema_slow': self._emas[2, :n],
+            'bull_cross': self._bull[:n],
+            'bear_cross': self._bear[:n],
+        }
 
 
 class TripleEMAStrategy(BaseStrategy, TechnicalIndicatorsMixin):
@@ -34,73 +196,149 @@ class TripleEMAStrategy(BaseStrategy, TechnicalIndicatorsMixin):
         if fast < 1 or medium < 1 or slow < 1:
             raise ValueError("EMA periods must be positive integers")
     
+    def _bind_parameters(self) -> None:
+        """Bind EMA spans, the candle minimum and the buffer size as attributes."""
+        self._fast_ema = int(self.get_parameter('fast_ema'))
+        self._medium_ema = int(self.get_parameter('medium_ema'))
+        self._slow_ema = int(self.get_parameter('slow_ema'))
+        self._min_candles = int(self.get_parameter('min_candles'))
+        self._buffer_size = max(self._fast_ema, self._medium_ema, self._slow_ema) + 50
+        # Growing-window state per symbol, so interleaved series never
+        # extend or invalidate each other's
+        self._growing: Dict[str, _GrowingIndicators] = {}
+    
     def calculate_indicators(self, data: MarketData) -> Dict[str, np.ndarray]:
-        """Calculate EMA indicators."""
-        df = data.to_dataframe()
-        close = df['close']
+        """
+        Calculate EMA indicators.
         
-        fast_ema = self.get_parameter('fast_ema')
-        medium_ema = self.get_parameter('medium_ema')
-        slow_ema = self.get_parameter('slow_ema')
+        When ``data`` is the previous call's series for the same symbol plus
+        one bar (a backtest over a growing window) only the new bar is
+        calculated.
+        """
+        close, timestamp = data.close, data.timestamp
+        growing = self._growing.get(data.symbol)
+        if growing is not None and growing.extends(close, timestamp):
+            growing.extend(float(close[-1]), timestamp[-1])
+        else:
+            growing = _GrowingIndicators(close, timestamp, self._fast_ema, self._medium_ema, self._slow_ema)
+            self._growing[data.symbol] = growing
         
-        return {
-            'ema_fast': self.ema(close, fast_ema).values,
-            'ema_medium': self.ema(close, medium_ema).values,
-            'ema_slow': self.ema(close, slow_ema).values,
-        }
+        return growing.indicators()
+    
+    def calculate_indicators_batch(self, data_list: List[MarketData]) -> List[IndicatorBundle]:
+        """EMA bundles for many symbols, each group of equal-length series in one parallel pass."""
+        rows_by_length: Dict[int, List[int]] = {}
+        for row, data in enumerate(data_list):
+            rows_by_length.setdefault(len(data.close), []).append(row)
+        
+        bundles: List[Optional[IndicatorBundle]] = [None] * len(data_list)
+        for rows in rows_by_length.values():
+            close = np.vstack([data_list[row].close for row in rows])
+            emas = triple_ema_batch(close, self._fast_ema, self._medium_ema, self._slow_ema)
+            
+            for i, row in enumerate(rows):
+                ema_fast, ema_medium, ema_slow = emas[0, i], emas[1, i], emas[2, i]
+                bull_cross, bear_cross = crossover_masks(ema_fast, ema_medium, ema_slow)
+                bundles[row] = IndicatorBundle(
+                    ema_fast=ema_fast,
+                    ema_medium=ema_medium,
+                    ema_slow=ema_slow,
+                    bull_cross=bull_cross,
+                    bear_cross=bear_cross
+                )
+        
+        return bundles
+    
+    def stream(self, data: Optional[MarketData] = None) -> TripleEMAStream:
+        """Start a streaming EMA state, seeded with ``data``'s closes if given."""
+        if data is None:
+            return TripleEMAStream(self._fast_ema, self._medium_ema, self._slow_ema)
+        return TripleEMAStream.from_series(data.close, self._fast_ema, self._medium_ema, self._slow_ema)[0]
+    
+    def stream_signal(self, stream: TripleEMAStream) -> SignalType:
+        """Crossover signal for the latest bar of a stream, as ``generate_signal`` would give."""
+        if stream.bars - 1 < self._min_candles:
+            return SignalType.HOLD
+        
+        fast, medium, slow = stream.current
+        fast_prev, medium_prev, slow_prev = stream.previous
+        if fast_prev > medium_prev and fast_prev > slow_prev and fast < medium and fast < slow:
+            return SignalType.SELL
+        if fast_prev < medium_prev and fast_prev < slow_prev and fast > medium and fast > slow:
+            return SignalType.BUY
+        return SignalType.HOLD
     
-    def generate_signal(self, data: MarketData, current_index: int) -> StrategyResult:
+    def generate_signal(
+        self,
+        data: MarketData,
+        current_index: int,
+        indicators: Optional[IndicatorBundle] = None
+    ) -> StrategyResult:
         """Generate trading signal based on triple EMA crossover."""
-        if current_index < self.get_parameter('min_candles'):
+        if current_index < self._min_candles:
             return StrategyResult(SignalType.HOLD, confidence=0.0)
         
         try:
-            # Get current and previous values
-            ema_fast = self.get_indicator_value('ema_fast', current_index)
-            ema_medium = self.get_indicator_value('ema_medium', current_index)
-            ema_slow = self.get_indicator_value('ema_slow', current_index)
-            
-            ema_fast_prev = self.get_indicator_value('ema_fast', current_index - 1)
-            ema_medium_prev = self.get_indicator_value('ema_medium', current_index - 1)
-            ema_slow_prev = self.get_indicator_value('ema_slow', current_index - 1)
-            
-            # Check for bearish crossover (sell signal)
-            if (ema_fast_prev > ema_medium_prev and ema_fast_prev > ema_slow_prev and
-                ema_fast < ema_medium and ema_fast < ema_slow):
-                return StrategyResult(
-                    SignalType.SELL,
-                    confidence=0.8,
-                    metadata={
-                        'ema_fast': ema_fast,
-                        'ema_medium': ema_medium,
-                        'ema_slow': ema_slow,
-                        'crossover_type': 'bearish'
-                    }
+            ind = indicators if indicators is not None else self._ind
+            if hasattr(ind, 'bull_cross'):
+                bull_cross, bear_cross = ind.bull_cross, ind.bear_cross
+            else:
+                # Indicators set from outside calculate_indicators
+                bull_cross, bear_cross = crossover_masks(
+                    np.asarray(ind.ema_fast, dtype=np.float64),
+                    np.asarray(ind.ema_medium, dtype=np.float64),
+                    np.asarray(ind.ema_slow, dtype=np.float64)
                 )
             
-            # Check for bullish crossover (buy signal)
-            elif (ema_fast_prev < ema_medium_prev and ema_fast_prev < ema_slow_prev and
-                  ema_fast > ema_medium and ema_fast > ema_slow):
-                return StrategyResult(
-                    SignalType.BUY,
-                    confidence=0.8,
-                    metadata={
-                        'ema_fast': ema_fast,
-                        'ema_medium': ema_medium,
-                        'ema_slow': ema_slow,
-                        'crossover_type': 'bullish'
-                    }
-                )
+            # Bearish crossover (sell signal) or bullish crossover (buy signal)
+            if bear_cross[current_index]:
+                signal, crossover_type = SignalType.SELL, 'bearish'
+            elif bull_cross[current_index]:
+                signal, crossover_type = SignalType.BUY, 'bullish'
+            else:
+                return StrategyResult(SignalType.HOLD, confidence=0.0)
             
-            return StrategyResult(SignalType.HOLD, confidence=0.0)
+            return StrategyResult(
+                signal,
+                confidence=0.8,
+                metadata=TripleEMASignalMeta(
+                    ema_fast=float(ind.ema_fast[current_index]),
+                    ema_medium=float(ind.ema_medium[current_index]),
+                    ema_slow=float(ind.ema_slow[current_index]),
+                    crossover_type=crossover_type
+                )
+            )
             
-        except (IndexError, ValueError) as e:
+        except (AttributeError, IndexError, ValueError) as e:
             return StrategyResult(SignalType.HOLD, confidence=0.0, metadata={'error': str(e)})
     
+    def generate_signals_batch(
+        self,
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        current_index: int
+    ) -> np.ndarray:
+        """Triple EMA crossover signals for every row in one compiled pass."""
+        if not self._min_candles <= current_index < close.shape[1]:
+            return np.zeros(close.shape[0], dtype=np.int8)
+        
+        return triple_ema_signals(
+            np.ascontiguousarray(close, dtype=np.float64),
+            self._fast_ema,
+            self._medium_ema,
+            self._slow_ema,
+            current_index
+        )
+    
+    def generate_signals_vectorized(self, data: MarketData) -> Tuple[np.ndarray, np.ndarray]:
+        """Triple EMA crossover signals and confidences for every bar."""
+        bundle = self.update_indicators(data)
+        signals = bundle.bull_cross.astype(np.int8) - bundle.bear_cross.astype(np.int8)
+        signals[:self._min_candles] = 0
+        confidence = np.where(signals != 0, 0.8, 0.0).astype(np.float32)
+        return signals, confidence
+    
     def get_required_buffer_size(self) -> int:
         """Get required buffer size for this strategy."""
-        return max(
-            self.get_parameter('fast_ema'),
-            self.get_parameter('medium_ema'),
-            self.get_parameter('slow_ema')
-        ) + 50
+        return self._buffer_size
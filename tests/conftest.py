@@ -1,20 +1,16 @@
 """Test configuration and fixtures."""
 
 import pytest
-import asyncio
 from unittest.mock import Mock, AsyncMock
 from typing import Dict, Any
 
+import numpy as np
+
 from binance_trading_bot.core.config import Config
 from binance_trading_bot.core.exceptions import TradingBotError
 
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Bars in the session-wide sample market data
+SAMPLE_BARS = 500
 
 
 @pytest.fixture
@@ -112,18 +108,30 @@ def mock_binance_client():
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_market_data():
-    """Sample market data for testing."""
-    return {
-        'symbol': 'BTCUSDT',
-        'open': 50000.0,
-        'high': 51000.0,
-        'low': 49000.0,
-        'close': 50500.0,
-        'volume': 1000.0,
-        'timestamp': 1640995200000
+    """
+    Sample OHLCV market data as column arrays, one entry per bar.
+    
+    Built once per session from a fixed seed and made read-only so tests
+    can share it; pass it straight to ``MarketData(symbol, **data)``.
+    """
+    rng = np.random.default_rng(0)
+    close = 50000.0 + np.cumsum(rng.standard_normal(SAMPLE_BARS) * 50.0)
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    wick = np.abs(rng.standard_normal(SAMPLE_BARS)) * 25.0
+    
+    data = {
+        'open': open_,
+        'high': np.maximum(open_, close) + wick,
+        'low': np.minimum(open_, close) - wick,
+        'close': close,
+        'volume': rng.uniform(500.0, 1500.0, SAMPLE_BARS),
+        'timestamp': 1640995200000 + 60_000 * np.arange(SAMPLE_BARS, dtype=np.int64)
     }
+    for values in data.values():
+        values.setflags(write=False)
+    return data
 
 
 @pytest.fixture
@@ -22,7 +22,7 @@ class TestSettings:
             'LEVERAGE': '20',
             'ORDER_SIZE': '5.0'
         }):
-            settings = Settings()
+            settings = Settings.from_env()
             assert settings.api_key == 'test_key'
             assert settings.api_secret == 'test_secret'
             assert settings.trading_strategy == 'test_strategy'
@@ -35,7 +35,7 @@ class TestSettings:
             'BINANCE_API_KEY': 'test_key',
             'BINANCE_API_SECRET': 'test_secret'
         }, clear=True):
-            settings = Settings()
+            settings = Settings.from_env()
             assert settings.trading_strategy == 'tripleEMAStochasticRSIATR'
             assert settings.leverage == 10
             assert settings.order_size == 3.0
@@ -48,7 +48,7 @@ class TestSettings:
             'BINANCE_API_SECRET': 'test_secret',
             'SYMBOLS_TO_TRADE': 'BTCUSDT,ETHUSDT,ADAUSDT'
         }, clear=True):
-            settings = Settings()
+            settings = Settings.from_env()
             assert settings.symbols_to_trade == ['BTCUSDT', 'ETHUSDT', 'ADAUSDT']
     
     def test_coin_exclusion_list_parsing(self):
@@ -58,7 +58,7 @@ class TestSettings:
             'BINANCE_API_SECRET': 'test_secret',
             'COIN_EXCLUSION_LIST': 'USDCUSDT,BTCDOMUSDT'
         }, clear=True):
-            settings = Settings()
+            settings = Settings.from_env()
             assert settings.coin_exclusion_list == ['USDCUSDT', 'BTCDOMUSDT']
     
     def test_custom_tp_sl_functions_parsing(self):
@@ -68,7 +68,7 @@ class TestSettings:
             'BINANCE_API_SECRET': 'test_secret',
             'CUSTOM_TP_SL_FUNCTIONS': 'USDT,PERCENTAGE'
         }, clear=True):
-            settings = Settings()
+            settings = Settings.from_env()
             assert settings.custom_tp_sl_functions == ['USDT', 'PERCENTAGE']
     
     def test_leverage_validation(self):
@@ -79,7 +79,7 @@ class TestSettings:
             'LEVERAGE': '200'  # Invalid leverage
         }, clear=True):
             with pytest.raises(ValueError):
-                Settings()
+                Settings.from_env()
     
     def test_order_size_validation(self):
         """Test order size validation."""
@@ -89,7 +89,7 @@ class TestSettings:
             'ORDER_SIZE': '150.0'  # Invalid order size
         }, clear=True):
             with pytest.raises(ValueError):
-                Settings()
+                Settings.from_env()
 
 
 class TestTradingConfig:
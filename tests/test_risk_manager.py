@@ -3,11 +3,12 @@ Comprehensive tests for risk management system.
 """
 
 import pytest
+import numpy as np
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 
 from binance_trading_bot.engine.risk_manager import (
-    RiskManager, RiskLevel, RiskMetrics, PositionRisk
+    RiskManager, RiskLevel, RiskMetrics, PositionRisk, ViolationCode, format_violation
 )
 from binance_trading_bot.core.exceptions import RiskManagementError, InsufficientFundsError
 
@@ -60,6 +61,15 @@ class TestRiskManager:
         assert risk_manager.account_balance == 11000.0
         assert risk_manager.initial_balance == 10000.0  # Should not change
     
+    def test_drawdown_measured_from_peak(self, risk_manager):
+        """Test drawdown uses the equity high-water mark, not the initial balance."""
+        risk_manager.set_account_balance(10000.0)
+        risk_manager.set_account_balance(12000.0)
+        risk_manager.set_account_balance(10800.0)
+        
+        assert risk_manager.peak_balance == 12000.0
+        assert risk_manager._calculate_drawdown() == pytest.approx(0.1)
+    
     def test_add_position(self, risk_manager, sample_position):
         """Test adding position to risk tracking."""
         risk_manager.add_position(sample_position)
@@ -87,6 +97,22 @@ class TestRiskManager:
         assert updated_position.current_price == new_price
         assert updated_position.unrealized_pnl == 200.0  # (52000 - 50000) * 0.1
     
+    def test_update_short_position(self, risk_manager):
+        """Test P&L of a short position, which carries a negative size."""
+        risk_manager.add_position(PositionRisk(
+            symbol="ETHUSDT",
+            position_size=-2.0,
+            entry_price=3000.0,
+            current_price=3000.0,
+            unrealized_pnl=0.0,
+            risk_percentage=0.0,
+            stop_loss_distance=100.0,
+            take_profit_distance=200.0
+        ))
+        
+        risk_manager.update_position("ETHUSDT", 2900.0)
+        assert risk_manager.positions["ETHUSDT"].unrealized_pnl == 200.0  # (2900 - 3000) * -2
+    
     def test_calculate_position_size(self, risk_manager):
         """Test position size calculation."""
         risk_manager.set_account_balance(10000.0)
@@ -140,7 +166,8 @@ class TestRiskManager:
         is_valid, violations = risk_manager.check_risk_limits(large_position_size, "BTCUSDT")
         
         assert not is_valid
-        assert any("Position size exceeds maximum" in violation for violation in violations)
+        assert any(code == ViolationCode.POSITION_SIZE for code, _ in violations)
+        assert any("Position size exceeds maximum" in format_violation(violation) for violation in violations)
     
     def test_check_risk_limits_max_positions_exceeded(self, risk_manager):
         """Test risk limit checking with max positions exceeded."""
@@ -164,7 +191,22 @@ class TestRiskManager:
         is_valid, violations = risk_manager.check_risk_limits(0.01, "NEWSYMBOL")
         
         assert not is_valid
-        assert any("Maximum number of positions reached" in violation for violation in violations)
+        assert (ViolationCode.MAX_POSITIONS, risk_manager.max_positions) in violations
+        assert "Maximum number of positions reached (5)" in map(format_violation, violations)
+    
+    def test_check_risk_limits_batch_matches_scalar(self, risk_manager):
+        """Test batch screening against one check_risk_limits call per candidate."""
+        risk_manager.set_account_balance(10000.0)
+        risk_manager._get_current_price = lambda symbol: {"BTCUSDT": 50000.0, "ETHUSDT": 3000.0}[symbol]
+        
+        sizes = np.array([0.01, 0.05, 0.1, 2.0])
+        symbols = ["BTCUSDT", "BTCUSDT", "ETHUSDT", "ETHUSDT"]
+        
+        ok = risk_manager.check_risk_limits_batch(sizes, symbols)
+        expected = [risk_manager.check_risk_limits(size, symbol)[0] for size, symbol in zip(sizes, symbols)]
+        
+        assert ok.tolist() == expected
+        assert ok.any() and not ok.all()
     
     def test_calculate_risk_metrics(self, risk_manager):
         """Test risk metrics calculation."""
@@ -192,6 +234,17 @@ class TestRiskManager:
         assert 0 <= metrics.risk_score <= 100
         assert isinstance(metrics.risk_level, RiskLevel)
     
+    def test_get_risk_level_fast_tracks_state_changes(self, risk_manager):
+        """Test cached risk level is refreshed after risk state changes."""
+        risk_manager.set_account_balance(10000.0)
+        assert risk_manager.get_risk_level_fast() == RiskLevel.LOW
+        
+        # A large loss moves the daily P&L score, so the cache must not be reused
+        risk_manager.update_daily_pnl(-3000.0)
+        risk_manager.set_account_balance(7000.0)
+        assert risk_manager.get_risk_level_fast() == risk_manager.calculate_risk_metrics().risk_level
+        assert risk_manager.get_risk_level_fast() != RiskLevel.LOW
+    
     def test_should_close_position_stop_loss(self, risk_manager, sample_position):
         """Test position closure due to stop loss."""
         risk_manager.set_account_balance(10000.0)
@@ -231,6 +284,94 @@ class TestRiskManager:
         assert not should_close
         assert "Position within risk limits" in reason
     
+    def test_positions_to_close_matches_should_close_position(self, risk_manager):
+        """Test the bulk closure scan against should_close_position per symbol."""
+        risk_manager.set_account_balance(10000.0)
+        
+        for i, price in enumerate((100.0, 50.0, 200.0, 101.0)):
+            risk_manager.add_position(PositionRisk(
+                symbol=f"SYMBOL{i}",
+                position_size=5.0,
+                entry_price=100.0,
+                current_price=100.0,
+                unrealized_pnl=0.0,
+                risk_percentage=0.0,
+                stop_loss_distance=1.0,
+                take_profit_distance=2.0
+            ))
+            risk_manager.update_position(f"SYMBOL{i}", price)
+        
+        expected = {}
+        for symbol in risk_manager.positions:
+            should_close, reason = risk_manager.should_close_position(symbol)
+            if should_close:
+                expected[symbol] = reason
+        
+        assert risk_manager.positions_to_close() == expected
+        assert expected == {"SYMBOL1": "Stop loss triggered", "SYMBOL2": "Take profit reached"}
+    
+    def test_running_totals_match_positions(self, risk_manager):
+        """Test running exposure and P&L totals against a full recomputation."""
+        risk_manager.set_account_balance(10000.0)
+        
+        for i in range(6):
+            risk_manager.add_position(PositionRisk(
+                symbol=f"SYMBOL{i}",
+                position_size=0.1 * (i + 1) * (-1 if i % 2 else 1),
+                entry_price=100.0,
+                current_price=100.0 + i,
+                unrealized_pnl=0.0,
+                risk_percentage=0.0,
+                stop_loss_distance=1.0,
+                take_profit_distance=2.0
+            ))
+        
+        risk_manager.update_position("SYMBOL1", 90.0)
+        risk_manager.update_position("SYMBOL4", 120.0)
+        risk_manager.remove_position("SYMBOL2")
+        risk_manager.remove_position("SYMBOL0")
+        
+        positions = risk_manager.positions.values()
+        expected_exposure = sum(pos.position_size * pos.current_price for pos in positions)
+        expected_pnl = sum(pos.unrealized_pnl for pos in positions)
+        
+        assert risk_manager._calculate_total_exposure() == pytest.approx(expected_exposure)
+        assert risk_manager._upnl_total == pytest.approx(expected_pnl)
+    
+    def test_update_prices_matches_update_position(self, risk_manager):
+        """Test the bulk price update against one update_position call per symbol."""
+        single = RiskManager()
+        prices = {"SYMBOL0": 95.0, "SYMBOL2": 110.0, "SYMBOL3": 80.0, "UNTRACKED": 1.0}
+        
+        for manager in (risk_manager, single):
+            manager.set_account_balance(10000.0)
+            for i in range(4):
+                manager.add_position(PositionRisk(
+                    symbol=f"SYMBOL{i}",
+                    position_size=0.5 * (-1 if i % 2 else 1),
+                    entry_price=100.0,
+                    current_price=100.0,
+                    unrealized_pnl=0.0,
+                    risk_percentage=0.0,
+                    stop_loss_distance=1.0,
+                    take_profit_distance=2.0
+                ))
+        
+        risk_manager.update_prices(prices)
+        for symbol, price in prices.items():
+            single.update_position(symbol, price)
+        
+        for symbol, position in single.positions.items():
+            bulk = risk_manager.positions[symbol]
+            assert bulk.current_price == position.current_price
+            assert bulk.unrealized_pnl == pytest.approx(position.unrealized_pnl)
+            assert bulk.risk_percentage == pytest.approx(position.risk_percentage)
+        
+        assert "UNTRACKED" not in risk_manager.positions
+        assert risk_manager._calculate_total_exposure() == pytest.approx(single._calculate_total_exposure())
+        assert risk_manager._upnl_total == pytest.approx(single._upnl_total)
+        assert risk_manager.peak_balance == pytest.approx(single.peak_balance)
+    
     def test_update_daily_pnl(self, risk_manager):
         """Test daily P&L history update."""
         risk_manager.update_daily_pnl(100.0)
@@ -272,6 +413,14 @@ class TestRiskManager:
         assert report['account_balance'] == 10000.0
         assert report['position_count'] == 1
         assert len(report['positions']) == 1
+        assert report['positions'][0] == {
+            'symbol': "BTCUSDT",
+            'size': 0.1,
+            'entry_price': 50000.0,
+            'current_price': 51000.0,
+            'unrealized_pnl': 100.0,
+            'risk_percentage': 0.01
+        }
 
 
 class TestPositionRisk:
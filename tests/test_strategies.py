@@ -7,9 +7,13 @@ import numpy as np
 import pandas as pd
 from unittest.mock import Mock, patch
 
-from binance_trading_bot.strategies.base import MarketData, SignalType
+from binance_trading_bot.strategies.base import (
+    BaseStrategy, CircularSeries, MarketData, SignalType, generate_signals_parallel
+)
+from binance_trading_bot.strategies.registry import StrategyRegistry
+from binance_trading_bot.strategies._kernels import stoch_loop, stoch_moving, stoch_windows
 from binance_trading_bot.strategies.triple_ema import TripleEMAStrategy
-from binance_trading_bot.strategies.stoch_rsi_macd import StochRSIMACDStrategy
+from binance_trading_bot.strategies.stoch_rsi_macd import StochRSIMACDStrategy, signal_conditions
 
 
 class TestTripleEMAStrategy:
@@ -95,7 +99,7 @@ class TestTripleEMAStrategy:
         
         assert result.signal == SignalType.BUY
         assert result.confidence == 0.8
-        assert result.metadata['crossover_type'] == 'bullish'
+        assert result.metadata.crossover_type == 'bullish'
     
     def test_generate_signal_bearish_crossover(self, strategy, sample_data):
         """Test bearish crossover signal generation."""
@@ -110,7 +114,8 @@ class TestTripleEMAStrategy:
         
         assert result.signal == SignalType.SELL
         assert result.confidence == 0.8
-        assert result.metadata['crossover_type'] == 'bearish'
+        assert result.metadata.crossover_type == 'bearish'
+        assert result.metadata_dict()['crossover_type'] == 'bearish'
     
     def test_generate_signal_no_crossover(self, strategy, sample_data):
         """Test signal generation with no crossover."""
@@ -126,11 +131,138 @@ class TestTripleEMAStrategy:
         assert result.signal == SignalType.HOLD
         assert result.confidence == 0.0
     
+    def test_update_indicators_returns_bundle(self, strategy, sample_data):
+        """Test that indicator bundles are returned, not stored on the strategy."""
+        bundle = strategy.update_indicators(sample_data)
+        
+        assert strategy.indicators == {}
+        assert len(bundle.ema_fast) == len(sample_data.close)
+        
+        result = strategy.generate_signal(sample_data, 2, bundle)
+        assert result.signal == SignalType.HOLD
+    
+    def test_stream_matches_generate_signal(self, strategy, sample_data):
+        """Test that the streaming EMAs track the batch indicators bar by bar."""
+        bundle = strategy.update_indicators(sample_data)
+        stream = strategy.stream()
+        
+        for index, close in enumerate(sample_data.close):
+            stream.update(close)
+            np.testing.assert_allclose(
+                stream.current,
+                (bundle.ema_fast[index], bundle.ema_medium[index], bundle.ema_slow[index]),
+                rtol=1e-12
+            )
+            assert strategy.stream_signal(stream) == strategy.generate_signal(sample_data, index, bundle).signal
+    
+    def test_calculate_indicators_extends_growing_window(self, strategy, sample_market_data):
+        """Test that one-bar extensions match a full recalculation and leave earlier results intact."""
+        previous = None
+        for n in range(40, 160):
+            data = MarketData('BTCUSDT', **{k: v[:n] for k, v in sample_market_data.items()})
+            indicators = strategy.calculate_indicators(data)
+            expected = TripleEMAStrategy().calculate_indicators(data)
+            
+            for name, values in expected.items():
+                np.testing.assert_array_equal(indicators[name], values)
+            if previous is not None:
+                for name, values in previous[0].items():
+                    np.testing.assert_array_equal(values, previous[1][name])
+            previous = (indicators, {name: values.copy() for name, values in indicators.items()})
+    
+    def test_calculate_indicators_interleaved_symbols(self, strategy, sample_market_data):
+        """Test that growing windows of interleaved symbols match a full recalculation."""
+        other = {k: v[::-1].copy() for k, v in sample_market_data.items()}
+        for n in range(40, 80):
+            for symbol, series in (('BTCUSDT', sample_market_data), ('ETHUSDT', other)):
+                data = MarketData(symbol, **{k: v[:n] for k, v in series.items()})
+                indicators = strategy.calculate_indicators(data)
+                expected = TripleEMAStrategy().calculate_indicators(data)
+                
+                for name, values in expected.items():
+                    np.testing.assert_array_equal(indicators[name], values)
+    
+    def test_stream_from_data_matches_replay(self, strategy, sample_data):
+        """Test that a stream seeded from data equals one fed bar by bar."""
+        seeded = strategy.stream(sample_data)
+        replayed = strategy.stream()
+        for close in sample_data.close:
+            replayed.update(close)
+        
+        assert seeded.bars == replayed.bars
+        assert seeded.current == replayed.current
+        assert seeded.previous == replayed.previous
+    
+    def test_update_indicators_is_memoized(self, strategy, sample_data):
+        """Test that unchanged data reuses the last bundle and new klines do not."""
+        bundle = strategy.update_indicators(sample_data)
+        assert strategy.update_indicators(sample_data) is bundle
+        
+        sample_data.append(np.array([100, 100.0, 101.0, 99.0, 100.5, 1000.0]))
+        extended = strategy.update_indicators(sample_data)
+        assert extended is not bundle
+        
+        strategy.set_parameter('fast_ema', 4)
+        assert strategy.update_indicators(sample_data) is not extended
+    
+    def test_get_indicator_value(self, strategy):
+        """Test indicator lookup after assigning indicators."""
+        strategy.indicators = {'ema_fast': np.array([1.0, 2.0, 3.0])}
+        
+        assert strategy.get_indicator_value('ema_fast', 2) == 3.0
+        with pytest.raises(ValueError):
+            strategy.get_indicator_value('ema_slow', 0)
+        with pytest.raises(IndexError):
+            strategy.get_indicator_value('ema_fast', 3)
+    
+    def test_generate_signals_batch_matches_per_symbol(self, strategy):
+        """Test that the batch kernel agrees with per-symbol signal generation."""
+        rng = np.random.default_rng(7)
+        close = 100 + np.cumsum(rng.standard_normal((32, 120)), axis=1)
+        
+        actionable = 0
+        for index in range(close.shape[1]):
+            expected = BaseStrategy.generate_signals_batch(strategy, close, close, close, index)
+            result = strategy.generate_signals_batch(close, close, close, index)
+            np.testing.assert_array_equal(result, expected)
+            actionable += np.count_nonzero(result)
+        
+        assert actionable > 0
+    
+    def test_generate_signals_vectorized_matches_generate_signal(self, strategy, sample_market_data):
+        """Test that the one-pass signals agree with bar-by-bar generation."""
+        data = MarketData('BTCUSDT', **sample_market_data)
+        expected = BaseStrategy.generate_signals_vectorized(strategy, data)
+        signals, confidence = strategy.generate_signals_vectorized(data)
+        
+        assert signals.dtype == np.int8 and confidence.dtype == np.float32
+        np.testing.assert_array_equal(signals, expected[0])
+        np.testing.assert_array_equal(confidence, expected[1])
+        assert np.count_nonzero(signals) > 0
+    
+    def test_calculate_indicators_batch_matches_per_symbol(self, strategy, sample_market_data):
+        """Test that the parallel batch agrees with per-symbol indicators, mixed lengths included."""
+        data_list = [
+            MarketData('BTCUSDT', **sample_market_data),
+            MarketData('ETHUSDT', **{k: v[100:] for k, v in sample_market_data.items()}),
+            MarketData('BNBUSDT', **{k: v[:-100] for k, v in sample_market_data.items()}),
+        ]
+        
+        for data, bundle in zip(data_list, strategy.calculate_indicators_batch(data_list)):
+            expected = strategy.calculate_indicators(data)
+            for name, values in expected.items():
+                np.testing.assert_array_equal(getattr(bundle, name), values)
+    
     def test_get_required_buffer_size(self, strategy):
         """Test buffer size calculation."""
         buffer_size = strategy.get_required_buffer_size()
         assert buffer_size > 0
         assert buffer_size >= strategy.get_parameter('slow_ema')
+    
+    def test_buffer_size_follows_parameters(self, strategy):
+        """Test that the cached buffer size is refreshed by set_parameter."""
+        strategy.set_parameter('slow_ema', 120)
+        assert strategy.get_required_buffer_size() == 170
 
 
 class TestStochRSIMACDStrategy:
@@ -174,6 +306,75 @@ class TestStochRSIMACDStrategy:
             assert indicator in indicators
             assert len(indicators[indicator]) == len(sample_data.close)
     
+    def test_signal_conditions(self):
+        """Test the vectorized buy/sell condition scores."""
+        conditions = signal_conditions(
+            rsi=np.array([40.0, 45.0, 60.0]),
+            stoch_k=np.array([10.0, 5.0, 15.0]),
+            stoch_d=np.array([12.0, 10.0, 10.0]),
+            macd=np.array([-0.2, -0.1, 0.1]),
+            macd_signal=np.array([0.0, 0.0, 0.05]),
+            stoch_oversold=20,
+            stoch_overbought=80
+        )
+        
+        np.testing.assert_array_equal(conditions['macd_bull_cross'], [False, False, True])
+        np.testing.assert_array_equal(conditions['stoch_bull_cross'], [False, False, True])
+        np.testing.assert_array_equal(conditions['buy_score'], [1, 1, 4])
+        np.testing.assert_array_equal(conditions['sell_score'], [1, 1, 0])
+    
+    def test_signal_metadata_keeps_score_names(self, strategy, sample_data):
+        """Test that buy metadata reports buy_score and sell metadata sell_score."""
+        pad = np.full(50, 50.0)
+        strategy.indicators = {
+            'rsi': np.concatenate((pad, [40.0, 45.0, 60.0])),
+            'stoch_k': np.concatenate((pad, [10.0, 5.0, 15.0])),
+            'stoch_d': np.concatenate((pad, [12.0, 10.0, 10.0])),
+            'macd': np.concatenate((pad * 0, [-0.2, -0.1, 0.1])),
+            'macd_signal': np.concatenate((pad * 0, [0.0, 0.0, 0.05])),
+        }
+        metadata = strategy.generate_signal(sample_data, 52).metadata_dict()
+        assert metadata['buy_score'] == 4 and 'sell_score' not in metadata
+        
+        # Mirrored around the midline the same bar is a sell
+        strategy.indicators = {
+            name: (-values if name.startswith('macd') else 100.0 - values)
+            for name, values in strategy.indicators.items()
+        }
+        metadata = strategy.generate_signal(sample_data, 52).metadata_dict()
+        assert metadata['sell_score'] == 4 and 'buy_score' not in metadata
+
+    def test_scores_match_signal_conditions(self, strategy, sample_data):
+        """Test that the compiled scores agree with the NumPy conditions."""
+        indicators = strategy.calculate_indicators(sample_data)
+        expected = signal_conditions(
+            indicators['rsi'], indicators['stoch_k'], indicators['stoch_d'],
+            indicators['macd'], indicators['macd_signal'],
+            strategy.get_parameter('stoch_oversold'),
+            strategy.get_parameter('stoch_overbought')
+        )
+        
+        np.testing.assert_array_equal(indicators['buy_score'], expected['buy_score'])
+        np.testing.assert_array_equal(indicators['sell_score'], expected['sell_score'])
+    
+    def test_generate_signals_batch_leaves_memo_alone(self, strategy, sample_market_data):
+        """Test that the default batch path does not write the shared instance's memo."""
+        close = np.vstack([sample_market_data['close']] * 2)
+        signals = strategy.generate_signals_batch(close, close + 10.0, close - 10.0, close.shape[1] - 1)
+        
+        assert signals.shape == (2,)
+        assert strategy._indicator_memo is None
+    
+    def test_generate_signals_vectorized_matches_generate_signal(self, strategy, sample_market_data):
+        """Test that the one-pass signals agree with bar-by-bar generation."""
+        data = MarketData('BTCUSDT', **sample_market_data)
+        expected = BaseStrategy.generate_signals_vectorized(strategy, data)
+        signals, confidence = strategy.generate_signals_vectorized(data)
+        
+        assert signals.dtype == np.int8 and confidence.dtype == np.float32
+        np.testing.assert_array_equal(signals, expected[0])
+        np.testing.assert_array_equal(confidence, expected[1])
+    
     def test_generate_signal_insufficient_data(self, strategy, sample_data):
         """Test signal generation with insufficient data."""
         result = strategy.generate_signal(sample_data, 10)
@@ -263,6 +464,72 @@ class TestMarketData:
         assert 'close' in df.columns
         assert 'volume' in df.columns
         assert 'timestamp' in df.columns
+        assert data.to_dataframe() is df
+        
+        data.append(np.array([4, 103.0, 104.0, 102.0, 103.5, 1300.0]))
+        extended = data.to_dataframe()
+        assert extended is not df
+        assert extended['close'].iloc[-1] == 103.5
+    
+    def test_append_rolls_window(self):
+        """Test that appends beyond capacity drop the oldest kline."""
+        data = MarketData(
+            symbol="BTCUSDT",
+            open=[100, 101, 102],
+            high=[101, 102, 103],
+            low=[99, 100, 101],
+            close=[100.5, 101.5, 102.5],
+            volume=[1000, 1100, 1200],
+            timestamp=[1, 2, 3],
+            capacity=3
+        )
+        
+        data.append(np.array([4, 103, 104, 102, 103.5, 1300]))
+        
+        np.testing.assert_array_equal(data.close, [101.5, 102.5, 103.5])
+        np.testing.assert_array_equal(data.timestamp, [2, 3, 4])
+        assert data.close.flags['C_CONTIGUOUS']
+    
+    def test_append_replaces_same_open_time(self):
+        """Test that a closed kline replaces the in-progress row."""
+        data = MarketData(
+            symbol="BTCUSDT",
+            open=[100, 101],
+            high=[101, 102],
+            low=[99, 100],
+            close=[100.5, 101.5],
+            volume=[1000, 1100],
+            timestamp=[1, 2],
+            capacity=5
+        )
+        
+        data.append(np.array([2, 101, 102.5, 100, 102.0, 1150]))
+        
+        np.testing.assert_array_equal(data.close, [100.5, 102.0])
+        np.testing.assert_array_equal(data.timestamp, [1, 2])
+
+
+class TestCircularSeries:
+    """Test cases for CircularSeries."""
+    
+    def test_push_wraps_in_order(self):
+        """Test that values come back oldest first after wrapping."""
+        series = CircularSeries(3)
+        for value in range(5):
+            series.push(value)
+        
+        assert len(series) == 3
+        np.testing.assert_array_equal(series.as_ordered(), [2, 3, 4])
+    
+    def test_ordered_view_is_cached_until_push(self):
+        """Test that as_ordered is reused until the next write."""
+        series = CircularSeries.from_array([1.0, 2.0], 4)
+        ordered = series.as_ordered()
+        assert series.as_ordered() is ordered
+        
+        series.push(3.0)
+        assert series.as_ordered() is not ordered
+        np.testing.assert_array_equal(series.as_ordered(), [1.0, 2.0, 3.0])
 
 
 @pytest.mark.parametrize("strategy_class,expected_name", [
@@ -275,6 +542,24 @@ def test_strategy_names(strategy_class, expected_name):
     assert strategy.name == expected_name
 
 
+def test_generate_signals_parallel_matches_serial(sample_market_data):
+    """Test that the process-pool sweep returns each pair's signals in order."""
+    strategies = [TripleEMAStrategy(), StochRSIMACDStrategy(), TripleEMAStrategy(parameters={'fast_ema': 8})]
+    datasets = [
+        MarketData('BTCUSDT', **sample_market_data),
+        MarketData('BTCUSDT', **sample_market_data),
+        MarketData('BTCUSDT', **{k: v[200:] for k, v in sample_market_data.items()}),
+    ]
+    
+    results = generate_signals_parallel(strategies, datasets, max_workers=2)
+    
+    assert len(results) == len(strategies)
+    for strategy, data, (signals, confidence) in zip(strategies, datasets, results):
+        expected_signals, expected_confidence = strategy.generate_signals_vectorized(data)
+        np.testing.assert_array_equal(signals, expected_signals)
+        np.testing.assert_array_equal(confidence, expected_confidence)
+
+
 @pytest.mark.parametrize("strategy_class", [
     TripleEMAStrategy,
     StochRSIMACDStrategy,
@@ -285,3 +570,50 @@ def test_strategy_buffer_sizes(strategy_class):
     buffer_size = strategy.get_required_buffer_size()
     assert buffer_size > 0
     assert isinstance(buffer_size, int)
+
+
+class TestStrategyRegistry:
+    """Test cases for StrategyRegistry."""
+    
+    @pytest.fixture
+    def registry(self):
+        """Create a registry with one strategy registered."""
+        registry = StrategyRegistry()
+        registry.register("tripleEMA", TripleEMAStrategy)
+        return registry
+    
+    def test_get_strategy_returns_fresh_instances(self, registry):
+        """Test that identical lookups never share per-series state."""
+        params = {'sl_mult': 1.5, 'tp_mult': 2.0}
+        first = registry.get_strategy("tripleEMA", params)
+        second = registry.get_strategy("tripleEMA", dict(params))
+        assert first is not second
+        assert first.parameters == second.parameters
+    
+    def test_register_replaces_strategy(self, registry):
+        """Test that re-registering a name builds the new class."""
+        registry.register("tripleEMA", StochRSIMACDStrategy)
+        assert isinstance(registry.get_strategy("tripleEMA"), StochRSIMACDStrategy)
+
+
+def test_stoch_windows_matches_stoch_loop():
+    """Test that the NumPy stochastic agrees with the loop kernel, NaN gaps included."""
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.standard_normal(200))
+    high, low = close + 1.0, close - 1.0
+    low[50] = np.nan
+    
+    for expected, result in zip(stoch_loop(high, low, close, 14, 3), stoch_windows(high, low, close, 14, 3)):
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+
+def test_stoch_moving_matches_stoch_loop():
+    """Test that the bottleneck stochastic agrees with the loop kernel, NaN gaps included."""
+    pytest.importorskip("bottleneck")
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.standard_normal(200))
+    high, low = close + 1.0, close - 1.0
+    low[50] = np.nan
+    
+    for expected, result in zip(stoch_loop(high, low, close, 14, 3), stoch_moving(high, low, close, 14, 3)):
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)